@@ -0,0 +1,355 @@
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from multiprocessing.connection import Connection, wait
+from typing import Iterable, Iterator, TextIO
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from utils.dimacs import write_coloring
+from utils.graph_cache import CACHE_SUFFIX, load_graph
+
+# result "status" values
+SOLVED = "solved"
+UNSOLVED = "unsolved"
+TIMEOUT = "timeout"
+ERROR = "error"
+CRASHED = "crashed"
+
+GRAPH_PATTERNS = ("*.col", "*.col.gz", f"*{CACHE_SUFFIX}")
+
+
+@dataclass
+class BatchJob:
+    job_id: str
+    graph: str
+    num_colors: int
+    max_iteration: int = 1_000_000
+    initial_temp: float = 1.0
+    cooling_rate: float = 0.99999
+    seed: int | None = None
+    # seconds; the solver stops itself at this point, and the worker is
+    # killed if it has not answered `timeout_grace` seconds later
+    timeout: float | None = None
+    use_cache: bool = False
+    coloring_path: str | None = None
+
+
+@dataclass
+class InvalidJob:
+    # a job description that could not be read; run_batch reports it as an
+    # "error" result and carries on with the other jobs
+    job_id: str
+    error: str
+
+
+def job_from_dict(values: dict, defaults: dict | None = None) -> BatchJob:
+    merged = {**(defaults or {}), **values}
+    known = {f.name for f in fields(BatchJob)}
+    unknown = sorted(set(merged) - known)
+    if unknown:
+        raise ValueError(f"Unknown job fields: {', '.join(unknown)}.")
+    if "graph" not in merged or "num_colors" not in merged:
+        raise ValueError("Every job needs 'graph' and 'num_colors'.")
+    merged.setdefault("job_id", os.path.basename(merged["graph"]))
+    return BatchJob(**merged)
+
+
+def iter_jobs(source: str, defaults: dict | None = None) -> Iterator[BatchJob | InvalidJob]:
+    # source is a directory of graph files, a JSON list of jobs, or a JSONL
+    # stream of jobs ("-" reads JSONL from stdin, one job per line as it arrives).
+    # A job that cannot be read gives an InvalidJob instead of ending the batch.
+    if os.path.isdir(source):
+        paths = sorted({path for pattern in GRAPH_PATTERNS for path in glob.glob(os.path.join(source, pattern))})
+        for path in paths:
+            try:
+                yield job_from_dict({"graph": path}, defaults)
+            except ValueError as e:
+                yield InvalidJob(os.path.basename(path), f"{path}: {e}")
+        return
+
+    if source.endswith(".json"):
+        with open(source) as f:
+            for index, values in enumerate(json.load(f)):
+                try:
+                    yield job_from_dict(values, defaults)
+                except (TypeError, ValueError) as e:
+                    yield InvalidJob(f"{source}[{index}]", f"{source}, job {index}: {e}")
+        return
+
+    # stdin gets its own file object: run_batch reads jobs on a thread, and a
+    # worker forked while that thread blocks inside sys.stdin would deadlock
+    # closing its inherited copy of sys.stdin
+    f = open(sys.stdin.fileno(), closefd=False) if source == "-" else open(source)
+    try:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                job = job_from_dict(json.loads(line), defaults)
+            except (TypeError, ValueError) as e:
+                yield InvalidJob(f"{source}:{line_number}", f"{source}, line {line_number}: {e}")
+                continue
+            yield job
+    finally:
+        f.close()
+
+
+# the last graph loaded by this worker; consecutive jobs often share a graph
+_worker_graph_key: tuple[str, bool] | None = None
+_worker_graph = None
+
+
+def _solve_job(job: BatchJob) -> dict:
+    global _worker_graph_key, _worker_graph
+    if _worker_graph_key != (job.graph, job.use_cache):
+        _worker_graph = None
+        _worker_graph = load_graph(job.graph, job.use_cache)
+        _worker_graph_key = (job.graph, job.use_cache)
+    graph = _worker_graph
+
+    seed = job.seed if job.seed is not None else random.randrange(2 ** 32)
+    random.seed(seed)
+    coloring = Coloring(graph, job.num_colors)
+    coloring.randomize()
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=job.max_iteration, initial_temp=job.initial_temp,
+                            cooling_rate=job.cooling_rate, time_limit=job.timeout, record_history=False)
+    best_state = sa.run()
+
+    if job.coloring_path:
+        write_coloring(job.coloring_path, best_state, comment=f"graph {job.graph}")
+
+    stats = sa.stats()
+    if best_state.num_conflicts == 0:
+        status = SOLVED
+    elif stats.timed_out:
+        status = TIMEOUT
+    else:
+        status = UNSOLVED
+    return _result(job, status, seed=seed, conflicts=best_state.num_conflicts, stats=asdict(stats))
+
+
+def _result(job: BatchJob, status: str, **values) -> dict:
+    return {"job_id": job.job_id, "graph": job.graph, "num_colors": job.num_colors, "status": status, **values}
+
+
+def _worker_main(connection: Connection) -> None:
+    # long-lived worker: solves jobs until it receives None
+    while True:
+        job = connection.recv()
+        if job is None:
+            return
+        try:
+            result = _solve_job(job)
+        except Exception as e:
+            result = _result(job, ERROR, error=f"{type(e).__name__}: {e}")
+        connection.send(result)
+
+
+class _Worker:
+
+    def __init__(self):
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker_main, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.job: BatchJob | None = None
+        self.started_at = 0.0
+
+    def submit(self, job: BatchJob) -> None:
+        self.job = job
+        self.started_at = time.monotonic()
+        self.connection.send(job)
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def close(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class _JobFeeder:
+    # reads jobs on a daemon thread and hands them over a pipe, so run_batch can
+    # wait on new jobs and on its workers at once; reading a job source that
+    # blocks (stdin in queue mode) then never holds up results or timeouts
+
+    def __init__(self, jobs: Iterable[BatchJob | InvalidJob]):
+        self.connection, self._sender = multiprocessing.Pipe(duplex=False)
+        self._thread = threading.Thread(target=self._run, args=(jobs,), name="batch-job-feeder", daemon=True)
+        self._thread.start()
+
+    def _run(self, jobs: Iterable[BatchJob | InvalidJob]) -> None:
+        try:
+            try:
+                for job in jobs:
+                    self._sender.send(("job", job))
+            except Exception as e:
+                self._sender.send(("error", e))
+                return
+            self._sender.send(("end", None))
+        except OSError:
+            # run_batch has returned and closed its end
+            pass
+        finally:
+            self._sender.close()
+
+    def next_job(self) -> BatchJob | InvalidJob | None:
+        # the next job once connection is ready; None after the last one
+        kind, value = self.connection.recv()
+        if kind == "error":
+            raise value
+        return value
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def run_batch(
+    jobs: Iterable[BatchJob | InvalidJob],
+    max_workers: int | None = None,
+    timeout_grace: float = 5.0
+) -> Iterator[dict]:
+    # yields one result dict per job, in completion order. An InvalidJob or a
+    # job that raises gives an "error" result; a worker that dies or overruns its timeout is
+    # replaced, and its job gives a "crashed" or "timeout" result.
+    max_workers = max_workers or os.cpu_count() or 1
+    feeder = _JobFeeder(jobs)
+    idle = [_Worker() for _ in range(max_workers)]
+    busy: list[_Worker] = []
+    jobs_left = True
+
+    try:
+        while True:
+            while idle and jobs_left and feeder.connection.poll():
+                job = feeder.next_job()
+                if job is None:
+                    jobs_left = False
+                    break
+                if isinstance(job, InvalidJob):
+                    yield {"job_id": job.job_id, "graph": None, "num_colors": None, "status": ERROR,
+                           "error": job.error}
+                    continue
+                worker = idle.pop()
+                worker.submit(job)
+                busy.append(worker)
+            if not busy and not jobs_left:
+                return
+
+            waiting_on = [w.connection for w in busy] + [w.process.sentinel for w in busy]
+            if idle and jobs_left:
+                waiting_on.append(feeder.connection)
+            ready = wait(waiting_on, timeout=_time_to_next_deadline(busy, timeout_grace))
+            now = time.monotonic()
+            for worker in list(busy):
+                replace_worker = False
+                if worker.connection in ready or worker.process.sentinel in ready:
+                    try:
+                        result = worker.connection.recv()
+                    except (EOFError, OSError):
+                        worker.process.join()
+                        result = _result(worker.job, CRASHED,
+                                         error=f"worker exited with code {worker.process.exitcode}")
+                        replace_worker = True
+                elif worker.job.timeout is not None and now - worker.started_at > worker.job.timeout + timeout_grace:
+                    result = _result(worker.job, TIMEOUT, error="worker killed after exceeding its timeout")
+                    replace_worker = True
+                else:
+                    continue
+
+                busy.remove(worker)
+                if replace_worker:
+                    worker.kill()
+                    worker = _Worker()
+                else:
+                    worker.job = None
+                idle.append(worker)
+                yield result
+    finally:
+        feeder.close()
+        for worker in busy:
+            worker.kill()
+        for worker in idle:
+            worker.close()
+
+
+def _time_to_next_deadline(busy: list[_Worker], timeout_grace: float) -> float | None:
+    deadlines = [
+        worker.started_at + worker.job.timeout + timeout_grace
+        for worker in busy
+        if worker.job.timeout is not None
+    ]
+    if not deadlines:
+        return None
+    return max(0.0, min(deadlines) - time.monotonic())
+
+
+def write_results(results: Iterable[dict], out: TextIO) -> int:
+    # streams results as JSONL; returns how many jobs were not solved
+    not_solved = 0
+    for result in results:
+        out.write(json.dumps(result) + "\n")
+        out.flush()
+        if result["status"] != SOLVED:
+            not_solved += 1
+    return not_solved
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Solve many graphs in parallel with simulated annealing.")
+    parser.add_argument("source", help="directory of graph files, .json job list, .jsonl job file or '-' for stdin")
+    parser.add_argument("-k", "--colors", type=int, help="number of colors for jobs that do not set num_colors")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, help="per-job time limit in seconds")
+    parser.add_argument("--timeout-grace", type=float, default=5.0,
+                        help="extra seconds before a job over its time limit is killed")
+    parser.add_argument("--max-iteration", type=int)
+    parser.add_argument("--initial-temp", type=float)
+    parser.add_argument("--cooling-rate", type=float)
+    parser.add_argument("--cache", action="store_true", help="keep binary caches next to DIMACS files")
+    parser.add_argument("--output", default="-", help="where to write JSONL results ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    # command-line values are defaults; fields set in a job take precedence
+    defaults = {
+        name: value for name, value in (
+            ("num_colors", args.colors),
+            ("timeout", args.timeout),
+            ("max_iteration", args.max_iteration),
+            ("initial_temp", args.initial_temp),
+            ("cooling_rate", args.cooling_rate),
+            ("use_cache", args.cache or None),
+        ) if value is not None
+    }
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        results = run_batch(iter_jobs(args.source, defaults), args.workers, args.timeout_grace)
+        not_solved = write_results(results, out)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0 if not_solved == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import numpy as np
+
+from algorithms.cooling_schedules import STOP_TEMP
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+
+
+class BatchedSimulatedAnnealing:
+    # advances num_chains independent SA chains in lockstep, all of them moving in
+    # one batch of array ops. Each chain recolors a uniformly random vertex, with
+    # Metropolis acceptance and geometric cooling: the rules of
+    # SimulatedAnnealing(..., neighborhood="random"), which is the scalar engine to
+    # compare against (its default neighborhood only picks conflicting vertices).
+
+    def __init__(
+        self,
+        graph: Graph | CSRGraph,
+        num_colors: int,
+        num_chains: int,
+        max_iteration: int,
+        initial_temp: float,
+        cooling_rate: float,
+        seed: int | None = None
+    ):
+        if num_chains < 1:
+            raise ValueError("Number of chains must be >= 1.")
+
+        self._graph = graph
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+        self._offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+        self._neighbors = np.frombuffer(csr.neighbor_array, dtype=np.int32)
+        self._degrees = np.diff(self._offsets)
+        self._edge_sources = np.repeat(np.arange(csr.vertex_count), self._degrees)
+
+        self._num_colors = num_colors
+        self._num_chains = num_chains
+        self._max_iteration = max_iteration
+        self._cooling_rate = cooling_rate
+        self._rng = np.random.default_rng(seed)
+        self._chains = np.arange(num_chains)
+
+        self.colors = self._rng.integers(
+            0, num_colors, size=(num_chains, csr.vertex_count), dtype=np.int32
+        )
+        self.temps = np.full(num_chains, initial_temp, dtype=np.float64)
+        self.conflicts = self._count_conflicts(self.colors)
+        self.best_colors = self.colors.copy()
+        self.best_conflicts = self.conflicts.copy()
+        self.iteration: int = 0
+
+    @property
+    def num_chains(self) -> int:
+        return self._num_chains
+
+    def run(self) -> Coloring:
+        while not self.step():
+            pass
+        return self.best_state()
+
+    def best_state(self) -> Coloring:
+        best_chain = int(np.argmin(self.best_conflicts))
+        coloring = Coloring(self._graph, self._num_colors)
+        coloring.set_colors(self.best_colors[best_chain].tolist())
+        return coloring
+
+    def step(self) -> bool:
+        # like SimulatedAnnealing, stop as soon as a valid coloring is found
+        if (self.conflicts == 0).any():
+            return True
+        if self.iteration >= self._max_iteration or self.temps.max() < STOP_TEMP:
+            return True
+
+        if self._num_colors > 1 and self.colors.shape[1] > 0:
+            vertices, new_colors, deltas = self._propose_moves()
+
+            # Metropolis rule: exp(-delta / T) is >= 1 for non-worsening moves
+            probabilities = np.exp(-np.maximum(deltas, 0) / self.temps)
+            accepted = self._rng.random(self._num_chains) < probabilities
+
+            chains = self._chains[accepted]
+            self.colors[chains, vertices[accepted]] = new_colors[accepted]
+            self.conflicts[accepted] += deltas[accepted]
+
+            improved = self.conflicts < self.best_conflicts
+            if improved.any():
+                self.best_colors[improved] = self.colors[improved]
+                self.best_conflicts[improved] = self.conflicts[improved]
+
+        self.temps *= self._cooling_rate
+        self.iteration += 1
+
+        return False
+
+    def _propose_moves(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        vertices = self._rng.integers(0, self.colors.shape[1], size=self._num_chains)
+        current_colors = self.colors[self._chains, vertices]
+
+        # uniform over the other num_colors - 1 colors
+        new_colors = self._rng.integers(0, self._num_colors - 1, size=self._num_chains, dtype=np.int32)
+        new_colors += new_colors >= current_colors
+
+        # gather every chain's neighbor colors in one flat pass over the CSR rows
+        degrees = self._degrees[vertices]
+        owners = np.repeat(self._chains, degrees)
+        row_starts = np.repeat(self._offsets[vertices] - (np.cumsum(degrees) - degrees), degrees)
+        neighbors = self._neighbors[np.arange(degrees.sum()) + row_starts]
+        neighbor_colors = self.colors[owners, neighbors]
+
+        changes = (neighbor_colors == new_colors[owners]).astype(np.int64) \
+            - (neighbor_colors == current_colors[owners])
+        deltas = np.bincount(owners, weights=changes, minlength=self._num_chains).astype(np.int64)
+        return vertices, new_colors, deltas
+
+    def _count_conflicts(self, colors: np.ndarray) -> np.ndarray:
+        same = colors[:, self._edge_sources] == colors[:, self._neighbors]
+        return same.sum(axis=1, dtype=np.int64) // 2
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+import zlib
+from array import array
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+
+# checkpoint file: zlib-compressed pickle of
+#   {"version", "graph": digest of the CSR arrays, "solver": SimulatedAnnealing.checkpoint_state()}
+# checkpoints are pickles: only resume from files you wrote yourself
+CHECKPOINT_VERSION = 2
+
+
+def _graph_signature(graph: Graph | CSRGraph) -> str:
+    # digest of the graph's CSR form, so a Graph and its CSRGraph match while
+    # any other graph (even one with the same vertex and edge counts) does not
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph(graph)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_as_bytes(graph.offsets, "q"))
+    digest.update(_as_bytes(graph.neighbor_array, "i"))
+    return digest.hexdigest()
+
+
+def _as_bytes(values: memoryview, typecode: str) -> memoryview:
+    # same bytes whatever integer type the arrays were built with
+    if values.format == typecode:
+        return values.cast("B")
+    return memoryview(array(typecode, values)).cast("B")
+
+
+def save_checkpoint(path: str, sa: SimulatedAnnealing) -> None:
+    data = zlib.compress(pickle.dumps({
+        "version": CHECKPOINT_VERSION,
+        "graph": _graph_signature(sa.current_state.graph),
+        "solver": sa.checkpoint_state(),
+    }, protocol=pickle.HIGHEST_PROTOCOL))
+
+    # write to a temporary file and rename, so a crash mid-write never
+    # replaces the last good checkpoint with a partial one
+    temp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def load_checkpoint(path: str) -> dict:
+    with open(path, "rb") as f:
+        try:
+            checkpoint = pickle.loads(zlib.decompress(f.read()))
+        except (zlib.error, pickle.UnpicklingError, EOFError) as e:
+            raise ValueError(f"{path} is not a readable checkpoint file.") from e
+    if not isinstance(checkpoint, dict) or checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} has an unsupported checkpoint format.")
+    return checkpoint
+
+
+def resume(path: str, graph: Graph | CSRGraph) -> SimulatedAnnealing:
+    # the graph is not stored in the checkpoint; pass the one the run was started on
+    checkpoint = load_checkpoint(path)
+    if checkpoint["graph"] != _graph_signature(graph):
+        raise ValueError("Checkpoint was written for a different graph.")
+    return SimulatedAnnealing.from_checkpoint_state(graph, checkpoint["solver"])
+
+
+class Checkpointer:
+    # saves a solver to `path` at most once every `interval` seconds
+
+    def __init__(self, path: str, interval: float = 60.0):
+        if interval < 0:
+            raise ValueError("Checkpoint interval must be >= 0.")
+        self._path = path
+        self._interval = interval
+        self._last_saved_at = time.monotonic()
+        self.saves: int = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def save(self, sa: SimulatedAnnealing) -> None:
+        save_checkpoint(self._path, sa)
+        self._last_saved_at = time.monotonic()
+        self.saves += 1
+
+    def maybe_save(self, sa: SimulatedAnnealing) -> bool:
+        if time.monotonic() - self._last_saved_at < self._interval:
+            return False
+        self.save(sa)
+        return True
+
+
+def run_with_checkpoints(
+    sa: SimulatedAnnealing,
+    checkpointer: Checkpointer,
+    stop_event: threading.Event | None = None
+) -> Coloring:
+    # like sa.run(), but checkpoints periodically and once more when the run
+    # ends or is stopped (e.g. by a signal handler setting stop_event on preemption)
+    check_interval = SimulatedAnnealing.STOP_CHECK_INTERVAL
+    while not sa.step():
+        if sa.iteration % check_interval == 0:
+            if stop_event is not None and stop_event.is_set():
+                sa.finish()
+                break
+            checkpointer.maybe_save(sa)
+
+    checkpointer.save(sa)
+    return sa.best_state
@@ -0,0 +1,143 @@
+import threading
+import time
+from dataclasses import dataclass, field
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+
+
+@dataclass
+class LevelStats:
+    num_colors: int
+    solved: bool
+    iterations: int
+    elapsed: float
+
+
+@dataclass
+class ChromaticSearchResult:
+    num_colors: int
+    coloring: Coloring
+    levels: list[LevelStats] = field(default_factory=list)
+
+
+def greedy_coloring(graph: Graph | CSRGraph) -> list[int]:
+    # largest-degree-first greedy coloring; always valid, gives the starting upper bound
+    order = sorted(range(graph.vertex_count), key=lambda v: -len(graph.neighbors(v)))
+    colors = [-1] * graph.vertex_count
+    for v in order:
+        used = {colors[n] for n in graph.neighbors(v)}
+        color = 0
+        while color in used:
+            color += 1
+        colors[v] = color
+    return colors
+
+
+def remap_coloring(coloring: Coloring, num_colors: int) -> Coloring:
+    # warm start for num_colors = coloring.num_colors - 1: drop the smallest color
+    # class, shift the colors above it down, and give each dropped vertex the color
+    # that conflicts least with what is already placed
+    if num_colors != coloring.num_colors - 1 or num_colors < 1:
+        raise ValueError("Can only remap to one color fewer.")
+
+    colors = coloring.get_colors()
+    class_sizes = [0] * coloring.num_colors
+    for color in colors:
+        class_sizes[color] += 1
+    dropped = class_sizes.index(min(class_sizes))
+
+    dropped_vertices = []
+    for v, color in enumerate(colors):
+        if color == dropped:
+            dropped_vertices.append(v)
+            colors[v] = 0
+        elif color > dropped:
+            colors[v] = color - 1
+
+    remapped = Coloring(coloring.graph, num_colors)
+    remapped.set_colors(colors)
+
+    for v in dropped_vertices:
+        counts = remapped.neighbor_color_counts(v)
+        remapped.set_color(v, counts.index(min(counts)))
+    return remapped
+
+
+def find_chromatic_number(
+    graph: Graph | CSRGraph,
+    max_iteration: int,
+    initial_temp: float,
+    cooling_rate: float,
+    upper_bound: int | None = None,
+    time_budget: float | None = None,
+    iteration_budget: int | None = None
+) -> ChromaticSearchResult:
+    greedy_colors = greedy_coloring(graph)
+    greedy = Coloring(graph, max(greedy_colors, default=0) + 1)
+    greedy.set_colors(greedy_colors)
+    result = ChromaticSearchResult(num_colors=greedy.num_colors, coloring=greedy)
+
+    # a tighter caller-supplied bound skips the levels above it; the greedy
+    # coloring is remapped down to warm-start the first level searched
+    warm = greedy
+    while upper_bound is not None and warm.num_colors > max(upper_bound + 1, 2):
+        warm = remap_coloring(warm, warm.num_colors - 1)
+
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    iterations_left = iteration_budget
+
+    while warm.num_colors > 1:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if iterations_left is not None and iterations_left <= 0:
+            break
+
+        num_colors = warm.num_colors - 1
+        start = remap_coloring(warm, num_colors)
+        level_iterations = max_iteration if iterations_left is None \
+            else min(max_iteration, iterations_left)
+
+        started = time.perf_counter()
+        sa = SimulatedAnnealing(
+            graph=graph,
+            coloring_state=start,
+            max_iteration=level_iterations,
+            initial_temp=initial_temp,
+            cooling_rate=cooling_rate,
+            record_history=False
+        )
+        level_best = _run_until(sa, deadline)
+        solved = level_best.num_conflicts == 0
+
+        result.levels.append(LevelStats(
+            num_colors=num_colors,
+            solved=solved,
+            iterations=sa.iteration,
+            elapsed=time.perf_counter() - started
+        ))
+        if iterations_left is not None:
+            iterations_left -= sa.iteration
+
+        if not solved:
+            break
+        warm = level_best
+        result.num_colors = num_colors
+        result.coloring = level_best
+
+    return result
+
+
+def _run_until(sa: SimulatedAnnealing, deadline: float | None) -> Coloring:
+    if deadline is None:
+        return sa.run()
+
+    stop_event = threading.Event()
+    timer = threading.Timer(max(deadline - time.perf_counter(), 0), stop_event.set)
+    timer.start()
+    try:
+        return sa.run(stop_event=stop_event)
+    finally:
+        timer.cancel()
@@ -0,0 +1,179 @@
+import math
+from abc import ABC, abstractmethod
+
+# SimulatedAnnealing stops once the temperature drops below this
+STOP_TEMP = 0.001
+
+
+class CoolingSchedule(ABC):
+    # SimulatedAnnealing calls reset() once with its initial temperature, then
+    # next_temp() after every iteration with whether the move was accepted and
+    # whether it produced a new best state
+
+    def reset(self, initial_temp: float) -> None:
+        self._initial_temp = initial_temp
+
+    @abstractmethod
+    def next_temp(self, temp: float, iteration: int, accepted: bool, improved: bool) -> float:
+        ...
+
+
+class GeometricCooling(CoolingSchedule):
+
+    def __init__(self, cooling_rate: float):
+        if not (0 < cooling_rate <= 1):
+            raise ValueError("Cooling rate must be in (0, 1].")
+        self._cooling_rate = cooling_rate
+
+    def next_temp(self, temp: float, iteration: int, accepted: bool, improved: bool) -> float:
+        return self._cooling_rate * temp
+
+
+class LinearCooling(CoolingSchedule):
+
+    def __init__(self, decrement: float):
+        if decrement <= 0:
+            raise ValueError("Decrement must be > 0.")
+        self._decrement = decrement
+
+    def next_temp(self, temp: float, iteration: int, accepted: bool, improved: bool) -> float:
+        return max(temp - self._decrement, 0.0)
+
+
+class LogarithmicCooling(CoolingSchedule):
+    # T_k = T_0 / (1 + alpha * ln(1 + k))
+
+    def __init__(self, alpha: float = 1.0):
+        if alpha <= 0:
+            raise ValueError("Alpha must be > 0.")
+        self._alpha = alpha
+        self._steps = 0
+
+    def reset(self, initial_temp: float) -> None:
+        super().reset(initial_temp)
+        self._steps = 0
+
+    def next_temp(self, temp: float, iteration: int, accepted: bool, improved: bool) -> float:
+        # k counts steps since reset(), so a reheat restarts the curve
+        self._steps += 1
+        return self._initial_temp / (1 + self._alpha * math.log(1 + self._steps))
+
+
+class LundyMeesCooling(CoolingSchedule):
+    # T_{k+1} = T_k / (1 + beta * T_k)
+
+    def __init__(self, beta: float):
+        if beta <= 0:
+            raise ValueError("Beta must be > 0.")
+        self._beta = beta
+
+    def next_temp(self, temp: float, iteration: int, accepted: bool, improved: bool) -> float:
+        return temp / (1 + self._beta * temp)
+
+
+class AdaptiveCooling(CoolingSchedule):
+    # geometric cooling whose rate follows the acceptance rate of the last `window`
+    # moves: cool fast while most moves are accepted, slowly once few are
+
+    def __init__(
+        self,
+        fast_rate: float = 0.95,
+        slow_rate: float = 0.999,
+        high_acceptance: float = 0.6,
+        low_acceptance: float = 0.1,
+        window: int = 100
+    ):
+        if not (0 < fast_rate <= slow_rate <= 1):
+            raise ValueError("Rates must satisfy 0 < fast_rate <= slow_rate <= 1.")
+        if not (0 <= low_acceptance <= high_acceptance <= 1):
+            raise ValueError("Acceptance bounds must satisfy 0 <= low <= high <= 1.")
+        if window < 1:
+            raise ValueError("Window must be >= 1.")
+
+        self._fast_rate = fast_rate
+        self._slow_rate = slow_rate
+        self._normal_rate = (fast_rate + slow_rate) / 2
+        self._high_acceptance = high_acceptance
+        self._low_acceptance = low_acceptance
+        self._window = window
+        self._accepted_in_window = 0
+        self._moves_in_window = 0
+        self._cooling_rate = self._normal_rate
+
+    @property
+    def cooling_rate(self) -> float:
+        return self._cooling_rate
+
+    def reset(self, initial_temp: float) -> None:
+        super().reset(initial_temp)
+        self._accepted_in_window = 0
+        self._moves_in_window = 0
+        self._cooling_rate = self._normal_rate
+
+    def next_temp(self, temp: float, iteration: int, accepted: bool, improved: bool) -> float:
+        self._moves_in_window += 1
+        if accepted:
+            self._accepted_in_window += 1
+
+        if self._moves_in_window == self._window:
+            acceptance_rate = self._accepted_in_window / self._window
+            if acceptance_rate > self._high_acceptance:
+                self._cooling_rate = self._fast_rate
+            elif acceptance_rate < self._low_acceptance:
+                self._cooling_rate = self._slow_rate
+            else:
+                self._cooling_rate = self._normal_rate
+            self._accepted_in_window = 0
+            self._moves_in_window = 0
+
+        return self._cooling_rate * temp
+
+
+class StagnationReheating(CoolingSchedule):
+    # wraps another schedule; reheats when no new best state was found for
+    # `patience` iterations, or before the temperature drops below `min_temp`
+    # (which would otherwise end the run)
+
+    def __init__(
+        self,
+        schedule: CoolingSchedule,
+        patience: int,
+        reheat_fraction: float = 0.5,
+        min_temp: float = 0.01
+    ):
+        if patience < 1:
+            raise ValueError("Patience must be >= 1.")
+        if not (0 < reheat_fraction <= 1):
+            raise ValueError("Reheat fraction must be in (0, 1].")
+        if min_temp < STOP_TEMP:
+            # below STOP_TEMP the solver would stop before this could reheat
+            raise ValueError(f"Minimum temperature must be >= {STOP_TEMP}.")
+
+        self._schedule = schedule
+        self._patience = patience
+        self._reheat_fraction = reheat_fraction
+        self._min_temp = min_temp
+        self._since_improvement = 0
+        self.reheats: int = 0
+
+    def reset(self, initial_temp: float) -> None:
+        super().reset(initial_temp)
+        self._schedule.reset(initial_temp)
+        self._since_improvement = 0
+        self.reheats = 0
+
+    def next_temp(self, temp: float, iteration: int, accepted: bool, improved: bool) -> float:
+        if improved:
+            self._since_improvement = 0
+        else:
+            self._since_improvement += 1
+
+        next_temp = self._schedule.next_temp(temp, iteration, accepted, improved)
+        if self._since_improvement >= self._patience or next_temp < self._min_temp:
+            self._since_improvement = 0
+            self.reheats += 1
+            # restart the wrapped schedule from the reheated temperature
+            reheat_temp = max(self._initial_temp * self._reheat_fraction, self._min_temp)
+            self._schedule.reset(reheat_temp)
+            return reheat_temp
+        return next_temp
@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import random
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+
+
+@dataclass
+class RunStats:
+    run_index: int
+    seed: int
+    # None for a run that was cancelled before it started
+    num_conflicts: int | None
+    iterations: int
+    elapsed: float
+    cancelled: bool
+
+
+@dataclass
+class MultiStartResult:
+    best_state: Coloring
+    best_run: int
+    runs: list[RunStats]
+
+
+# per-worker state, set once by the pool initializer
+_worker_graph: Graph | CSRGraph | None = None
+_worker_stop_event = None
+
+
+def _init_worker(graph: Graph | CSRGraph, stop_event) -> None:
+    global _worker_graph, _worker_stop_event
+    _worker_graph = graph
+    _worker_stop_event = stop_event
+
+
+def _solve_once(
+    run_index: int,
+    seed: int,
+    num_colors: int,
+    max_iteration: int,
+    initial_temp: float,
+    cooling_rate: float
+) -> tuple[RunStats, array]:
+    started = time.perf_counter()
+    random.seed(seed)
+
+    coloring = Coloring(_worker_graph, num_colors)
+    coloring.randomize()
+
+    sa = SimulatedAnnealing(
+        graph=_worker_graph,
+        coloring_state=coloring,
+        max_iteration=max_iteration,
+        initial_temp=initial_temp,
+        cooling_rate=cooling_rate,
+        record_history=False
+    )
+    best_state = sa.run(stop_event=_worker_stop_event)
+
+    stats = RunStats(
+        run_index=run_index,
+        seed=seed,
+        num_conflicts=best_state.num_conflicts,
+        iterations=sa.iteration,
+        elapsed=time.perf_counter() - started,
+        cancelled=best_state.num_conflicts > 0 and _worker_stop_event.is_set()
+    )
+    return stats, array("i", best_state.get_colors())
+
+
+def solve_many(
+    graph: Graph | CSRGraph,
+    num_colors: int,
+    num_runs: int,
+    max_iteration: int,
+    initial_temp: float,
+    cooling_rate: float,
+    seed: int | None = None,
+    max_workers: int | None = None
+) -> MultiStartResult:
+    if num_runs < 1:
+        raise ValueError("Number of runs must be >= 1.")
+
+    seed_rng = random.Random(seed)
+    run_seeds = [seed_rng.randrange(2 ** 63) for _ in range(num_runs)]
+    max_workers = max_workers or min(num_runs, os.cpu_count() or 1)
+    stop_event = multiprocessing.Event()
+
+    runs: list[RunStats] = []
+    best_colors = None
+    best_stats = None
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(graph, stop_event)
+    ) as executor:
+        submitted = {
+            executor.submit(
+                _solve_once,
+                run_index,
+                run_seed,
+                num_colors,
+                max_iteration,
+                initial_temp,
+                cooling_rate
+            ): (run_index, run_seed)
+            for run_index, run_seed in enumerate(run_seeds)
+        }
+        pending = set(submitted)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.cancelled():
+                    # never started; still reported, so every seed has an entry
+                    run_index, run_seed = submitted[future]
+                    runs.append(RunStats(run_index=run_index, seed=run_seed, num_conflicts=None,
+                                         iterations=0, elapsed=0.0, cancelled=True))
+                    continue
+                stats, colors = future.result()
+                runs.append(stats)
+                if best_stats is None or stats.num_conflicts < best_stats.num_conflicts:
+                    best_stats = stats
+                    best_colors = colors
+
+            if best_stats.num_conflicts == 0 and not stop_event.is_set():
+                # a valid coloring is known: drop queued runs and stop running ones
+                stop_event.set()
+                for future in pending:
+                    future.cancel()
+
+    best_state = Coloring(graph, num_colors)
+    best_state.set_colors(best_colors)
+    runs.sort(key=lambda run: run.run_index)
+    return MultiStartResult(best_state=best_state, best_run=best_stats.run_index, runs=runs)
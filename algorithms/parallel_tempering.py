@@ -0,0 +1,175 @@
+import math
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.cooling_schedules import STOP_TEMP
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+
+
+# graph shared by every task of a worker process, set once by the pool initializer
+_worker_graph: Graph | CSRGraph | None = None
+
+
+def _init_worker(graph: Graph | CSRGraph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _run_chain_segment(
+    colors: array,
+    num_colors: int,
+    temp: float,
+    steps: int,
+    seed: int
+) -> tuple[array, int, array, int]:
+    random.seed(seed)
+
+    coloring = Coloring(_worker_graph, num_colors)
+    coloring.set_colors(colors)
+
+    # a cooling rate of 1 keeps the chain at its rung's temperature
+    sa = SimulatedAnnealing(
+        graph=_worker_graph,
+        coloring_state=coloring,
+        max_iteration=steps,
+        initial_temp=temp,
+        cooling_rate=1.0,
+        record_history=False
+    )
+    best_state = sa.run()
+
+    return (
+        array("i", sa.current_state.get_colors()),
+        sa.current_state.num_conflicts,
+        array("i", best_state.get_colors()),
+        best_state.num_conflicts
+    )
+
+
+def geometric_ladder(min_temp: float, max_temp: float, num_replicas: int) -> list[float]:
+    if num_replicas < 1:
+        raise ValueError("Number of replicas must be >= 1.")
+    if num_replicas == 1:
+        return [min_temp]
+
+    ratio = (max_temp / min_temp) ** (1 / (num_replicas - 1))
+    return [min_temp * ratio ** i for i in range(num_replicas)]
+
+
+class ParallelTempering:
+
+    def __init__(
+        self,
+        graph: Graph | CSRGraph,
+        num_colors: int,
+        temperatures: list[float],
+        max_rounds: int,
+        steps_per_round: int,
+        max_workers: int | None = None,
+        seed: int | None = None
+    ):
+        if not temperatures:
+            raise ValueError("At least one temperature is required.")
+        if min(temperatures) < STOP_TEMP:
+            raise ValueError(f"Temperatures must be >= {STOP_TEMP}.")
+
+        self._graph = graph
+        self._num_colors = num_colors
+        self._temperatures = sorted(temperatures)
+        self._max_rounds = max_rounds
+        self._steps_per_round = steps_per_round
+        self._max_workers = max_workers or min(len(self._temperatures), os.cpu_count() or 1)
+        self._rng = random.Random(seed)
+
+        # replica i always runs at self._temperatures[i]; swaps exchange states
+        self.replica_colors: list[array] = []
+        self.replica_conflicts: list[int] = []
+        self.best_state: Coloring | None = None
+        self.round: int = 0
+        self.swap_attempts: int = 0
+        self.swap_accepts: int = 0
+
+    @property
+    def temperatures(self) -> list[float]:
+        return self._temperatures.copy()
+
+    def run(self) -> Coloring:
+        self._init_replicas()
+
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_init_worker,
+            initargs=(self._graph,)
+        ) as executor:
+            while self.round < self._max_rounds and self.best_state.num_conflicts > 0:
+                self._run_round(executor)
+                self._exchange_replicas()
+                self.round += 1
+
+        return self.best_state
+
+    def _init_replicas(self) -> None:
+        self.replica_colors = []
+        self.replica_conflicts = []
+        self.best_state = None
+
+        for _ in self._temperatures:
+            coloring = Coloring(self._graph, self._num_colors)
+            coloring.set_colors(
+                self._rng.randint(0, self._num_colors - 1)
+                for _ in range(self._graph.vertex_count)
+            )
+            self.replica_colors.append(array("i", coloring.get_colors()))
+            self.replica_conflicts.append(coloring.num_conflicts)
+            self._update_best(coloring.get_colors(), coloring.num_conflicts)
+
+    def _run_round(self, executor: ProcessPoolExecutor) -> None:
+        futures = [
+            executor.submit(
+                _run_chain_segment,
+                colors,
+                self._num_colors,
+                temp,
+                self._steps_per_round,
+                self._rng.randrange(2 ** 63)
+            )
+            for colors, temp in zip(self.replica_colors, self._temperatures)
+        ]
+
+        for i, future in enumerate(futures):
+            colors, conflicts, best_colors, best_conflicts = future.result()
+            self.replica_colors[i] = colors
+            self.replica_conflicts[i] = conflicts
+            self._update_best(best_colors, best_conflicts)
+
+    def _exchange_replicas(self) -> None:
+        # alternate even and odd neighbor pairs so every pair gets a chance to swap
+        for i in range(self.round % 2, len(self._temperatures) - 1, 2):
+            self.swap_attempts += 1
+            if self._accept_swap(i, i + 1):
+                self.swap_accepts += 1
+                self.replica_colors[i], self.replica_colors[i + 1] = \
+                    self.replica_colors[i + 1], self.replica_colors[i]
+                self.replica_conflicts[i], self.replica_conflicts[i + 1] = \
+                    self.replica_conflicts[i + 1], self.replica_conflicts[i]
+
+    def _accept_swap(self, colder: int, hotter: int) -> bool:
+        beta_delta = 1 / self._temperatures[colder] - 1 / self._temperatures[hotter]
+        conflict_delta = self.replica_conflicts[colder] - self.replica_conflicts[hotter]
+        exponent = beta_delta * conflict_delta
+        if exponent >= 0:
+            return True
+        return math.exp(exponent) > self._rng.random()
+
+    def _update_best(self, colors, num_conflicts: int) -> None:
+        if self.best_state is not None and num_conflicts >= self.best_state.num_conflicts:
+            return
+
+        best_state = Coloring(self._graph, self._num_colors)
+        best_state.set_colors(colors)
+        self.best_state = best_state
@@ -1,83 +1,315 @@
 import math
 import random
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+
+from algorithms.cooling_schedules import STOP_TEMP, CoolingSchedule, GeometricCooling
 from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
 from models.graph import Graph
+from utils.history import HistoryRecorder
+from utils.instrumentation import InstrumentationReport, SolverInstrumentation
+
+
+@dataclass
+class SolverStats:
+    iterations: int
+    accepted_moves: int
+    rejected_moves: int
+    elapsed: float
+    iterations_per_sec: float
+    best_conflicts: int
+    best_iteration: int
+    time_to_best: float
+    timed_out: bool
+
+
+# move neighborhoods: "conflict" recolors a random conflicting vertex, "random"
+# any random vertex (the rule of BatchedSimulatedAnnealing)
+NEIGHBORHOODS = ("conflict", "random")
 
 
 class SimulatedAnnealing:
 
+    # how many iterations run() performs between checks of its stop event
+    STOP_CHECK_INTERVAL = 256
+    # how many iterations step() performs between clock reads when time_limit is set
+    CLOCK_CHECK_INTERVAL = 256
+
     def __init__(
         self,
-        graph: Graph,
+        graph: Graph | CSRGraph,
         coloring_state: Coloring,
         max_iteration: int,
         initial_temp: float,
-        cooling_rate: float
+        cooling_rate: float | None = None,
+        schedule: CoolingSchedule | None = None,
+        time_limit: float | None = None,
+        history: HistoryRecorder | None = None,
+        record_history: bool = True,
+        instrumentation: SolverInstrumentation | None = None,
+        neighborhood: str = "conflict"
     ):
+        if neighborhood not in NEIGHBORHOODS:
+            raise ValueError(f"Neighborhood must be one of: {', '.join(NEIGHBORHOODS)}.")
+        if schedule is None:
+            if cooling_rate is None:
+                raise ValueError("Either cooling_rate or schedule is required.")
+            schedule = GeometricCooling(cooling_rate)
+        schedule.reset(initial_temp)
+
         self._graph = graph
         self._max_iteration = max_iteration
         self._initial_temp = initial_temp
         self._cooling_rate = cooling_rate
+        self._schedule = schedule
+        self._time_limit = time_limit
+        self._neighborhood = neighborhood
 
         self.current_state: Coloring = coloring_state
         self.best_state: Coloring = coloring_state.copy()
         self.temp: float = initial_temp
         self.iteration: int = 0
 
-        self._temperature_history: list[float] = []
-        self._conflicts_history: list[int] = []
+        # throughput bookkeeping; the clock starts at the first step()
+        self.accepted_moves: int = 0
+        self.rejected_moves: int = 0
+        self.best_iteration: int = 0
+        self.timed_out: bool = False
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._best_found_at: float | None = None
+        self._deadline: float | None = None
+
+        # record_history=False skips recording entirely (no call per step)
+        if not record_history:
+            self._history = None
+        else:
+            self._history = history if history is not None else HistoryRecorder()
+        self._record = self._history.record if self._history is not None else None
+
+        # instrumentation wraps this instance's phase methods until the run
+        # finishes; without it nothing changes
+        self._instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.attach(self)
+
+    def stats(self) -> SolverStats:
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            end = self._finished_at if self._finished_at is not None else time.perf_counter()
+            elapsed = end - self._started_at
+        time_to_best = 0.0 if self._best_found_at is None else self._best_found_at - self._started_at
+
+        return SolverStats(
+            iterations=self.iteration,
+            accepted_moves=self.accepted_moves,
+            rejected_moves=self.rejected_moves,
+            elapsed=elapsed,
+            iterations_per_sec=self.iteration / elapsed if elapsed > 0 else 0.0,
+            best_conflicts=self.best_state.num_conflicts,
+            best_iteration=self.best_iteration,
+            time_to_best=time_to_best,
+            timed_out=self.timed_out
+        )
+
+    @property
+    def history(self) -> HistoryRecorder | None:
+        return self._history
+
+    @property
+    def instrumentation(self) -> SolverInstrumentation | None:
+        return self._instrumentation
+
+    def instrumentation_report(self) -> InstrumentationReport | None:
+        if self._instrumentation is None:
+            return None
+        return self._instrumentation.report()
 
     @property
-    def temperature_history(self) -> list[float]:
-        return self._temperature_history.copy()
+    def temperature_history(self) -> memoryview:
+        if self._history is None:
+            return memoryview(b"").cast("d")
+        return self._history.temperatures
 
     @property
-    def conflicts_history(self) -> list[int]:
-        return self._conflicts_history.copy()
+    def conflicts_history(self) -> memoryview:
+        if self._history is None:
+            return memoryview(b"").cast("q")
+        return self._history.conflicts
 
+    def checkpoint_state(self) -> dict:
+        # everything needed to continue this run later except the graph itself,
+        # including the state of the module-level RNG the moves are drawn from
+        stats = self.stats()
+        return {
+            "num_colors": self.current_state.num_colors,
+            "track_color_counts": self.current_state.tracks_color_counts,
+            "colors": array("i", self.current_state.get_colors()),
+            "conflict_vertices": array("i", self.current_state.get_conflict_vertices()),
+            "best_colors": array("i", self.best_state.get_colors()),
+            "max_iteration": self._max_iteration,
+            "initial_temp": self._initial_temp,
+            "cooling_rate": self._cooling_rate,
+            "schedule": self._schedule,
+            "time_limit": self._time_limit,
+            "neighborhood": self._neighborhood,
+            "history": self._history,
+            "temp": self.temp,
+            "iteration": self.iteration,
+            "accepted_moves": self.accepted_moves,
+            "rejected_moves": self.rejected_moves,
+            "best_iteration": self.best_iteration,
+            "timed_out": self.timed_out,
+            "elapsed": stats.elapsed,
+            "time_to_best": stats.time_to_best,
+            "random_state": random.getstate(),
+        }
+
+    @classmethod
+    def from_checkpoint_state(cls, graph: Graph | CSRGraph, state: dict) -> "SimulatedAnnealing":
+        # built without __init__ so the schedule keeps its saved internal state
+        # instead of being reset
+        sa = cls.__new__(cls)
+        sa._graph = graph
+        sa._max_iteration = state["max_iteration"]
+        sa._initial_temp = state["initial_temp"]
+        sa._cooling_rate = state["cooling_rate"]
+        sa._schedule = state["schedule"]
+        sa._time_limit = state["time_limit"]
+        sa._neighborhood = state.get("neighborhood", "conflict")
+
+        sa.current_state = Coloring(graph, state["num_colors"], track_color_counts=state["track_color_counts"])
+        sa.current_state.set_colors(state["colors"])
+        sa.current_state.restore_conflict_order(state["conflict_vertices"])
+        sa.best_state = Coloring(graph, state["num_colors"], track_color_counts=state["track_color_counts"])
+        sa.best_state.set_colors(state["best_colors"])
+        sa.temp = state["temp"]
+        sa.iteration = state["iteration"]
+
+        sa.accepted_moves = state["accepted_moves"]
+        sa.rejected_moves = state["rejected_moves"]
+        sa.best_iteration = state["best_iteration"]
+        sa.timed_out = state["timed_out"]
+        # the clock continues from the elapsed time of the saved run, so
+        # stats() and time_limit span both sessions
+        now = time.perf_counter()
+        sa._started_at = now - state["elapsed"]
+        sa._finished_at = None
+        sa._best_found_at = sa._started_at + state["time_to_best"]
+        sa._deadline = None if sa._time_limit is None else sa._started_at + sa._time_limit
+
+        sa._history = state["history"]
+        sa._record = sa._history.record if sa._history is not None else None
+        sa._instrumentation = None
+
+        random.setstate(state["random_state"])
+        return sa
+
+
+    def run(self, stop_event: threading.Event | None = None) -> Coloring:
+        # stop_event may be any event-like object (threading or multiprocessing)
+        if stop_event is None:
+            while not self.step():
+                pass
+            return self.best_state
 
-    def run(self) -> Coloring:
         while not self.step():
-            pass
+            if self.iteration % self.STOP_CHECK_INTERVAL == 0 and stop_event.is_set():
+                self._finish()
+                break
         return self.best_state
 
 
+    def finish(self) -> None:
+        # ends a run that is stopped from outside the step() loop: stops the
+        # clock of stats() and removes any instrumentation
+        self._finish()
+
     def step(self) -> bool:
+        if self._started_at is None:
+            self._start_clock()
 
-        self._temperature_history.append(self.temp)
-        self._conflicts_history.append(self.current_state.num_conflicts)
+        if self._record is not None:
+            self._record(self.temp, self.current_state.num_conflicts)
 
         if self.current_state.num_conflicts == 0:
-            return True
-        if self.iteration >= self._max_iteration or self.temp < 0.001:
-            return True
+            return self._finish()
+        if self.iteration >= self._max_iteration or self.temp < STOP_TEMP:
+            return self._finish()
+        if self._deadline is not None and self.iteration % self.CLOCK_CHECK_INTERVAL == 0 \
+                and time.perf_counter() >= self._deadline:
+            self.timed_out = True
+            return self._finish()
 
-        next_state = self._create_next_state(self.current_state)
-        if next_state.num_conflicts == 0:
-            self.current_state = next_state
-            self.best_state = next_state.copy()
-            return True
+        accepted = False
+        improved = False
+        move = self._propose_move(self.current_state)
+        if move is not None:
+            vertex, color = move
+            conflict_delta = -self._evaluate_move(vertex, color)
+            next_conflicts = self.current_state.num_conflicts - conflict_delta
 
-        conflict_delta = self.current_state.num_conflicts - next_state.num_conflicts
-        if conflict_delta > 0:
-            self.current_state = next_state
-            if next_state.num_conflicts < self.best_state.num_conflicts:
-                self.best_state = next_state.copy()
-        else:
-            if self._take_risk(conflict_delta, self.temp):
-                self.current_state = next_state
+            if next_conflicts == 0:
+                self._apply_move(vertex, color)
+                self.accepted_moves += 1
+                self._record_best()
+                self.iteration += 1
+                return self._finish()
+
+            if conflict_delta > 0:
+                self._apply_move(vertex, color)
+                accepted = True
+                if next_conflicts < self.best_state.num_conflicts:
+                    self._record_best()
+                    improved = True
+            else:
+                if self._take_risk(conflict_delta, self.temp):
+                    self._apply_move(vertex, color)
+                    accepted = True
 
-        self.temp = self._calculate_temp(self.temp)
+            if accepted:
+                self.accepted_moves += 1
+            else:
+                self.rejected_moves += 1
+
+        self.temp = self._calculate_temp(self.temp, accepted, improved)
         self.iteration += 1
 
         return False
 
 
-    def _create_next_state(self, coloring_state: Coloring) -> Coloring:
-        state = coloring_state.copy()
-        #state.modify_conflict_vertex()
-        state.modify_one_vertex()
-        return state
+    def _start_clock(self) -> None:
+        self._started_at = time.perf_counter()
+        self._best_found_at = self._started_at
+        if self._time_limit is not None:
+            self._deadline = self._started_at + self._time_limit
+
+    def _finish(self) -> bool:
+        if self._finished_at is None:
+            self._finished_at = time.perf_counter()
+            if self._instrumentation is not None:
+                self._instrumentation.detach()
+        return True
+
+    def _record_best(self) -> None:
+        self.best_state = self.current_state.copy()
+        self.best_iteration = self.iteration
+        self._best_found_at = time.perf_counter()
+
+    def _propose_move(self, coloring_state: Coloring) -> tuple[int, int] | None:
+        if self._neighborhood == "random":
+            return coloring_state.propose_random_move()
+        return coloring_state.propose_conflict_move()
+
+    def _evaluate_move(self, vertex: int, color: int) -> int:
+        return self.current_state.delta_if_recolored(vertex, color)
+
+    def _apply_move(self, vertex: int, color: int) -> None:
+        self.current_state.set_color(vertex, color)
 
     def _take_risk(self, conflict_delta: int, temp: float) -> bool:
         if temp <= 0:
@@ -86,8 +318,8 @@ class SimulatedAnnealing:
         probability = math.exp(conflict_delta / temp)
         return probability > random.random()
 
-    def _calculate_temp(self, temp: float) -> float:
-        return self._cooling_rate * temp
+    def _calculate_temp(self, temp: float, accepted: bool, improved: bool) -> float:
+        return self._schedule.next_temp(temp, self.iteration, accepted, improved)
 
 
 
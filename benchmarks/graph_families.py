@@ -0,0 +1,32 @@
+from models.csr_graph import CSRGraph
+from models.generators import gnp_graph, planted_partition_graph, random_geometric_graph
+
+
+def queen_graph(size: int) -> CSRGraph:
+    edges = []
+    for r1 in range(size):
+        for c1 in range(size):
+            for r2 in range(size):
+                for c2 in range(size):
+                    if (r1, c1) >= (r2, c2):
+                        continue
+                    if r1 == r2 or c1 == c2 or abs(r1 - r2) == abs(c1 - c2):
+                        edges.append((r1 * size + c1, r2 * size + c2))
+    return CSRGraph.from_edges(size * size, edges)
+
+
+# bumped whenever a family's instances change, so results recorded on the
+# old instances are not compared with new ones (2: built by models.generators)
+FAMILIES_VERSION = 2
+
+# name -> (builder, number of colors to solve with)
+FAMILIES = {
+    "gnp_500_0.01": (lambda: gnp_graph(500, 0.01, seed=1), 4),
+    "gnp_500_0.05": (lambda: gnp_graph(500, 0.05, seed=2), 9),
+    "gnp_300_0.2": (lambda: gnp_graph(300, 0.2, seed=3), 20),
+    "geometric_1000_0.05": (lambda: random_geometric_graph(1000, 0.05, seed=4)[0], 9),
+    "queen_8": (lambda: queen_graph(8), 9),
+    "planted_1000_4": (lambda: planted_partition_graph(1000, 4, 0.006, seed=5)[0], 4),
+}
+
+QUICK_FAMILIES = ("gnp_500_0.01", "queen_8", "planted_1000_4")
@@ -0,0 +1,188 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from benchmarks.graph_families import FAMILIES, FAMILIES_VERSION, QUICK_FAMILIES
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+
+# (benchmark, metric) pairs checked against a baseline, and which of them are
+# higher-is-better; the others are lower-is-better
+COMPARED_METRICS = (
+    ("coloring_eval", "evals_per_sec"),
+    ("sa_step", "steps_per_sec"),
+    ("time_to_solution", "seconds"),
+)
+HIGHER_IS_BETTER = ("evals_per_sec", "steps_per_sec")
+
+
+def bench_coloring_eval(graph: CSRGraph, num_colors: int, num_moves: int, seed: int) -> dict:
+    random.seed(seed)
+    coloring = Coloring(graph, num_colors)
+    coloring.randomize()
+    moves = [
+        (random.randrange(graph.vertex_count), random.randrange(num_colors))
+        for _ in range(num_moves)
+    ]
+
+    started = time.perf_counter()
+    for vertex, color in moves:
+        if coloring.delta_if_recolored(vertex, color) <= 0:
+            coloring.set_color(vertex, color)
+    elapsed = time.perf_counter() - started
+
+    return {"evals_per_sec": num_moves / elapsed}
+
+
+def bench_sa_steps(graph: CSRGraph, num_colors: int, num_steps: int, seed: int) -> dict:
+    random.seed(seed)
+    coloring = Coloring(graph, num_colors)
+    coloring.randomize()
+
+    # cooling_rate=1 and no history: measure the bare step() loop
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=num_steps, initial_temp=1.0,
+                            cooling_rate=1.0, record_history=False)
+    started = time.perf_counter()
+    while not sa.step():
+        pass
+    elapsed = time.perf_counter() - started
+
+    return {"steps_per_sec": sa.iteration / elapsed}
+
+
+def bench_time_to_solution(graph: CSRGraph, num_colors: int, max_iteration: int, seed: int) -> dict:
+    random.seed(seed)
+    coloring = Coloring(graph, num_colors)
+    coloring.randomize()
+
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=max_iteration, initial_temp=1.0,
+                            cooling_rate=0.99999, record_history=False)
+    started = time.perf_counter()
+    best_state = sa.run()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "seconds": elapsed,
+        "iterations": sa.iteration,
+        "solved": best_state.num_conflicts == 0,
+        "best_conflicts": best_state.num_conflicts,
+    }
+
+
+def run_suite(quick: bool = False, seed: int = 0) -> dict:
+    names = QUICK_FAMILIES if quick else tuple(FAMILIES)
+    scale = 1 if quick else 5
+
+    results = {}
+    for name in names:
+        builder, num_colors = FAMILIES[name]
+        started = time.perf_counter()
+        graph = builder()
+        build_seconds = time.perf_counter() - started
+
+        results[name] = {
+            "vertices": graph.vertex_count,
+            "edges": graph.edge_count,
+            "num_colors": num_colors,
+            "build_seconds": build_seconds,
+            "coloring_eval": bench_coloring_eval(graph, num_colors, 20000 * scale, seed),
+            "sa_step": bench_sa_steps(graph, num_colors, 20000 * scale, seed),
+            "time_to_solution": bench_time_to_solution(graph, num_colors, 200000 * scale, seed),
+        }
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "quick": quick,
+            "seed": seed,
+            "families_version": FAMILIES_VERSION,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    # returns one message per metric that got worse than baseline by more than tolerance;
+    # results from different graph family versions are not comparable. Results
+    # written before the version was recorded are version 1.
+    current_version = current.get("meta", {}).get("families_version", 1)
+    baseline_version = baseline.get("meta", {}).get("families_version", 1)
+    if current_version != baseline_version:
+        raise ValueError(f"Baseline uses graph families version {baseline_version}, "
+                         f"these results use version {current_version}; record a new baseline.")
+    # --quick and the seed change the move counts, iteration budgets and instances
+    for key in ("quick", "seed"):
+        current_value = current.get("meta", {}).get(key)
+        baseline_value = baseline.get("meta", {}).get(key)
+        if current_value != baseline_value:
+            raise ValueError(f"Baseline was recorded with {key}={baseline_value}, "
+                             f"these results use {key}={current_value}; run with the same settings.")
+
+    regressions = []
+    for name, benches in current["results"].items():
+        baseline_benches = baseline.get("results", {}).get(name)
+        if baseline_benches is None:
+            continue
+        for bench, metric in COMPARED_METRICS:
+            old = baseline_benches.get(bench, {}).get(metric)
+            if not old:
+                continue
+            value = benches[bench][metric]
+            if metric in HIGHER_IS_BETTER:
+                change = (old - value) / old
+            else:
+                change = (value - old) / old
+            if change > tolerance:
+                regressions.append(f"{name}.{bench}.{metric}: {old:.3f} -> {value:.3f} ({change:+.0%} worse)")
+
+        old_solution = baseline_benches.get("time_to_solution", {})
+        if old_solution.get("solved") and not benches["time_to_solution"]["solved"]:
+            regressions.append(f"{name}.time_to_solution: no longer solved")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark solver throughput and solution quality.")
+    parser.add_argument("--output", default="bench_output.json", help="where to write the results JSON")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative slowdown before a metric counts as a regression")
+    parser.add_argument("--quick", action="store_true", help="run a smaller, faster subset")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results = run_suite(quick=args.quick, seed=args.seed)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    for name, benches in results["results"].items():
+        solution = benches["time_to_solution"]
+        print(
+            f"{name:22} evals/s={benches['coloring_eval']['evals_per_sec']:>10.0f} "
+            f"steps/s={benches['sa_step']['steps_per_sec']:>10.0f} "
+            f"solve={solution['seconds']:.2f}s solved={solution['solved']}"
+        )
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare(results, baseline, args.tolerance)
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import time
+from typing import Callable
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+
+
+class FrameStepper:
+    # advances a solver by as many steps as fit in one animation frame, so the
+    # solver runs at full speed while the display refreshes at `target_fps`.
+    #
+    # the solver gets whatever part of the frame the last render did not use,
+    # but never less than `min_solver_share` of it; `max_steps_per_frame` caps
+    # the steps per frame (1 gives the classic one-step-per-frame animation).
+
+    # steps between clock reads
+    CLOCK_CHECK_INTERVAL = 32
+
+    def __init__(
+        self,
+        sa: SimulatedAnnealing,
+        target_fps: float = 30.0,
+        max_steps_per_frame: int | None = None,
+        min_solver_share: float = 0.2,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        if target_fps <= 0:
+            raise ValueError("Target FPS must be > 0.")
+        if max_steps_per_frame is not None and max_steps_per_frame < 1:
+            raise ValueError("Max steps per frame must be >= 1.")
+        if not (0 < min_solver_share <= 1):
+            raise ValueError("Minimum solver share must be between 0 and 1.")
+
+        self._sa = sa
+        self._clock = clock
+        self._frame_time = 1.0 / target_fps
+        self._max_steps_per_frame = max_steps_per_frame
+        self._min_solver_time = min_solver_share * self._frame_time
+        self._render_time = 0.0
+        self.last_frame_steps: int = 0
+
+    @property
+    def frame_time(self) -> float:
+        return self._frame_time
+
+    def report_render_time(self, seconds: float) -> None:
+        self._render_time = seconds
+
+    def advance(self) -> bool:
+        # returns True once the solver has finished
+        sa = self._sa
+        limit = self._max_steps_per_frame
+        check_interval = self.CLOCK_CHECK_INTERVAL
+        clock = self._clock
+        deadline = clock() + max(self._min_solver_time, self._frame_time - self._render_time)
+
+        steps = 0
+        while True:
+            chunk = check_interval if limit is None else min(check_interval, limit - steps)
+            for _ in range(chunk):
+                steps += 1
+                if sa.step():
+                    self.last_frame_steps = steps
+                    return True
+            if (limit is not None and steps >= limit) or clock() >= deadline:
+                break
+
+        self.last_frame_steps = steps
+        return False
+
+    def next_frame_delay_ms(self, frame_started: float) -> int:
+        # delay until the next frame should start, given when this one started
+        # (a reading of the stepper's clock)
+        remaining = self._frame_time - (self._clock() - frame_started)
+        return max(1, int(remaining * 1000))
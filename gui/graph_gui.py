@@ -1,18 +1,38 @@
 import math
+import queue
 import random
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
+from typing import Callable, Iterable
 
 from matplotlib import pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+from models.generators import gnp_graph
 from models.graph import Graph
 from models.coloring_state import Coloring
 from algorithms.simulated_annealing import SimulatedAnnealing
+from gui.frame_stepper import FrameStepper
+from gui.live_plot import LiveHistoryPlot
+from gui.solver_worker import BackgroundSolver, SolverFinished, SolverProgress
+from gui.spatial_index import GridIndex
+from gui.viewport import DetailLevel, Viewport, detail_level
+from utils.history import HistoryRecorder
 
 
 class GraphGUI:
 
+    # how often the Tk thread checks the background solver for messages
+    POLL_INTERVAL_MS = 50
+    # history points kept for the plots (the history is downsampled beyond that)
+    PLOT_HISTORY_POINTS = 2048
+    # vertex radius in world units (screen pixels at zoom 1)
+    VERTEX_RADIUS = 15
+    # random graphs with more vertices get a spread-out layout fitted to the view
+    LARGE_GRAPH_VERTICES = 200
+    ZOOM_STEP = 1.2
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Graph Coloring – Simulated Annealing Visualizer")
@@ -26,13 +46,31 @@ class GraphGUI:
         self._selected_vertex: int | None = None
         self._coloring_state: Coloring | None = None
 
+        # canvas item ids (oval, label or None) per drawn vertex and line id per
+        # drawn edge (v < n), kept so runs can recolor vertices in place; only
+        # on-screen items exist
+        self._vertex_items: dict[int, tuple[int, int | None]] = {}
+        self._edge_items: dict[tuple[int, int], int] = {}
+
+        # vertex positions are world coordinates; the viewport maps them to the
+        # canvas (zoom/pan) and the grid index finds vertices near a point or on screen
+        self._viewport = Viewport()
+        self._spatial_index = GridIndex(cell_size=4 * self.VERTEX_RADIUS)
+        self._redraw_pending = False
+        self._pan_start: tuple[int, int] | None = None
+
         # SA runtime
         self._sa: SimulatedAnnealing | None = None
         self._is_sa_running: bool = False
+        self._solver: BackgroundSolver | None = None
+        # colors shown while the solver thread owns the coloring (last progress snapshot)
+        self._solver_colors: list[int] | None = None
+        self._stepper: FrameStepper | None = None
 
         # Animation options
         self.animate_var = tk.BooleanVar(value=True)     # Animate or instant
-        self.animation_delay_var = tk.IntVar(value=20)   # delay in ms
+        self.target_fps_var = tk.StringVar(value="30")    # frames per second
+        self.max_steps_per_frame_var = tk.StringVar(value="")  # empty = as many as fit
 
         # Status labels (iteration, temp, conflicts)
         self.iteration_var = tk.StringVar(value="Iteration: -")
@@ -44,10 +82,7 @@ class GraphGUI:
         self._ax_temp = None
         self._ax_conf = None
         self._plot_canvas = None
-
-        # Histories for plots
-        self._temp_history: list[float] = []
-        self._conf_history: list[int] = []
+        self._live_plot: LiveHistoryPlot | None = None
 
         # Initialize styles
         self._init_style()
@@ -55,6 +90,15 @@ class GraphGUI:
         # Build UI
         self._build_ui()
         self.canvas.bind("<Button-1>", self._on_canvas_click)
+        # zoom with the wheel (X11 reports it as buttons 4/5), pan by dragging
+        # with the right or middle button
+        self.canvas.bind("<MouseWheel>", self._on_canvas_wheel)
+        self.canvas.bind("<Button-4>", lambda event: self._zoom(self.ZOOM_STEP, event.x, event.y))
+        self.canvas.bind("<Button-5>", lambda event: self._zoom(1 / self.ZOOM_STEP, event.x, event.y))
+        for button in (2, 3):
+            self.canvas.bind(f"<ButtonPress-{button}>", self._on_pan_start)
+            self.canvas.bind(f"<B{button}-Motion>", self._on_pan_drag)
+        self.canvas.bind("<Configure>", lambda event: self._schedule_redraw())
 
         # Color palette
         self._palette = [
@@ -125,17 +169,10 @@ class GraphGUI:
         )
         self._ax_temp, self._ax_conf = axes
 
-        self._ax_temp.set_title("Temperature Over Time")
-        self._ax_temp.set_xlabel("Iteration")
-        self._ax_temp.set_ylabel("Temperature")
-
-        self._ax_conf.set_title("Conflicts Over Time")
-        self._ax_conf.set_xlabel("Iteration")
-        self._ax_conf.set_ylabel("Conflicts")
-
-        self._fig.tight_layout()
-
         self._plot_canvas = FigureCanvasTkAgg(self._fig, master=plots_frame)
+        # titles and labels are set once here; frames only blit the lines
+        self._live_plot = LiveHistoryPlot(self._plot_canvas, self._ax_temp, self._ax_conf)
+        self._fig.tight_layout()
         self._plot_canvas.draw()
         self._plot_canvas.get_tk_widget().pack(fill=tk.X, expand=False)
 
@@ -216,9 +253,20 @@ class GraphGUI:
         )
         animate_check.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 4))
 
-        ttk.Label(animation_frame, text="Animation delay (ms):").grid(row=1, column=0, sticky="w")
-        self.delay_entry = ttk.Entry(animation_frame, textvariable=self.animation_delay_var, width=8)
-        self.delay_entry.grid(row=1, column=1, sticky="we", pady=(0, 2), padx=(5, 0))
+        ttk.Label(animation_frame, text="Target FPS:").grid(row=1, column=0, sticky="w")
+        self.fps_entry = ttk.Entry(animation_frame, textvariable=self.target_fps_var, width=8)
+        self.fps_entry.grid(row=1, column=1, sticky="we", pady=(0, 2), padx=(5, 0))
+
+        ttk.Label(animation_frame, text="Max steps per frame:").grid(row=2, column=0, sticky="w")
+        self.max_steps_entry = ttk.Entry(animation_frame, textvariable=self.max_steps_per_frame_var, width=8)
+        self.max_steps_entry.grid(row=2, column=1, sticky="we", pady=(0, 2), padx=(5, 0))
+
+        fit_btn = ttk.Button(
+            animation_frame,
+            text="Fit graph to view",
+            command=self._on_fit_view
+        )
+        fit_btn.grid(row=3, column=0, columnspan=2, sticky="we", pady=(2, 4))
 
         animation_frame.columnconfigure(1, weight=1)
 
@@ -326,17 +374,18 @@ class GraphGUI:
             return
 
         mode = self.mode_var.get()
-        x, y = event.x, event.y
+        x, y = self._viewport.to_world(event.x, event.y)
 
         if mode == "vertex":
             self._handle_add_vertex(x, y)
         elif mode == "edge":
             self._handle_add_edge(x, y)
 
-    def _handle_add_vertex(self, x: int, y: int):
+    def _handle_add_vertex(self, x: float, y: float):
         self._graph.add_vertex()
         vertex_id = self._graph.vertex_count - 1
         self._vertex_positions[vertex_id] = (x, y)
+        self._spatial_index.insert(vertex_id, x, y)
         self._coloring_state = None
         self._redraw_all()
 
@@ -347,14 +396,14 @@ class GraphGUI:
         self._set_conflicts_success(False)
         self._clear_plots()
 
-    def _handle_add_edge(self, x: int, y: int):
+    def _handle_add_edge(self, x: float, y: float):
         clicked = self._find_vertex_at(x, y)
         if clicked is None:
             return
 
         if self._selected_vertex is None:
             self._selected_vertex = clicked
-            self._redraw_all(highlight=clicked)
+            self._redraw_all()
             return
 
         v1 = self._selected_vertex
@@ -387,38 +436,40 @@ class GraphGUI:
             return
 
         # Reset graph
-        self._graph = Graph()
+        self._graph = gnp_graph(n_vertices, edge_prob).to_graph()
         self._vertex_positions.clear()
         self._selected_vertex = None
         self._coloring_state = None
         self.canvas.delete("all")
-        self._temp_history.clear()
-        self._conf_history.clear()
         self._clear_plots()
         self.conflicts_var.set("Conflicts: -")
         self.iteration_var.set("Iteration: -")
         self.temp_var.set("Temperature: -")
         self._set_conflicts_success(False)
 
-        # Place vertices on a circle
         width = int(self.canvas.winfo_width() or 650)
         height = int(self.canvas.winfo_height() or 380)
-        cx, cy = width // 2, height // 2
-        radius = min(width, height) // 2 - 40
-
-        for i in range(n_vertices):
-            self._graph.add_vertex()
-            angle = 2 * math.pi * i / n_vertices
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            self._vertex_positions[i] = (x, y)
-
-        # Random edges
-        for i in range(n_vertices):
-            for j in range(i + 1, n_vertices):
-                if random.random() < edge_prob:
-                    self._graph.add_edge(i, j)
-
+        self._viewport = Viewport()
+
+        if n_vertices <= self.LARGE_GRAPH_VERTICES:
+            # Place vertices on a circle
+            cx, cy = width // 2, height // 2
+            radius = min(width, height) // 2 - 40
+
+            for i in range(n_vertices):
+                angle = 2 * math.pi * i / n_vertices
+                x = cx + radius * math.cos(angle)
+                y = cy + radius * math.sin(angle)
+                self._vertex_positions[i] = (x, y)
+        else:
+            # too many for a circle: scatter them over a square with room for
+            # every vertex, then zoom out to show it all
+            side = math.sqrt(n_vertices) * 4 * self.VERTEX_RADIUS
+            for i in range(n_vertices):
+                self._vertex_positions[i] = (random.uniform(0, side), random.uniform(0, side))
+            self._viewport.fit(list(self._vertex_positions.values()), width, height)
+
+        self._spatial_index = GridIndex.from_points(self._vertex_positions, self._spatial_index.cell_size)
         self._redraw_all()
 
     # ------------------------------------------------
@@ -450,12 +501,7 @@ class GraphGUI:
         coloring.randomize()
         self._coloring_state = coloring
 
-        coloring_dict = {
-            v: coloring.get_color(v)
-            for v in range(self._graph.vertex_count)
-        }
-
-        self._redraw_all(coloring=coloring_dict)
+        self._recolor_vertices(coloring.get_color, range(self._graph.vertex_count))
         self.conflicts_var.set(f"Conflicts (random): {coloring.num_conflicts}")
         self.iteration_var.set("Iteration: -")
         self.temp_var.set("Temperature: -")
@@ -488,6 +534,14 @@ class GraphGUI:
                 raise ValueError("Initial temperature must be > 0.")
             if not (0 < cooling_rate < 1):
                 raise ValueError("Cooling rate must be between 0 and 1.")
+
+            target_fps = float(self.target_fps_var.get())
+            max_steps_text = self.max_steps_per_frame_var.get().strip()
+            max_steps_per_frame = int(max_steps_text) if max_steps_text else None
+            if target_fps <= 0:
+                raise ValueError("Target FPS must be > 0.")
+            if max_steps_per_frame is not None and max_steps_per_frame < 1:
+                raise ValueError("Max steps per frame must be >= 1.")
         except ValueError as e:
             messagebox.showerror("Invalid input", str(e))
             return
@@ -500,18 +554,17 @@ class GraphGUI:
         else:
             coloring_state = self._coloring_state
 
-        # Create SA object
+        # Create SA object; its history is bounded and downsampled for the plots
+        animate = self.animate_var.get()
         self._sa = SimulatedAnnealing(
             graph=self._graph,
             coloring_state=coloring_state,
             max_iteration=max_iter,
             initial_temp=initial_temp,
-            cooling_rate=cooling_rate
+            cooling_rate=cooling_rate,
+            history=HistoryRecorder("every_nth", capacity=self.PLOT_HISTORY_POINTS)
         )
 
-        # reset histories for plots
-        self._temp_history.clear()
-        self._conf_history.clear()
         self._clear_plots()
 
         self._is_sa_running = True
@@ -523,16 +576,77 @@ class GraphGUI:
         self.temp_var.set(f"Temperature: {initial_temp:.4f}")
         self.conflicts_var.set(f"Conflicts (current): {self._sa.current_state.num_conflicts}")
 
-        if self.animate_var.get():
-            self._animate_sa_step()
+        if animate:
+            # frames recolor only the vertices the solver changed since the last one
+            coloring_state.enable_change_tracking()
+            self._stepper = FrameStepper(self._sa, target_fps, max_steps_per_frame)
+            self._animate_sa_frame()
+        else:
+            # run on a worker thread so the window stays responsive and Stop works
+            self._solver_colors = coloring_state.get_colors()
+            self._solver = BackgroundSolver(self._sa)
+            self._solver.start()
+            self.root.after(self.POLL_INTERVAL_MS, self._poll_solver)
+
+    # ------------------------------------------------
+    # Background run: poll the solver thread
+    # ------------------------------------------------
+    def _poll_solver(self):
+        solver = self._solver
+        if solver is None:
+            return
+
+        progress = None
+        finished = None
+        try:
+            while finished is None:
+                message = solver.messages.get_nowait()
+                if isinstance(message, SolverFinished):
+                    finished = message
+                else:
+                    progress = message
+        except queue.Empty:
+            pass
+
+        if progress is not None:
+            self._show_progress(progress)
+        if finished is None:
+            self.root.after(self.POLL_INTERVAL_MS, self._poll_solver)
+            return
+
+        sa = self._sa
+        self._solver = None
+        self._solver_colors = None
+        self._sa = None
+        self._is_sa_running = False
+        self.run_btn.config(state=tk.NORMAL)
+
+        if finished.error is not None:
+            self.conflicts_var.set("Conflicts: (error)")
+            messagebox.showerror("Solver error", finished.error)
+            return
+
+        self._update_sa_plots(sa.history)
+        self.iteration_var.set(f"Iteration: {finished.iteration} / {sa._max_iteration}")
+        self.temp_var.set(f"Temperature: {sa.temp:.4f}")
+
+        best_state = finished.best_state
+        self._coloring_state = best_state
+        if finished.stopped:
+            self._recolor_vertices(best_state.get_color, range(self._graph.vertex_count))
+            self.conflicts_var.set(f"Conflicts (best, stopped): {best_state.num_conflicts}")
+            self._set_conflicts_success(False)
         else:
-            best_state = self._sa.run()
-            self._coloring_state = best_state
-            # history في هذا الوضع غير متتبَّعة خطوة بخطوة، نعرض فقط النهاية
             self._finish_sa(best_state)
-            self._is_sa_running = False
-            self.run_btn.config(state=tk.NORMAL)
-            self._sa = None
+
+    def _show_progress(self, progress: SolverProgress):
+        self._solver_colors = progress.colors
+        self._recolor_vertices(progress.colors.__getitem__, self._vertex_items.keys())
+        self.conflicts_var.set(
+            f"Conflicts (current): {progress.conflicts}  best: {progress.best_conflicts}"
+        )
+        self.iteration_var.set(f"Iteration: {progress.iteration} / {self._sa._max_iteration}")
+        self.temp_var.set(f"Temperature: {progress.temperature:.4f}")
 
     # ------------------------------------------------
     # Stop SA
@@ -540,6 +654,12 @@ class GraphGUI:
     def _on_stop_sa(self):
         if not self._is_sa_running:
             return
+        if self._solver is not None:
+            # the poll loop finishes up once the worker thread has stopped
+            self._solver.stop()
+            self.conflicts_var.set("Conflicts: (stopping...)")
+            return
+        self._sa.current_state.disable_change_tracking()
         self._sa = None
         self._is_sa_running = False
         self.run_btn.config(state=tk.NORMAL)
@@ -549,20 +669,20 @@ class GraphGUI:
     # ------------------------------------------------
     # Animation loop
     # ------------------------------------------------
-    def _animate_sa_step(self):
+    def _animate_sa_frame(self):
         if self._sa is None:
+            self._stepper = None
             self._is_sa_running = False
             self.run_btn.config(state=tk.NORMAL)
             return
 
-        finished = self._sa.step()
+        # run as many steps as fit in this frame, then render once
+        frame_started = time.perf_counter()
+        finished = self._stepper.advance()
+        render_started = time.perf_counter()
 
         current_state = self._sa.current_state
-        coloring_dict = {
-            v: current_state.get_color(v)
-            for v in range(self._graph.vertex_count)
-        }
-        self._redraw_all(coloring=coloring_dict)
+        self._recolor_vertices(current_state.get_color, current_state.pop_changed_vertices())
 
         # Update status
         self.conflicts_var.set(f"Conflicts (current): {current_state.num_conflicts}")
@@ -571,37 +691,31 @@ class GraphGUI:
         )
         self.temp_var.set(f"Temperature: {self._sa.temp:.4f}")
 
-        # Update histories & plots
-        self._temp_history.append(self._sa.temp)
-        self._conf_history.append(current_state.num_conflicts)
-        self._update_sa_plots(self._temp_history, self._conf_history)
+        # Update plots
+        self._update_sa_plots(self._sa.history)
+
+        # flush pending drawing so the measured render time includes it
+        self.root.update_idletasks()
+        self._stepper.report_render_time(time.perf_counter() - render_started)
 
         if not finished:
-            try:
-                delay = int(self.animation_delay_var.get())
-                if delay < 1:
-                    delay = 1
-            except ValueError:
-                delay = 20
-            self.root.after(delay, self._animate_sa_step)
+            self.root.after(self._stepper.next_frame_delay_ms(frame_started), self._animate_sa_frame)
         else:
             best_state = self._sa.best_state
             self._coloring_state = best_state
+            self._sa.current_state.disable_change_tracking()
             self._finish_sa(best_state)
 
             self._is_sa_running = False
             self.run_btn.config(state=tk.NORMAL)
             self._sa = None
+            self._stepper = None
 
     # ------------------------------------------------
     # Finish SA (common for instant & animated)
     # ------------------------------------------------
     def _finish_sa(self, best_state: Coloring):
-        best_coloring = {
-            v: best_state.get_color(v)
-            for v in range(self._graph.vertex_count)
-        }
-        self._redraw_all(coloring=best_coloring)
+        self._recolor_vertices(best_state.get_color, range(self._graph.vertex_count))
 
         if best_state.num_conflicts == 0:
             self.conflicts_var.set("Conflicts (best): 0")
@@ -618,35 +732,15 @@ class GraphGUI:
                 f"This is the best solution it found under the given parameters."
             )
 
-        # في حالة الـ animation، الـ history جاهزة؛ في حالة non-animated، ما في history تقريبًا
-        self._update_sa_plots(self._temp_history, self._conf_history)
-
     # ------------------------------------------------
     # Plot helpers
     # ------------------------------------------------
     def _clear_plots(self):
-        self._update_sa_plots([], [])
-
-    def _update_sa_plots(self, temps: list[float], conflicts: list[int]):
-        # Clear axes
-        self._ax_temp.clear()
-        self._ax_conf.clear()
-
-        self._ax_temp.set_title("Temperature Over Time")
-        self._ax_temp.set_xlabel("Iteration")
-        self._ax_temp.set_ylabel("Temperature")
+        self._live_plot.reset()
 
-        self._ax_conf.set_title("Conflicts Over Time")
-        self._ax_conf.set_xlabel("Iteration")
-        self._ax_conf.set_ylabel("Conflicts")
-
-        if temps and conflicts:
-            iterations = list(range(len(temps)))
-            self._ax_temp.plot(iterations, temps)
-            self._ax_conf.plot(iterations, conflicts)
-
-        self._fig.tight_layout()
-        self._plot_canvas.draw_idle()
+    def _update_sa_plots(self, history: HistoryRecorder):
+        # the history is bounded, so this costs the same on every frame
+        self._live_plot.update(history.iterations, history.temperatures, history.conflicts)
 
     # ------------------------------------------------
     # Visual helpers (success styling & canvas flash)
@@ -680,6 +774,10 @@ class GraphGUI:
         self._vertex_positions.clear()
         self._selected_vertex = None
         self.canvas.delete("all")
+        self._vertex_items = {}
+        self._edge_items = {}
+        self._spatial_index.clear()
+        self._viewport = Viewport()
         self._coloring_state = None
         self._sa = None
 
@@ -688,54 +786,128 @@ class GraphGUI:
         self.iteration_var.set("Iteration: -")
         self.temp_var.set("Temperature: -")
         self._set_conflicts_success(False)
-        self._temp_history.clear()
-        self._conf_history.clear()
         self._clear_plots()
 
     # ------------------------------------------------
     # Drawing helpers
     # ------------------------------------------------
-    def _draw_vertex(self, vertex_id: int, color: str = "lightpink"):
-        x, y = self._vertex_positions[vertex_id]
-        r = 15
-        self.canvas.create_oval(
+    def _draw_vertex(self, vertex_id: int, color: str, detail: DetailLevel) -> tuple[int, int | None]:
+        x, y = self._viewport.to_screen(*self._vertex_positions[vertex_id])
+        r = detail.vertex_radius
+        oval = self.canvas.create_oval(
             x - r, y - r, x + r, y + r,
-            fill=color, outline="black", width=2
+            fill=color, outline="black", width=2 if detail.show_labels else 1
         )
-        self.canvas.create_text(x, y, text=str(vertex_id))
-
-    def _draw_edge(self, v1: int, v2: int):
-        x1, y1 = self._vertex_positions[v1]
-        x2, y2 = self._vertex_positions[v2]
-        self.canvas.create_line(x1, y1, x2, y2, width=2)
+        label = self.canvas.create_text(x, y, text=str(vertex_id)) if detail.show_labels else None
+        return oval, label
+
+    def _draw_edge(self, v1: int, v2: int, width: int) -> int:
+        x1, y1 = self._viewport.to_screen(*self._vertex_positions[v1])
+        x2, y2 = self._viewport.to_screen(*self._vertex_positions[v2])
+        return self.canvas.create_line(x1, y1, x2, y2, width=width)
+
+    def _recolor_vertices(self, color_of: Callable[[int], int], vertices: Iterable[int]):
+        # updates only the given vertices' ovals (those on screen); cost scales
+        # with len(vertices)
+        itemconfig = self.canvas.itemconfig
+        vertex_items = self._vertex_items
+        palette = self._palette
+        for v in vertices:
+            items = vertex_items.get(v)
+            if items is not None:
+                itemconfig(items[0], fill=palette[color_of(v) % len(palette)])
+
+    def _displayed_color_of(self) -> Callable[[int], int] | None:
+        # never reads a coloring the solver thread is changing
+        if self._solver is not None:
+            return self._solver_colors.__getitem__
+        if self._sa is not None:
+            return self._sa.current_state.get_color
+        if self._coloring_state is not None:
+            return self._coloring_state.get_color
+        return None
 
-    def _redraw_all(self,
-                    highlight: int | None = None,
-                    coloring: dict[int, int] | None = None):
+    def _redraw_all(self):
+        # rebuilds the on-screen part of the graph, for structural changes and
+        # zoom/pan; runs use _recolor_vertices
+        self._redraw_pending = False
         self.canvas.delete("all")
+        self._edge_items = {}
+        self._vertex_items = {}
+
+        viewport = self._viewport
+        width = self.canvas.winfo_width() or 650
+        height = self.canvas.winfo_height() or 380
+        margin = self.VERTEX_RADIUS * max(viewport.scale, 1.0)
+        visible = self._spatial_index.query_rect(*viewport.visible_rect(width, height, margin))
+
+        # edges with at least one endpoint on screen (an edge crossing the view
+        # between two off-screen vertices is not drawn)
+        visible_set = set(visible)
+        edges = [
+            (v, n)
+            for v in visible
+            for n in self._graph.neighbors(v)
+            if v < n or n not in visible_set
+        ]
+        detail = detail_level(viewport.scale, len(visible), len(edges), base_radius=self.VERTEX_RADIUS)
 
-        for v, neighbors in self._graph.adjacency_list.items():
-            for n in neighbors:
-                if v < n:
-                    self._draw_edge(v, n)
+        for v, n in edges[::detail.edge_stride]:
+            self._edge_items[(min(v, n), max(v, n))] = self._draw_edge(v, n, detail.edge_width)
 
-        for v in range(self._graph.vertex_count):
-            if coloring is not None and v in coloring:
-                color_index = coloring[v]
-                color = self._map_color_index_to_tk(color_index)
+        color_of = self._displayed_color_of()
+        for v in visible:
+            if color_of is not None:
+                color = self._map_color_index_to_tk(color_of(v))
             else:
                 color = "lightpink"
 
-            if highlight is not None and v == highlight:
+            if v == self._selected_vertex:
                 color = "yellow"
 
-            self._draw_vertex(v, color=color)
+            self._vertex_items[v] = self._draw_vertex(v, color, detail)
 
-    def _find_vertex_at(self, x: int, y: int, radius: int = 20):
-        for v, (vx, vy) in self._vertex_positions.items():
-            if (x - vx) ** 2 + (y - vy) ** 2 <= radius ** 2:
-                return v
-        return None
+    def _find_vertex_at(self, x: float, y: float, radius: float = 20):
+        # x, y in world coordinates; the click tolerance never drops below a
+        # few screen pixels, however far the view is zoomed out
+        return self._spatial_index.nearest_within(x, y, max(radius, 8 / self._viewport.scale))
+
+    # ------------------------------------------------
+    # Zoom & pan
+    # ------------------------------------------------
+    def _schedule_redraw(self):
+        # coalesces bursts of wheel / drag / resize events into one redraw
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._redraw_all)
+
+    def _on_canvas_wheel(self, event: tk.Event):
+        factor = self.ZOOM_STEP if event.delta > 0 else 1 / self.ZOOM_STEP
+        self._zoom(factor, event.x, event.y)
+
+    def _zoom(self, factor: float, x: int, y: int):
+        self._viewport.zoom_at(factor, x, y)
+        self._schedule_redraw()
+
+    def _on_pan_start(self, event: tk.Event):
+        self._pan_start = (event.x, event.y)
+
+    def _on_pan_drag(self, event: tk.Event):
+        if self._pan_start is None:
+            return
+        dx = event.x - self._pan_start[0]
+        dy = event.y - self._pan_start[1]
+        self._pan_start = (event.x, event.y)
+        # move what is drawn right away; the redraw adds what scrolled into view
+        self.canvas.move("all", dx, dy)
+        self._viewport.pan(dx, dy)
+        self._schedule_redraw()
+
+    def _on_fit_view(self):
+        width = self.canvas.winfo_width() or 650
+        height = self.canvas.winfo_height() or 380
+        self._viewport.fit(list(self._vertex_positions.values()), width, height)
+        self._redraw_all()
 
     def _map_color_index_to_tk(self, index: int) -> str:
         return self._palette[index % len(self._palette)]
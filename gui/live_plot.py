@@ -0,0 +1,94 @@
+from typing import Sequence
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import FigureCanvasBase
+
+
+class LiveHistoryPlot:
+    # temperature and conflicts charts that update in place: the two line
+    # artists get new data every frame and are blitted over a cached
+    # background (axes, ticks, titles). The axes limits only grow, in steps
+    # (x doubles, y by half), so a full redraw is needed only now and then.
+    # Feed it a bounded (downsampled) history to keep every frame O(1) in the
+    # length of the run.
+
+    def __init__(self, canvas: FigureCanvasBase, ax_temp: Axes, ax_conf: Axes):
+        self._canvas = canvas
+        self._figure = canvas.figure
+        self._ax_temp = ax_temp
+        self._ax_conf = ax_conf
+
+        for ax, title, ylabel in ((ax_temp, "Temperature Over Time", "Temperature"),
+                                  (ax_conf, "Conflicts Over Time", "Conflicts")):
+            ax.set_title(title)
+            ax.set_xlabel("Iteration")
+            ax.set_ylabel(ylabel)
+        # animated artists are left out of normal draws and drawn by blitting
+        (self._temp_line,) = ax_temp.plot([], [], animated=True)
+        (self._conf_line,) = ax_conf.plot([], [], animated=True)
+
+        self._background = None
+        self.full_redraws: int = 0
+        canvas.mpl_connect("draw_event", self._on_draw)
+        self.reset()
+
+    def reset(self) -> None:
+        self._temp_line.set_data([], [])
+        self._conf_line.set_data([], [])
+        self._ax_temp.set_xlim(0, 1)
+        self._ax_temp.set_ylim(0, 1)
+        self._ax_conf.set_xlim(0, 1)
+        self._ax_conf.set_ylim(0, 1)
+        self._request_full_redraw()
+
+    def update(self, iterations: Sequence[int], temperatures: Sequence[float], conflicts: Sequence[int]) -> None:
+        if len(iterations) == 0:
+            return
+        # memoryviews from a HistoryRecorder are wrapped without copying
+        x = np.asarray(iterations)
+        temps = np.asarray(temperatures)
+        confs = np.asarray(conflicts)
+        self._temp_line.set_data(x, temps)
+        self._conf_line.set_data(x, confs)
+
+        grew = self._grow_limits(self._ax_temp, x[-1], temps.max())
+        grew = self._grow_limits(self._ax_conf, x[-1], confs.max()) or grew
+        if grew or self._background is None:
+            self._request_full_redraw()
+        else:
+            self._blit()
+
+    def _grow_limits(self, ax: Axes, x_max: float, y_max: float) -> bool:
+        grew = False
+        _, x_limit = ax.get_xlim()
+        if x_max > x_limit:
+            while x_limit < x_max:
+                x_limit *= 2
+            ax.set_xlim(0, x_limit)
+            grew = True
+        _, y_limit = ax.get_ylim()
+        if y_max > y_limit:
+            ax.set_ylim(0, y_max * 1.5)
+            grew = True
+        return grew
+
+    def _request_full_redraw(self) -> None:
+        self._background = None
+        self.full_redraws += 1
+        self._canvas.draw_idle()
+
+    def _on_draw(self, event) -> None:
+        # after every full draw (including window resizes) cache the new
+        # background and put the lines back on top of it
+        self._background = self._canvas.copy_from_bbox(self._figure.bbox)
+        self._draw_lines()
+
+    def _blit(self) -> None:
+        self._canvas.restore_region(self._background)
+        self._draw_lines()
+        self._canvas.blit(self._figure.bbox)
+
+    def _draw_lines(self) -> None:
+        self._ax_temp.draw_artist(self._temp_line)
+        self._ax_conf.draw_artist(self._conf_line)
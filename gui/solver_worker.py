@@ -0,0 +1,79 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+
+
+@dataclass
+class SolverProgress:
+    iteration: int
+    temperature: float
+    conflicts: int
+    best_conflicts: int
+    # snapshot of the current coloring, taken on the worker thread
+    colors: list[int]
+
+
+@dataclass
+class SolverFinished:
+    best_state: Coloring | None
+    iteration: int
+    stopped: bool
+    error: str | None = None
+
+
+class BackgroundSolver:
+    # runs a SimulatedAnnealing on a daemon thread so the Tk event loop stays
+    # responsive; progress (at most once per `progress_interval` seconds) and a
+    # final SolverFinished arrive on `messages`, which the Tk thread polls with
+    # root.after. The solver and its colorings belong to the worker thread until
+    # SolverFinished has been received; meanwhile, draw from the colors of the
+    # last SolverProgress.
+
+    # iterations between checks of the stop flag and the progress clock
+    CHECK_INTERVAL = 256
+
+    def __init__(self, sa: SimulatedAnnealing, progress_interval: float = 0.05):
+        self._sa = sa
+        self._progress_interval = progress_interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sa-solver", daemon=True)
+        self.messages: queue.Queue = queue.Queue()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def join(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        sa = self._sa
+        stop_event = self._stop_event
+        check_interval = self.CHECK_INTERVAL
+        next_report = time.perf_counter()
+        stopped = False
+        try:
+            while not sa.step():
+                if sa.iteration % check_interval == 0:
+                    if stop_event.is_set():
+                        sa.finish()
+                        stopped = True
+                        break
+                    now = time.perf_counter()
+                    if now >= next_report:
+                        self.messages.put(SolverProgress(sa.iteration, sa.temp, sa.current_state.num_conflicts,
+                                                         sa.best_state.num_conflicts, sa.current_state.get_colors()))
+                        next_report = now + self._progress_interval
+            self.messages.put(SolverFinished(sa.best_state, sa.iteration, stopped=stopped))
+        except Exception as e:
+            self.messages.put(SolverFinished(None, sa.iteration, stopped=False, error=f"{type(e).__name__}: {e}"))
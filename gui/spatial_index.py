@@ -0,0 +1,88 @@
+import math
+from typing import Iterable
+
+
+class GridIndex:
+    # uniform grid over 2D points for hit-testing and viewport culling: a point
+    # lives in the cell (floor(x / cell_size), floor(y / cell_size)), so a query
+    # only looks at the cells its area touches instead of every point
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be > 0.")
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._points: dict[int, tuple[float, float]] = {}
+
+    @classmethod
+    def from_points(cls, points: dict[int, tuple[float, float]], cell_size: float) -> "GridIndex":
+        index = cls(cell_size)
+        for item, (x, y) in points.items():
+            index.insert(item, x, y)
+        return index
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def insert(self, item: int, x: float, y: float) -> None:
+        if item in self._points:
+            self.remove(item)
+        self._points[item] = (x, y)
+        self._cells.setdefault(self._cell_of(x, y), []).append(item)
+
+    def remove(self, item: int) -> None:
+        x, y = self._points.pop(item)
+        cell = self._cell_of(x, y)
+        members = self._cells[cell]
+        members.remove(item)
+        if not members:
+            del self._cells[cell]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._points.clear()
+
+    def nearest_within(self, x: float, y: float, radius: float) -> int | None:
+        best_item = None
+        best_distance = radius * radius
+        points = self._points
+        for item in self._items_in_cells(x - radius, y - radius, x + radius, y + radius):
+            px, py = points[item]
+            distance = (px - x) ** 2 + (py - y) ** 2
+            if distance <= best_distance:
+                best_item = item
+                best_distance = distance
+        return best_item
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> list[int]:
+        points = self._points
+        found = []
+        for item in self._items_in_cells(x0, y0, x1, y1):
+            px, py = points[item]
+            if x0 <= px <= x1 and y0 <= py <= y1:
+                found.append(item)
+        return found
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self._cell_size), math.floor(y / self._cell_size)
+
+    def _items_in_cells(self, x0: float, y0: float, x1: float, y1: float) -> Iterable[int]:
+        first_column, first_row = self._cell_of(x0, y0)
+        last_column, last_row = self._cell_of(x1, y1)
+        cells = self._cells
+        # a huge query rectangle would visit mostly empty cells; walk the
+        # occupied cells instead
+        if (last_column - first_column + 1) * (last_row - first_row + 1) > len(cells):
+            for (column, row), members in cells.items():
+                if first_column <= column <= last_column and first_row <= row <= last_row:
+                    yield from members
+            return
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                members = cells.get((column, row))
+                if members:
+                    yield from members
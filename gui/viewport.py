@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DetailLevel:
+    vertex_radius: float
+    show_labels: bool
+    edge_width: int
+    # draw every edge_stride-th visible edge; 1 draws them all
+    edge_stride: int
+
+
+class Viewport:
+    # world <-> screen transform of the graph canvas: screen = world * scale + offset
+
+    MIN_SCALE = 0.01
+    MAX_SCALE = 20.0
+
+    def __init__(self, scale: float = 1.0, offset_x: float = 0.0, offset_y: float = 0.0):
+        self.scale = scale
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+    def to_screen(self, x: float, y: float) -> tuple[float, float]:
+        return x * self.scale + self.offset_x, y * self.scale + self.offset_y
+
+    def to_world(self, x: float, y: float) -> tuple[float, float]:
+        return (x - self.offset_x) / self.scale, (y - self.offset_y) / self.scale
+
+    def visible_rect(self, width: float, height: float, margin: float = 0.0) -> tuple[float, float, float, float]:
+        # world rectangle shown on a width x height canvas, grown by `margin` screen pixels
+        x0, y0 = self.to_world(-margin, -margin)
+        x1, y1 = self.to_world(width + margin, height + margin)
+        return x0, y0, x1, y1
+
+    def zoom_at(self, factor: float, x: float, y: float) -> None:
+        # zooms around screen point (x, y), which keeps showing the same world point
+        new_scale = min(self.MAX_SCALE, max(self.MIN_SCALE, self.scale * factor))
+        world_x, world_y = self.to_world(x, y)
+        self.scale = new_scale
+        self.offset_x = x - world_x * new_scale
+        self.offset_y = y - world_y * new_scale
+
+    def pan(self, dx: float, dy: float) -> None:
+        self.offset_x += dx
+        self.offset_y += dy
+
+    def fit(self, points: list[tuple[float, float]], width: float, height: float, padding: float = 20.0) -> None:
+        # shows all points, keeping the current scale when they already fit
+        if not points:
+            return
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        span_x = max(max(xs) - min(xs), 1.0)
+        span_y = max(max(ys) - min(ys), 1.0)
+        fit_scale = min((width - 2 * padding) / span_x, (height - 2 * padding) / span_y)
+        self.scale = min(self.MAX_SCALE, max(self.MIN_SCALE, min(1.0, fit_scale)))
+        self.offset_x = (width - (max(xs) + min(xs)) * self.scale) / 2
+        self.offset_y = (height - (max(ys) + min(ys)) * self.scale) / 2
+
+
+def detail_level(scale: float, visible_vertices: int, visible_edges: int,
+                 base_radius: float = 15.0, max_edges: int = 20000) -> DetailLevel:
+    # level-of-detail rules: vertices shrink with the zoom (but stay clickable
+    # dots), labels only appear when they fit and are not too many, edges get
+    # thinner when zoomed out and are thinned out past max_edges
+    radius = max(2.0, base_radius * scale)
+    return DetailLevel(
+        vertex_radius=radius,
+        show_labels=radius >= 8 and visible_vertices <= 500,
+        edge_width=2 if scale >= 0.75 and visible_edges <= 2000 else 1,
+        edge_stride=max(1, -(-visible_edges // max_edges))
+    )
@@ -1,18 +1,129 @@
-# This is a sample Python script.
+import argparse
+import json
+import os
+import random
+import sys
+from dataclasses import asdict
+
+from algorithms.checkpoint import Checkpointer, resume, run_with_checkpoints
+from algorithms.simulated_annealing import SimulatedAnnealing
 from models.coloring_state import Coloring
+from utils.dimacs import write_coloring
+from utils.graph_cache import CACHE_SUFFIX, load_graph
+
+# headless solver; deliberately imports nothing from gui/ or matplotlib
+#
+# exit codes
+EXIT_SOLVED = 0
+EXIT_UNSOLVED = 1
+EXIT_ERROR = 2
+
+# solver settings of a fresh run; a resumed run takes them from its checkpoint
+SOLVER_DEFAULTS = {"max_iteration": 1_000_000, "initial_temp": 1.0, "cooling_rate": 0.99999}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Color a graph with simulated annealing.")
+    parser.add_argument("graph", help=f"DIMACS .col file (optionally gzipped) or {CACHE_SUFFIX} cache file")
+    parser.add_argument("-k", "--colors", type=int,
+                        help="number of colors (optional when resuming a checkpoint, which records it)")
+    parser.add_argument("--max-iteration", type=int, help=f"default: {SOLVER_DEFAULTS['max_iteration']}")
+    parser.add_argument("--initial-temp", type=float, help=f"default: {SOLVER_DEFAULTS['initial_temp']}")
+    parser.add_argument("--cooling-rate", type=float, help=f"default: {SOLVER_DEFAULTS['cooling_rate']}")
+    parser.add_argument("--time-limit", type=float, help="stop after this many seconds")
+    parser.add_argument("--seed", type=int, help="random seed (a random one is picked and reported if omitted)")
+    parser.add_argument("--cache", action="store_true", help="keep a binary cache next to the DIMACS file")
+    parser.add_argument("--output", default="-", help="where to write the result JSON ('-' for stdout)")
+    parser.add_argument("--coloring", help="also write the best coloring in DIMACS solution format")
+    parser.add_argument("--checkpoint", help="checkpoint file; an existing one is resumed")
+    parser.add_argument("--checkpoint-interval", type=float, default=60.0, help="seconds between checkpoints")
+    return parser
+
+
+def is_resuming(args: argparse.Namespace) -> bool:
+    return bool(args.checkpoint) and os.path.exists(args.checkpoint)
+
+
+def solve(args: argparse.Namespace) -> dict:
+    graph = load_graph(args.graph, args.cache)
+
+    if is_resuming(args):
+        sa = resume(args.checkpoint, graph)
+        if args.colors is not None and args.colors != sa.current_state.num_colors:
+            raise ValueError(f"-k {args.colors} does not match the {sa.current_state.num_colors} colors "
+                             f"of the run in {args.checkpoint}.")
+        seed = None
+    else:
+        if args.colors < 1:
+            raise ValueError("Number of colors must be >= 1.")
+        seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+        random.seed(seed)
+        coloring = Coloring(graph, args.colors)
+        coloring.randomize()
+        sa = SimulatedAnnealing(graph, coloring, max_iteration=args.max_iteration,
+                                initial_temp=args.initial_temp, cooling_rate=args.cooling_rate,
+                                time_limit=args.time_limit, record_history=False)
+
+    if args.checkpoint:
+        best_state = run_with_checkpoints(sa, Checkpointer(args.checkpoint, args.checkpoint_interval))
+    else:
+        best_state = sa.run()
+
+    if args.coloring:
+        write_coloring(args.coloring, best_state, comment=f"graph {args.graph}")
 
+    return {
+        "graph": args.graph,
+        "vertices": graph.vertex_count,
+        "edges": graph.edge_count,
+        "num_colors": best_state.num_colors,
+        "seed": seed,
+        "solved": best_state.num_conflicts == 0,
+        "conflicts": best_state.num_conflicts,
+        "stats": asdict(sa.stats()),
+        "coloring": best_state.get_colors(),
+    }
 
-# Press ⌃R to execute it or replace it with your code.
-# Press Double ⇧ to search everywhere for classes, files, tool windows, actions, and settings.
 
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    # a resumed run continues with the colors, solver settings and random state
+    # of the checkpoint
+    if is_resuming(args):
+        given = [
+            option for option, value in (
+                ("--seed", args.seed),
+                ("--max-iteration", args.max_iteration),
+                ("--initial-temp", args.initial_temp),
+                ("--cooling-rate", args.cooling_rate),
+                ("--time-limit", args.time_limit),
+            ) if value is not None
+        ]
+        if given:
+            parser.error(f"{', '.join(given)} cannot be used when resuming a checkpoint; "
+                         "the run continues with the settings stored in it")
+    else:
+        if args.colors is None:
+            parser.error("-k/--colors is required unless resuming a checkpoint")
+        for name, value in SOLVER_DEFAULTS.items():
+            if getattr(args, name) is None:
+                setattr(args, name, value)
+    try:
+        result = solve(args)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_ERROR
 
-def print_hi(name):
-    # Use a breakpoint in the code line below to debug your script.
-    print(f'Hi, {name}')  # Press ⌘F8 to toggle the breakpoint.
+    if args.output == "-":
+        json.dump(result, sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as f:
+            json.dump(result, f)
 
+    return EXIT_SOLVED if result["solved"] else EXIT_UNSOLVED
 
-# Press the green button in the gutter to run the script.
-if __name__ == '__main__':
-    print_hi('PyCharm')
 
-# See PyCharm help at https://www.jetbrains.com/help/pycharm/
+if __name__ == "__main__":
+    sys.exit(main())
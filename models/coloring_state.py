@@ -1,16 +1,36 @@
 import random
+from typing import Callable, Iterable
 
+from models.csr_graph import CSRGraph
 from models.graph import Graph
 
 
 class Coloring:
 
-    def __init__(self, graph: Graph, num_colors: int):
+    def __init__(self, graph: Graph | CSRGraph, num_colors: int, track_color_counts: bool = False):
         self._graph = graph
         self._num_colors = num_colors
         self._colors = [0] * graph.vertex_count
         self._num_conflicts = 0
 
+        # per-vertex count of same-colored neighbors, and the vertices where it is > 0
+        # (a list plus position index, so membership changes and sampling are O(1))
+        self._vertex_conflicts = [0] * graph.vertex_count
+        self._conflict_vertices: list[int] = []
+        self._conflict_positions = [-1] * graph.vertex_count
+
+        # optional vertex x color table: _color_counts[v * num_colors + c] is the
+        # number of neighbors of v colored c
+        self._color_counts: list[int] | None = None
+        if track_color_counts:
+            self._color_counts = [0] * (graph.vertex_count * num_colors)
+
+        # optional set of vertices recolored since the last pop_changed_vertices(),
+        # so viewers can update only what changed
+        self._changed_vertices: set[int] | None = None
+
+        self._compute_conflicts()
+
     @property
     def num_conflicts(self):
         return self._num_conflicts
@@ -23,9 +43,75 @@ class Coloring:
     def graph(self):
         return self._graph
 
+    @property
+    def tracks_color_counts(self) -> bool:
+        return self._color_counts is not None
+
+    @property
+    def num_conflict_vertices(self) -> int:
+        return len(self._conflict_vertices)
+
+    def get_conflict_vertices(self) -> list[int]:
+        return self._conflict_vertices.copy()
+
+    @property
+    def tracks_changes(self) -> bool:
+        return self._changed_vertices is not None
+
+    def enable_change_tracking(self):
+        # every vertex counts as changed until the first pop
+        self._changed_vertices = set(range(len(self._colors)))
+
+    def disable_change_tracking(self):
+        self._changed_vertices = None
+
+    def pop_changed_vertices(self) -> set[int]:
+        changed = self._changed_vertices
+        if changed is None:
+            raise ValueError("Change tracking is not enabled.")
+        self._changed_vertices = set()
+        return changed
+
     def set_color(self, vertex: int, color: int):
-        self._colors[vertex] = color
-        self._compute_conflicts()
+        # checked before anything changes: an out-of-range color would index
+        # into another vertex's row of _color_counts
+        if not (0 <= color < self._num_colors):
+            raise ValueError("Colors must be between 0 and num_colors - 1.")
+        current_color = self._colors[vertex]
+        if color == current_color:
+            return
+
+        colors = self._colors
+        vertex_conflicts = self._vertex_conflicts
+        new_conflicts = 0
+        for n in self._graph.neighbors(vertex):
+            neighbor_color = colors[n]
+            if neighbor_color == current_color:
+                vertex_conflicts[n] -= 1
+                if vertex_conflicts[n] == 0:
+                    self._remove_conflict_vertex(n)
+            elif neighbor_color == color:
+                new_conflicts += 1
+                vertex_conflicts[n] += 1
+                if vertex_conflicts[n] == 1:
+                    self._add_conflict_vertex(n)
+
+        color_counts = self._color_counts
+        if color_counts is not None:
+            k = self._num_colors
+            for n in self._graph.neighbors(vertex):
+                color_counts[n * k + current_color] -= 1
+                color_counts[n * k + color] += 1
+
+        self._num_conflicts += new_conflicts - vertex_conflicts[vertex]
+        colors[vertex] = color
+        vertex_conflicts[vertex] = new_conflicts
+        if self._changed_vertices is not None:
+            self._changed_vertices.add(vertex)
+        if new_conflicts:
+            self._add_conflict_vertex(vertex)
+        else:
+            self._remove_conflict_vertex(vertex)
 
     def get_colors(self) -> list[int]:
         return self._colors.copy()
@@ -33,57 +119,206 @@ class Coloring:
     def get_color(self, vertex: int) -> int:
         return self._colors[vertex]
 
+    def delta_if_recolored(self, vertex: int, color: int) -> int:
+        # change in num_conflicts if `vertex` took `color`, without applying it
+        current_color = self._colors[vertex]
+        if color == current_color:
+            return 0
+        if self._color_counts is not None:
+            return self._color_counts[vertex * self._num_colors + color] - self._vertex_conflicts[vertex]
+        return self._count_neighbors_with_color(vertex, color) - self._vertex_conflicts[vertex]
+
+    def neighbor_color_counts(self, vertex: int) -> list[int]:
+        k = self._num_colors
+        if self._color_counts is not None:
+            return self._color_counts[vertex * k:(vertex + 1) * k]
+
+        counts = [0] * k
+        colors = self._colors
+        for n in self._graph.neighbors(vertex):
+            counts[colors[n]] += 1
+        return counts
+
+    def best_move_for(self, vertex: int) -> tuple[int, int] | None:
+        # (color, delta) of the best recolor of `vertex`, ties broken at random
+        if self._num_colors == 1:
+            return None
+
+        counts = self.neighbor_color_counts(vertex)
+        current_color = self._colors[vertex]
+        best_colors: list[int] = []
+        best_count = None
+        for color, count in enumerate(counts):
+            if color == current_color:
+                continue
+            if best_count is None or count < best_count:
+                best_count = count
+                best_colors = [color]
+            elif count == best_count:
+                best_colors.append(color)
+
+        return random.choice(best_colors), best_count - counts[current_color]
+
+    def best_conflict_move(
+        self,
+        is_allowed: Callable[[int, int], bool] | None = None
+    ) -> tuple[int, int, int] | None:
+        # (vertex, color, delta) of the best recolor over all conflicting vertices;
+        # `is_allowed` lets tabu-style searches forbid some (vertex, color) pairs
+        if self._num_colors == 1:
+            return None
+
+        best_moves: list[tuple[int, int]] = []
+        best_delta = None
+        for vertex in self._conflict_vertices:
+            counts = self.neighbor_color_counts(vertex)
+            current_count = counts[self._colors[vertex]]
+            for color, count in enumerate(counts):
+                if color == self._colors[vertex]:
+                    continue
+                if is_allowed is not None and not is_allowed(vertex, color):
+                    continue
+                delta = count - current_count
+                if best_delta is None or delta < best_delta:
+                    best_delta = delta
+                    best_moves = [(vertex, color)]
+                elif delta == best_delta:
+                    best_moves.append((vertex, color))
+
+        if not best_moves:
+            return None
+        vertex, color = random.choice(best_moves)
+        return vertex, color, best_delta
+
+    def random_conflict_vertex(self) -> int | None:
+        if not self._conflict_vertices:
+            return None
+        return self._conflict_vertices[random.randrange(len(self._conflict_vertices))]
+
+    def _count_neighbors_with_color(self, vertex: int, color: int) -> int:
+        colors = self._colors
+        count = 0
+        for n in self._graph.neighbors(vertex):
+            if colors[n] == color:
+                count += 1
+        return count
+
+    def _add_conflict_vertex(self, vertex: int):
+        if self._conflict_positions[vertex] == -1:
+            self._conflict_positions[vertex] = len(self._conflict_vertices)
+            self._conflict_vertices.append(vertex)
+
+    def _remove_conflict_vertex(self, vertex: int):
+        position = self._conflict_positions[vertex]
+        if position == -1:
+            return
+        last_vertex = self._conflict_vertices.pop()
+        if last_vertex != vertex:
+            self._conflict_vertices[position] = last_vertex
+            self._conflict_positions[last_vertex] = position
+        self._conflict_positions[vertex] = -1
+
     def _compute_conflicts(self):
 
-        adjacency_list = self._graph.adjacency_list
+        graph = self._graph
         num_conflicts = 0
-        for v, neighbors in adjacency_list.items():
-            for n in neighbors:
+        self._conflict_vertices = []
+        for v in range(graph.vertex_count):
+            vertex_conflicts = 0
+            for n in graph.neighbors(v):
                 if self._colors[v] == self._colors[n]:
-                    num_conflicts+=1
+                    vertex_conflicts += 1
+
+            self._vertex_conflicts[v] = vertex_conflicts
+            if vertex_conflicts:
+                self._conflict_positions[v] = len(self._conflict_vertices)
+                self._conflict_vertices.append(v)
+            else:
+                self._conflict_positions[v] = -1
+            num_conflicts += vertex_conflicts
 
         self._num_conflicts = num_conflicts//2
 
+        if self._color_counts is not None:
+            k = self._num_colors
+            color_counts = [0] * (graph.vertex_count * k)
+            for v in range(graph.vertex_count):
+                for n in graph.neighbors(v):
+                    color_counts[v * k + self._colors[n]] += 1
+            self._color_counts = color_counts
+
+        if self._changed_vertices is not None:
+            self._changed_vertices.update(range(graph.vertex_count))
+
     def randomize(self):
         for i in range(len(self._colors)):
             self._colors[i] = random.randint(0, self._num_colors - 1)
 
         self._compute_conflicts()
 
+    def set_colors(self, colors: Iterable[int]):
+        new_colors = list(colors)
+        if len(new_colors) != len(self._colors):
+            raise ValueError("Expected one color per vertex.")
+        if any(not (0 <= color < self._num_colors) for color in new_colors):
+            raise ValueError("Colors must be between 0 and num_colors - 1.")
+
+        self._colors = new_colors
+        self._compute_conflicts()
+
+    def restore_conflict_order(self, vertices: Iterable[int]):
+        # moves draw conflicting vertices by position, so a resumed run only
+        # repeats the original one if the list is back in its saved order
+        new_order = list(vertices)
+        if sorted(new_order) != sorted(self._conflict_vertices):
+            raise ValueError("Expected exactly the current conflicting vertices.")
+
+        self._conflict_vertices = new_order
+        for position, vertex in enumerate(new_order):
+            self._conflict_positions[vertex] = position
+
     def copy(self) -> "Coloring":
-        new_coloring = Coloring(self._graph, self._num_colors)
+        new_coloring = Coloring.__new__(Coloring)
+        new_coloring._graph = self._graph
+        new_coloring._num_colors = self._num_colors
         new_coloring._colors = self._colors.copy()
         new_coloring._num_conflicts = self._num_conflicts
+        new_coloring._vertex_conflicts = self._vertex_conflicts.copy()
+        new_coloring._conflict_vertices = self._conflict_vertices.copy()
+        new_coloring._conflict_positions = self._conflict_positions.copy()
+        new_coloring._color_counts = None if self._color_counts is None else self._color_counts.copy()
+        new_coloring._changed_vertices = None
         return new_coloring
 
-    def modify_one_vertex(self) -> None:
-        if self._num_colors == 1:
-            return
+    def propose_random_move(self) -> tuple[int, int] | None:
+        if self._num_colors == 1 or not self._colors:
+            return None
         random_vertex = random.randint(0, len(self._colors)-1)
-        current_color = self._colors[random_vertex]
-        new_color = random.randint(0, self._num_colors - 1)
-        while new_color == current_color:  #to avoid stay same color
-            new_color = random.randint(0, self._num_colors - 1)
+        return random_vertex, self._random_other_color(self._colors[random_vertex])
 
-        self._colors[random_vertex] = new_color
-        self._compute_conflicts()
-
-    def modify_conflict_vertex(self):
-        if self._num_colors == 1:
+    def modify_one_vertex(self) -> None:
+        move = self.propose_random_move()
+        if move is None:
             return
+        self.set_color(*move)
 
-        conflict_vertex = None
-        for v, neighbors in self._graph.adjacency_list.items():
-           if any(self._colors[v] == self._colors[n] for n in neighbors):
-               conflict_vertex = v
-               break
-
+    def propose_conflict_move(self) -> tuple[int, int] | None:
+        if self._num_colors == 1:
+            return None
+        conflict_vertex = self.random_conflict_vertex()
         if conflict_vertex is None:
+            return None
+        return conflict_vertex, self._random_other_color(self._colors[conflict_vertex])
+
+    def modify_conflict_vertex(self):
+        move = self.propose_conflict_move()
+        if move is None:
             return
-        current_color = self._colors[conflict_vertex]
-        new_color = random.randint(0, self._num_colors - 1)
-        while new_color == current_color:  # to avoid stay same color
-            new_color = random.randint(0, self._num_colors - 1)
+        self.set_color(*move)
 
-        self._colors[conflict_vertex] = new_color
-        self._compute_conflicts()
+    def _random_other_color(self, current_color: int) -> int:
+        # uniform over the other num_colors - 1 colors, to avoid stay same color
+        new_color = random.randint(0, self._num_colors - 2)
+        if new_color >= current_color:
+            new_color += 1
+        return new_color
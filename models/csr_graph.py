@@ -0,0 +1,175 @@
+from array import array
+from typing import Iterable
+
+from models.graph import Graph
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: without it CSR arrays are built by a pure Python loop
+    np = None
+
+
+class CSRGraph:
+    # frozen compressed-sparse-row adjacency: the neighbors of v are
+    # neighbor_array[offsets[v]:offsets[v + 1]], sorted and without duplicates
+
+    def __init__(self, offsets, neighbors) -> None:
+        self._offsets = memoryview(offsets)
+        self._neighbors = memoryview(neighbors)
+        self._vertex_count = len(self._offsets) - 1
+
+        if self._vertex_count < 0:
+            raise ValueError("offsets must contain at least one entry.")
+        if self._offsets[self._vertex_count] != len(self._neighbors):
+            raise ValueError("last offset must equal the number of neighbor entries.")
+
+    def __reduce__(self):
+        # memoryviews cannot be pickled; ship plain arrays (e.g. to worker processes)
+        offsets = array("q")
+        offsets.frombytes(self._offsets.cast("B"))
+        neighbors = array("i")
+        neighbors.frombytes(self._neighbors.cast("B"))
+        return CSRGraph, (offsets, neighbors)
+
+    @property
+    def vertex_count(self) -> int:
+        return self._vertex_count
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._neighbors) // 2
+
+    @property
+    def offsets(self) -> memoryview:
+        return self._offsets
+
+    @property
+    def neighbor_array(self) -> memoryview:
+        return self._neighbors
+
+    def neighbors(self, vertex: int) -> memoryview:
+        return self._neighbors[self._offsets[vertex]:self._offsets[vertex + 1]]
+
+    def degree(self, vertex: int) -> int:
+        return self._offsets[vertex + 1] - self._offsets[vertex]
+
+    def edges(self) -> Iterable[tuple[int, int]]:
+        offsets = self._offsets
+        neighbors = self._neighbors
+        for v in range(self._vertex_count):
+            for i in range(offsets[v], offsets[v + 1]):
+                n = neighbors[i]
+                if v < n:
+                    yield v, n
+
+    def to_graph(self) -> Graph:
+        return Graph.from_adjacency_lists([self.neighbors(v).tolist() for v in range(self._vertex_count)])
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        offsets = array("q", [0])
+        neighbors = array("i")
+        for v in range(graph.vertex_count):
+            neighbors.extend(sorted(set(graph.neighbors(v))))
+            offsets.append(len(neighbors))
+        return cls(offsets, neighbors)
+
+    @classmethod
+    def from_edges(cls, vertex_count: int, edges: Iterable[tuple[int, int]]) -> "CSRGraph":
+        # same rules as Graph.add_edge: self loops and unknown vertices are ignored,
+        # duplicate edges (in either direction) are stored once
+        sources = array("i")
+        targets = array("i")
+        for first_vertex, second_vertex in edges:
+            if first_vertex == second_vertex:
+                continue
+            if not (0 <= first_vertex < vertex_count and 0 <= second_vertex < vertex_count):
+                continue
+            sources.append(first_vertex)
+            targets.append(second_vertex)
+
+        return cls.from_edge_arrays(vertex_count, sources, targets)
+
+    @classmethod
+    def from_edge_arrays(cls, vertex_count: int, sources: array, targets: array) -> "CSRGraph":
+        # bulk form of from_edges for loaders that already hold the endpoints in
+        # two parallel int arrays; self loops and duplicates are dropped, but
+        # out-of-range vertices are an error here
+        if len(sources) != len(targets):
+            raise ValueError("Source and target arrays must have the same length.")
+        if np is not None:
+            offsets, neighbors = _build_rows_numpy(vertex_count, sources, targets)
+        else:
+            offsets, neighbors = _build_rows(vertex_count, sources, targets)
+        return cls(offsets, neighbors)
+
+
+def _check_endpoints(vertex_count: int, lowest: int, highest: int) -> None:
+    if lowest < 0 or highest >= vertex_count:
+        raise ValueError(f"Edge endpoints must be between 0 and {vertex_count - 1}.")
+
+
+def _build_rows_numpy(vertex_count: int, sources, targets) -> tuple[array, array]:
+    # both edge directions as one int64 key per entry (row * vertex_count + column);
+    # sorting the keys orders every row, and duplicates end up next to each other
+    first = np.asarray(sources, dtype=np.int64)
+    second = np.asarray(targets, dtype=np.int64)
+    if len(first):
+        _check_endpoints(vertex_count, int(min(first.min(), second.min())), int(max(first.max(), second.max())))
+    keep = first != second
+    first = first[keep]
+    second = second[keep]
+
+    keys = np.concatenate((first * vertex_count + second, second * vertex_count + first))
+    keys.sort()
+    if len(keys):
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    rows = keys // vertex_count if vertex_count else keys
+    columns = keys - rows * vertex_count
+
+    offsets = np.zeros(vertex_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=vertex_count), out=offsets[1:])
+    return array("q", offsets.tobytes()), array("i", columns.astype(np.int32).tobytes())
+
+
+def _build_rows(vertex_count: int, sources, targets) -> tuple[array, array]:
+    # pure Python fallback of _build_rows_numpy
+    if sources:
+        _check_endpoints(vertex_count, min(min(sources), min(targets)), max(max(sources), max(targets)))
+
+    degrees = array("q", bytes(8 * (vertex_count + 1)))
+    for first_vertex, second_vertex in zip(sources, targets):
+        if first_vertex != second_vertex:
+            degrees[first_vertex + 1] += 1
+            degrees[second_vertex + 1] += 1
+
+    offsets = degrees
+    for v in range(vertex_count):
+        offsets[v + 1] += offsets[v]
+
+    # counting sort of both edge directions into place
+    neighbors = array("i", bytes(4 * offsets[vertex_count]))
+    fill = array("q", offsets[:vertex_count])
+    for first_vertex, second_vertex in zip(sources, targets):
+        if first_vertex == second_vertex:
+            continue
+        neighbors[fill[first_vertex]] = second_vertex
+        fill[first_vertex] += 1
+        neighbors[fill[second_vertex]] = first_vertex
+        fill[second_vertex] += 1
+    del fill
+
+    # sort and deduplicate each row, compacting the arrays in place
+    write = 0
+    start = 0
+    for v in range(vertex_count):
+        end = offsets[v + 1]
+        row = sorted(set(neighbors[start:end]))
+        offsets[v] = write
+        neighbors[write:write + len(row)] = array("i", row)
+        write += len(row)
+        start = end
+    offsets[vertex_count] = write
+    del neighbors[write:]
+    return offsets, neighbors
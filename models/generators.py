@@ -0,0 +1,154 @@
+import math
+import random
+from array import array
+from typing import Iterator
+
+from models.csr_graph import CSRGraph
+
+# seeded random graph generators; each runs in O(n + m) expected time and
+# builds the CSRGraph directly from endpoint arrays
+
+
+def _build(vertex_count: int, pairs: Iterator[tuple[int, int]]) -> CSRGraph:
+    sources = array("i")
+    targets = array("i")
+    for first_vertex, second_vertex in pairs:
+        sources.append(first_vertex)
+        targets.append(second_vertex)
+    return CSRGraph.from_edge_arrays(vertex_count, sources, targets)
+
+
+def _gnp_pairs(n: int, p: float, rng: random.Random) -> Iterator[tuple[int, int]]:
+    # Batagelj & Brandes geometric skipping: jump straight to the next chosen
+    # pair (w, v), w < v, instead of flipping a coin for each of the n^2 / 2 pairs
+    if p <= 0 or n < 2:
+        return
+    if p >= 1:
+        for v in range(1, n):
+            for w in range(v):
+                yield w, v
+        return
+
+    log_q = math.log(1.0 - p)
+    v = 1
+    w = -1
+    while v < n:
+        w += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            yield w, v
+
+
+def gnp_graph(n: int, p: float, seed: int | None = None) -> CSRGraph:
+    if not (0.0 <= p <= 1.0):
+        raise ValueError("Edge probability must be between 0 and 1.")
+    return _build(n, _gnp_pairs(n, p, random.Random(seed)))
+
+
+def gnm_graph(n: int, m: int, seed: int | None = None) -> CSRGraph:
+    max_edges = n * (n - 1) // 2
+    if not (0 <= m <= max_edges):
+        raise ValueError(f"Number of edges must be between 0 and {max_edges}.")
+
+    rng = random.Random(seed)
+
+    def pairs() -> Iterator[tuple[int, int]]:
+        # sample m distinct pair indices and decode index k into (w, v), w < v,
+        # with k = v * (v - 1) / 2 + w
+        for k in rng.sample(range(max_edges), m):
+            v = (1 + math.isqrt(1 + 8 * k)) // 2
+            yield k - v * (v - 1) // 2, v
+
+    return _build(n, pairs())
+
+
+def random_geometric_graph(
+    n: int,
+    radius: float,
+    seed: int | None = None
+) -> tuple[CSRGraph, list[tuple[float, float]]]:
+    # n points uniform in the unit square, joined when closer than `radius`;
+    # returns the points too, so callers can draw the graph in place
+    if radius <= 0:
+        raise ValueError("Radius must be > 0.")
+
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+
+    # bucket points into radius-sized cells so only neighboring cells are compared
+    cells: dict[tuple[int, int], list[int]] = {}
+    for v, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(v)
+
+    def pairs() -> Iterator[tuple[int, int]]:
+        radius_squared = radius * radius
+        for (cx, cy), members in cells.items():
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    others = cells.get((cx + dx, cy + dy))
+                    if others is None:
+                        continue
+                    for v in members:
+                        vx, vy = points[v]
+                        for u in others:
+                            if v < u:
+                                ux, uy = points[u]
+                                if (vx - ux) ** 2 + (vy - uy) ** 2 <= radius_squared:
+                                    yield v, u
+
+    return _build(n, pairs()), points
+
+
+def barabasi_albert_graph(n: int, m: int, seed: int | None = None) -> CSRGraph:
+    # preferential attachment: every new vertex links to m distinct existing
+    # vertices, picked with probability proportional to their degree
+    if not (1 <= m < n):
+        raise ValueError("Need 1 <= m < n.")
+
+    rng = random.Random(seed)
+
+    def pairs() -> Iterator[tuple[int, int]]:
+        # every endpoint appears once per incident edge, so uniform picks from
+        # it are degree-proportional
+        endpoints: list[int] = []
+        targets = list(range(m))
+        for v in range(m, n):
+            for target in targets:
+                yield target, v
+            endpoints.extend(targets)
+            endpoints.extend([v] * m)
+
+            chosen: set[int] = set()
+            while len(chosen) < m:
+                chosen.add(rng.choice(endpoints))
+            targets = list(chosen)
+
+    return _build(n, pairs())
+
+
+def planted_partition_graph(
+    n: int,
+    k: int,
+    p: float,
+    seed: int | None = None
+) -> tuple[CSRGraph, list[int]]:
+    # random k-partite graph: vertices get hidden classes and only pairs from
+    # different classes are kept (each with probability p), so the returned
+    # classes are a proper k-coloring
+    if k < 1:
+        raise ValueError("Number of classes must be >= 1.")
+    if not (0.0 <= p <= 1.0):
+        raise ValueError("Edge probability must be between 0 and 1.")
+
+    rng = random.Random(seed)
+    classes = [v % k for v in range(n)]
+    rng.shuffle(classes)
+
+    pairs = (
+        (w, v)
+        for w, v in _gnp_pairs(n, p, rng)
+        if classes[w] != classes[v]
+    )
+    return _build(n, pairs), classes
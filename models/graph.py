@@ -12,6 +12,17 @@ class Graph:
     def adjacency_list(self) -> {}:
         return self._adjacency_list
 
+    def neighbors(self, vertex: int) -> list[int]:
+        return self._adjacency_list[vertex]
+
+    @classmethod
+    def from_adjacency_lists(cls, adjacency_lists: list[list[int]]) -> "Graph":
+        # bulk constructor for already symmetric, duplicate-free neighbor lists
+        # (e.g. CSRGraph.to_graph); skips add_edge's per-edge membership checks
+        graph = cls()
+        graph._adjacency_list = {v: list(neighbors) for v, neighbors in enumerate(adjacency_lists)}
+        graph._vertex_count = len(adjacency_lists)
+        return graph
 
     def _is_same_vertex(self, first_vertex : int, second_vertex: int) -> bool:
         return first_vertex == second_vertex
@@ -0,0 +1,130 @@
+import json
+import multiprocessing
+import os
+import select
+import subprocess
+import sys
+import time
+
+import pytest
+
+from algorithms import batch_runner
+from algorithms.batch_runner import BatchJob, InvalidJob, iter_jobs, main, run_batch
+from models.generators import planted_partition_graph
+from utils.dimacs import write_dimacs
+
+
+def write_graphs(directory, count: int) -> list[str]:
+    paths = []
+    for i in range(count):
+        graph, _ = planted_partition_graph(80, 3, 0.05, seed=i)
+        path = os.path.join(directory, f"planted_{i}.col")
+        write_dimacs(path, graph)
+        paths.append(path)
+    return paths
+
+
+def test_iter_jobs_reads_directories_and_jsonl(tmp_path):
+    paths = write_graphs(tmp_path, 2)
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(
+        json.dumps({"graph": paths[0], "num_colors": 4, "seed": 1}) + "\n\n"
+        + json.dumps({"job_id": "second", "graph": paths[1]}) + "\n"
+    )
+
+    from_directory = list(iter_jobs(str(tmp_path), {"num_colors": 3}))
+    from_manifest = list(iter_jobs(str(manifest), {"num_colors": 3}))
+
+    assert [job.graph for job in from_directory] == paths
+    assert [(job.job_id, job.num_colors, job.seed) for job in from_manifest] == \
+        [("planted_0.col", 4, 1), ("second", 3, None)]
+
+    manifest.write_text(json.dumps({"graph": paths[0], "colors": 3}) + "\n")
+    (invalid,) = iter_jobs(str(manifest))
+    assert isinstance(invalid, InvalidJob)
+    assert "line 1" in invalid.error and "colors" in invalid.error
+
+
+def test_run_batch_reuses_workers_and_survives_bad_jobs(tmp_path):
+    paths = write_graphs(tmp_path, 3)
+    jobs = [BatchJob(job_id=str(i), graph=path, num_colors=3, seed=i) for i, path in enumerate(paths)]
+    jobs.append(BatchJob(job_id="missing", graph=str(tmp_path / "missing.col"), num_colors=3))
+
+    results = {result["job_id"]: result for result in run_batch(jobs, max_workers=2)}
+
+    assert [results[str(i)]["status"] for i in range(3)] == ["solved"] * 3
+    assert results["missing"]["status"] == "error"
+    assert "FileNotFoundError" in results["missing"]["error"]
+
+
+def test_bad_jsonl_line_does_not_stop_the_batch(tmp_path):
+    paths = write_graphs(tmp_path, 2)
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(
+        json.dumps({"job_id": "first", "graph": paths[0], "num_colors": 3, "seed": 0}) + "\n"
+        + "{not json\n"
+        + json.dumps({"job_id": "no-colors", "graph": paths[0]}) + "\n"
+        + json.dumps({"job_id": "last", "graph": paths[1], "num_colors": 3, "seed": 1}) + "\n"
+    )
+
+    results = list(run_batch(iter_jobs(str(manifest)), max_workers=1))
+    by_status = {}
+    for result in results:
+        by_status.setdefault(result["status"], []).append(result)
+
+    assert sorted(result["job_id"] for result in by_status["solved"]) == ["first", "last"]
+    assert [result["error"].split(":")[0] for result in by_status["error"]] == [f"{manifest}, line 2",
+                                                                                 f"{manifest}, line 3"]
+
+
+def _crash_or_hang(job: BatchJob) -> dict:
+    if job.job_id == "crash":
+        os._exit(3)
+    if job.job_id == "hang":
+        time.sleep(60)
+    return {"job_id": job.job_id, "status": "solved"}
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="workers only see the patched solver when forked")
+def test_run_batch_replaces_crashed_and_hung_workers(monkeypatch):
+    monkeypatch.setattr(batch_runner, "_solve_job", _crash_or_hang)
+    jobs = [
+        BatchJob(job_id="crash", graph="g", num_colors=1),
+        BatchJob(job_id="hang", graph="g", num_colors=1, timeout=0.1),
+        BatchJob(job_id="after", graph="g", num_colors=1),
+    ]
+
+    results = {result["job_id"]: result for result in run_batch(jobs, max_workers=1, timeout_grace=0.2)}
+
+    assert results["crash"]["status"] == "crashed"
+    assert results["hang"]["status"] == "timeout"
+    assert results["after"]["status"] == "solved"
+
+
+def test_main_streams_jsonl_results(tmp_path, capsys):
+    write_graphs(tmp_path, 2)
+
+    code = main([str(tmp_path), "-k", "3", "--workers", "2"])
+    lines = capsys.readouterr().out.splitlines()
+
+    assert code == 0
+    assert sorted(json.loads(line)["job_id"] for line in lines) == ["planted_0.col", "planted_1.col"]
+
+
+def test_queue_mode_streams_results_before_stdin_closes(tmp_path):
+    (path,) = write_graphs(tmp_path, 1)
+    process = subprocess.Popen([sys.executable, "-m", "algorithms.batch_runner", "-", "-k", "3", "--workers", "2"],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        process.stdin.write(json.dumps({"job_id": "first", "graph": path, "seed": 0}) + "\n")
+        process.stdin.flush()
+
+        # stdin stays open: the result must still come out as soon as the job is done
+        readable, _, _ = select.select([process.stdout], [], [], 30)
+        assert readable, "no result before stdin was closed"
+        assert json.loads(process.stdout.readline())["job_id"] == "first"
+        assert process.poll() is None
+    finally:
+        process.stdin.close()
+        assert process.wait(timeout=30) == 0
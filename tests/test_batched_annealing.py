@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from algorithms.batched_annealing import BatchedSimulatedAnnealing
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+
+
+def create_random_graph(n: int, edge_prob: float) -> Graph:
+    g = Graph()
+    for _ in range(n):
+        g.add_vertex()
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            if random.random() < edge_prob:
+                g.add_edge(i, j)
+    return g
+
+
+def test_batched_conflicts_stay_consistent():
+    random.seed(8)
+    graph = create_random_graph(40, 0.2)
+
+    sa = BatchedSimulatedAnnealing(
+        graph=graph,
+        num_colors=3,
+        num_chains=16,
+        max_iteration=300,
+        initial_temp=2.0,
+        cooling_rate=0.99,
+        seed=8
+    )
+    for _ in range(300):
+        if sa.step():
+            break
+
+    assert np.array_equal(sa.conflicts, sa._count_conflicts(sa.colors))
+    assert np.array_equal(sa.best_conflicts, sa._count_conflicts(sa.best_colors))
+    assert (sa.best_conflicts <= sa.conflicts).all()
+
+
+def test_batched_run_colors_even_cycle():
+    n = 16
+    graph = CSRGraph.from_edges(n, [(i, (i + 1) % n) for i in range(n)])
+
+    sa = BatchedSimulatedAnnealing(
+        graph=graph,
+        num_colors=3,
+        num_chains=8,
+        max_iteration=5000,
+        initial_temp=2.0,
+        cooling_rate=0.999,
+        seed=1
+    )
+    best_state = sa.run()
+
+    assert best_state.num_conflicts == 0
+    assert best_state.num_conflicts == int(sa.best_conflicts.min())
+
+
+def test_scalar_engine_with_random_neighborhood_matches_batched_engine():
+    # an odd cycle cannot be 2-colored, so neither engine stops early; at a
+    # fixed temperature both sample the same distribution of conflict counts
+    # once they use the same move rule
+    n = 21
+    graph = CSRGraph.from_edges(n, [(i, (i + 1) % n) for i in range(n)])
+
+    batched = BatchedSimulatedAnnealing(graph, num_colors=2, num_chains=200, max_iteration=1500,
+                                        initial_temp=1.0, cooling_rate=1.0, seed=1)
+    batched_means = []
+    for i in range(1500):
+        batched.step()
+        if i >= 500:
+            batched_means.append(batched.conflicts.mean())
+
+    def scalar_mean(neighborhood: str) -> float:
+        random.seed(1)
+        samples = []
+        for _ in range(20):
+            coloring = Coloring(graph, 2)
+            coloring.randomize()
+            sa = SimulatedAnnealing(graph, coloring, max_iteration=1500, initial_temp=1.0,
+                                    cooling_rate=1.0, neighborhood=neighborhood)
+            sa.run()
+            samples.extend(sa.conflicts_history.tolist()[500:])
+        return sum(samples) / len(samples)
+
+    assert abs(scalar_mean("random") - np.mean(batched_means)) < 0.5
+    # the default neighborhood only moves conflicting vertices and behaves differently
+    assert abs(scalar_mean("conflict") - np.mean(batched_means)) > 2
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from benchmarks.graph_families import FAMILIES, FAMILIES_VERSION, queen_graph
+from benchmarks.run_benchmarks import compare
+from models.coloring_state import Coloring
+from models.generators import planted_partition_graph
+
+
+def test_graph_families_are_reproducible():
+    builder, _ = FAMILIES["gnp_500_0.01"]
+    first = builder()
+    second = builder()
+
+    assert list(first.edges()) == list(second.edges())
+    assert queen_graph(4).edge_count == 76
+
+
+def test_planted_graph_is_solved_with_its_planted_colors():
+    random.seed(2)
+    graph, _ = planted_partition_graph(40, 3, 0.2, seed=2)
+    coloring = Coloring(graph, 3)
+    coloring.randomize()
+
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=20000, initial_temp=1.0, cooling_rate=0.9999)
+
+    assert graph.edge_count > 0
+    assert sa.run().num_conflicts == 0
+
+
+def test_compare_flags_only_regressions_beyond_tolerance():
+    baseline = {"results": {"g": {
+        "coloring_eval": {"evals_per_sec": 1000.0},
+        "sa_step": {"steps_per_sec": 1000.0},
+        "time_to_solution": {"seconds": 1.0, "solved": True},
+    }}}
+    current = {"results": {"g": {
+        "coloring_eval": {"evals_per_sec": 900.0},
+        "sa_step": {"steps_per_sec": 500.0},
+        "time_to_solution": {"seconds": 1.1, "solved": False},
+    }}}
+
+    regressions = compare(current, baseline, tolerance=0.2)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("g.sa_step.steps_per_sec")
+    assert regressions[1] == "g.time_to_solution: no longer solved"
+
+
+def test_compare_refuses_other_family_versions():
+    results = {"g": {"coloring_eval": {"evals_per_sec": 1000.0}, "sa_step": {"steps_per_sec": 1000.0},
+                     "time_to_solution": {"seconds": 1.0, "solved": True}}}
+    current = {"meta": {"families_version": FAMILIES_VERSION}, "results": results}
+
+    assert compare(current, {"meta": {"families_version": FAMILIES_VERSION}, "results": results}, 0.2) == []
+    # baselines recorded before the version was stored are version 1
+    with pytest.raises(ValueError):
+        compare(current, {"meta": {}, "results": results}, 0.2)
+
+
+def test_compare_refuses_other_budgets_and_seeds():
+    results = {"g": {"coloring_eval": {"evals_per_sec": 1000.0}, "sa_step": {"steps_per_sec": 1000.0},
+                     "time_to_solution": {"seconds": 1.0, "solved": True}}}
+    meta = {"families_version": FAMILIES_VERSION, "quick": True, "seed": 0}
+    current = {"meta": meta, "results": results}
+
+    assert compare(current, {"meta": dict(meta), "results": results}, 0.2) == []
+    with pytest.raises(ValueError, match="quick"):
+        compare(current, {"meta": {**meta, "quick": False}, "results": results}, 0.2)
+    with pytest.raises(ValueError, match="seed"):
+        compare(current, {"meta": {**meta, "seed": 1}, "results": results}, 0.2)
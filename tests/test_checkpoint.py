@@ -0,0 +1,76 @@
+import random
+import threading
+
+import pytest
+
+from algorithms.checkpoint import Checkpointer, resume, run_with_checkpoints, save_checkpoint
+from algorithms.cooling_schedules import GeometricCooling, StagnationReheating
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from models.generators import gnm_graph, gnp_graph
+from utils.history import HistoryRecorder
+
+
+def create_solver(graph, max_iteration=3000) -> SimulatedAnnealing:
+    random.seed(7)
+    coloring = Coloring(graph, 4)
+    coloring.randomize()
+    return SimulatedAnnealing(graph, coloring, max_iteration=max_iteration, initial_temp=2.0,
+                              schedule=StagnationReheating(GeometricCooling(0.999), patience=300),
+                              history=HistoryRecorder("every_nth", stride=10))
+
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path):
+    # too dense for 4 colors, so the run uses its whole iteration budget
+    graph = gnp_graph(60, 0.3, seed=1)
+
+    uninterrupted = create_solver(graph)
+    uninterrupted.run()
+
+    interrupted = create_solver(graph)
+    for _ in range(1234):
+        interrupted.step()
+    path = str(tmp_path / "run.ckpt")
+    save_checkpoint(path, interrupted)
+
+    random.seed(999)  # whatever happens in between must not matter
+    resumed = resume(path, graph)
+    assert resumed.iteration == 1234
+    resumed.run()
+
+    assert resumed.iteration == uninterrupted.iteration
+    assert resumed.temp == uninterrupted.temp
+    assert resumed.current_state.get_colors() == uninterrupted.current_state.get_colors()
+    assert resumed.best_state.get_colors() == uninterrupted.best_state.get_colors()
+    assert resumed.accepted_moves == uninterrupted.accepted_moves
+    assert list(resumed.conflicts_history) == list(uninterrupted.conflicts_history)
+
+
+def test_run_with_checkpoints_saves_when_stopped(tmp_path):
+    graph = gnp_graph(60, 0.3, seed=1)
+    sa = create_solver(graph, max_iteration=10 ** 9)
+    checkpointer = Checkpointer(str(tmp_path / "run.ckpt"), interval=0.0)
+
+    stop_event = threading.Event()
+    stop_event.set()
+    run_with_checkpoints(sa, checkpointer, stop_event)
+
+    assert checkpointer.saves == 1
+    assert resume(checkpointer.path, graph).iteration == sa.iteration
+    # the stopped run's clock stopped with it
+    elapsed = sa.stats().elapsed
+    assert sa.stats().elapsed == elapsed
+
+
+def test_resume_rejects_a_different_graph(tmp_path):
+    graph = gnp_graph(60, 0.3, seed=1)
+    path = str(tmp_path / "run.ckpt")
+    save_checkpoint(path, create_solver(graph))
+
+    with pytest.raises(ValueError):
+        resume(path, gnp_graph(60, 0.3, seed=2))
+    # same vertex and edge counts, different edges
+    with pytest.raises(ValueError):
+        resume(path, gnm_graph(60, graph.edge_count, seed=3))
+    # the same graph in Graph form is accepted
+    assert resume(path, graph.to_graph()).iteration == 0
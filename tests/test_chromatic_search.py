@@ -0,0 +1,62 @@
+import random
+
+from algorithms.chromatic_search import find_chromatic_number, greedy_coloring, remap_coloring
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+
+
+def create_random_graph(n: int, num_edges: int) -> CSRGraph:
+    return CSRGraph.from_edges(
+        n, [(random.randrange(n), random.randrange(n)) for _ in range(num_edges)]
+    )
+
+
+def test_greedy_coloring_is_valid():
+    random.seed(11)
+    graph = create_random_graph(40, 200)
+    coloring = Coloring(graph, max(greedy_coloring(graph)) + 1)
+    coloring.set_colors(greedy_coloring(graph))
+
+    assert coloring.num_conflicts == 0
+
+
+def test_remap_coloring_drops_one_color():
+    graph = CSRGraph.from_edges(4, [(0, 1), (1, 2), (2, 3)])
+    coloring = Coloring(graph, 3)
+    coloring.set_colors([0, 1, 0, 2])
+
+    remapped = remap_coloring(coloring, 2)
+
+    assert remapped.num_colors == 2
+    assert remapped.get_colors() == [0, 1, 0, 1]
+    assert remapped.num_conflicts == 0
+
+
+def test_find_chromatic_number_on_cycles():
+    random.seed(9)
+
+    even = CSRGraph.from_edges(10, [(i, (i + 1) % 10) for i in range(10)])
+    odd = CSRGraph.from_edges(9, [(i, (i + 1) % 9) for i in range(9)])
+
+    even_result = find_chromatic_number(even, max_iteration=5000, initial_temp=2.0, cooling_rate=0.999)
+    odd_result = find_chromatic_number(odd, max_iteration=2000, initial_temp=2.0, cooling_rate=0.999)
+
+    assert even_result.num_colors == 2
+    assert even_result.coloring.num_conflicts == 0
+    assert odd_result.num_colors == 3
+    assert odd_result.coloring.num_conflicts == 0
+    assert not odd_result.levels[-1].solved
+
+
+def test_find_chromatic_number_respects_iteration_budget():
+    random.seed(10)
+    graph = create_random_graph(60, 400)
+    greedy_num_colors = max(greedy_coloring(graph)) + 1
+
+    result = find_chromatic_number(graph, max_iteration=1000, initial_temp=2.0, cooling_rate=0.999,
+                                   upper_bound=greedy_num_colors - 2, iteration_budget=50)
+
+    assert sum(level.iterations for level in result.levels) <= 50
+    assert result.levels[0].num_colors == greedy_num_colors - 2
+    assert result.num_colors <= greedy_num_colors
+    assert result.coloring.num_conflicts == 0
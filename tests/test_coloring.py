@@ -1,5 +1,7 @@
 import  random
 
+import pytest
+
 from models.coloring_state import Coloring
 from models.graph import Graph
 
@@ -42,4 +44,177 @@ def test_modify_one_vertex_changes_at_least_one_color():
     coloring.modify_one_vertex()
     after = coloring.get_colors()
 
-    assert before != after
\ No newline at end of file
+    assert before != after
+
+def create_random_graph(n: int, edge_prob: float) -> Graph:
+    g = Graph()
+    for _ in range(n):
+        g.add_vertex()
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            if random.random() < edge_prob:
+                g.add_edge(i, j)
+    return g
+
+
+def count_conflicts(coloring: Coloring) -> int:
+    colors = coloring.get_colors()
+    return sum(
+        1
+        for v, neighbors in coloring.graph.adjacency_list.items()
+        for n in neighbors
+        if v < n and colors[v] == colors[n]
+    )
+
+
+def test_new_coloring_counts_conflicts_of_default_colors():
+    graph = create_triangle_graph()
+    coloring = Coloring(graph, num_colors=3)
+
+    assert coloring.num_conflicts == 3
+
+
+def test_incremental_conflicts_match_full_recount():
+    random.seed(1)
+
+    graph = create_random_graph(30, 0.3)
+    coloring = Coloring(graph, num_colors=4)
+    coloring.randomize()
+
+    for _ in range(500):
+        vertex = random.randint(0, graph.vertex_count - 1)
+        color = random.randint(0, coloring.num_colors - 1)
+
+        expected = coloring.num_conflicts + coloring.delta_if_recolored(vertex, color)
+        coloring.set_color(vertex, color)
+
+        assert coloring.num_conflicts == expected
+        assert coloring.num_conflicts == count_conflicts(coloring)
+
+
+def test_delta_if_recolored_does_not_apply_move():
+    graph = create_triangle_graph()
+    coloring = Coloring(graph, num_colors=3)
+
+    before = coloring.get_colors()
+
+    assert coloring.delta_if_recolored(0, 1) == -2
+    assert coloring.delta_if_recolored(0, 0) == 0
+    assert coloring.get_colors() == before
+    assert coloring.num_conflicts == 3
+
+
+def test_conflict_vertices_track_recolors():
+    random.seed(4)
+
+    graph = create_random_graph(30, 0.2)
+    coloring = Coloring(graph, num_colors=3)
+    coloring.randomize()
+
+    for _ in range(500):
+        coloring.modify_one_vertex()
+
+        colors = coloring.get_colors()
+        expected = {
+            v for v, neighbors in graph.adjacency_list.items()
+            if any(colors[v] == colors[n] for n in neighbors)
+        }
+        assert set(coloring.get_conflict_vertices()) == expected
+        assert coloring.num_conflict_vertices == len(expected)
+
+
+def test_modify_conflict_vertex_recolors_a_conflicting_vertex():
+    random.seed(5)
+
+    graph = create_triangle_graph()
+    graph.add_vertex()
+    coloring = Coloring(graph, num_colors=3)
+
+    coloring.modify_conflict_vertex()
+
+    assert coloring.get_color(3) == 0
+    assert coloring.num_conflicts == 1
+    assert coloring.random_conflict_vertex() in {0, 1, 2}
+
+
+def test_color_count_table_tracks_recolors():
+    random.seed(6)
+
+    graph = create_random_graph(30, 0.3)
+    coloring = Coloring(graph, num_colors=4, track_color_counts=True)
+    plain = Coloring(graph, num_colors=4)
+    coloring.randomize()
+    for v, color in enumerate(coloring.get_colors()):
+        plain.set_color(v, color)
+
+    for _ in range(300):
+        vertex = random.randint(0, graph.vertex_count - 1)
+        color = random.randint(0, 3)
+        assert coloring.delta_if_recolored(vertex, color) == plain.delta_if_recolored(vertex, color)
+        coloring.set_color(vertex, color)
+        plain.set_color(vertex, color)
+
+    for v in range(graph.vertex_count):
+        assert coloring.neighbor_color_counts(v) == plain.neighbor_color_counts(v)
+    assert coloring.num_conflicts == count_conflicts(coloring)
+
+
+def test_set_color_rejects_out_of_range_colors():
+    graph = create_triangle_graph()
+    coloring = Coloring(graph, num_colors=2, track_color_counts=True)
+    coloring.set_colors([0, 1, 0])
+    counts = [coloring.neighbor_color_counts(v) for v in range(3)]
+
+    for color in (2, -1):
+        with pytest.raises(ValueError):
+            coloring.set_color(1, color)
+
+    assert coloring.get_colors() == [0, 1, 0]
+    assert [coloring.neighbor_color_counts(v) for v in range(3)] == counts
+    assert coloring.num_conflicts == 1
+
+
+def test_best_conflict_move_reaches_valid_coloring_on_triangle():
+    random.seed(7)
+
+    graph = create_triangle_graph()
+    coloring = Coloring(graph, num_colors=3, track_color_counts=True)
+
+    vertex, color, delta = coloring.best_conflict_move()
+    assert delta == -2
+    coloring.set_color(vertex, color)
+
+    assert coloring.best_move_for(vertex)[1] == 0
+    vertex, color, delta = coloring.best_conflict_move()
+    assert delta == -1
+    coloring.set_color(vertex, color)
+
+    assert coloring.num_conflicts == 0
+    assert coloring.best_conflict_move() is None
+
+
+def test_best_conflict_move_skips_disallowed_moves():
+    graph = create_triangle_graph()
+    coloring = Coloring(graph, num_colors=2, track_color_counts=True)
+
+    move = coloring.best_conflict_move(is_allowed=lambda vertex, color: vertex == 1)
+
+    assert move == (1, 1, -2)
+
+
+def test_change_tracking_reports_recolored_vertices():
+    graph = create_triangle_graph()
+    coloring = Coloring(graph, num_colors=3)
+    coloring.enable_change_tracking()
+
+    assert coloring.pop_changed_vertices() == {0, 1, 2}
+    coloring.set_color(1, 2)
+    coloring.set_color(1, 2)
+    coloring.set_color(2, 0)  # same color: not a change
+    assert coloring.pop_changed_vertices() == {1}
+    assert coloring.pop_changed_vertices() == set()
+    assert not coloring.copy().tracks_changes
+
+    coloring.set_colors([1, 1, 1])
+    assert coloring.pop_changed_vertices() == {0, 1, 2}
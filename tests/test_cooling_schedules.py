@@ -0,0 +1,79 @@
+import math
+import random
+
+import pytest
+
+from algorithms.cooling_schedules import (
+    AdaptiveCooling,
+    CoolingSchedule,
+    GeometricCooling,
+    LinearCooling,
+    LogarithmicCooling,
+    LundyMeesCooling,
+    StagnationReheating,
+)
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+
+
+def cool(schedule, initial_temp: float, steps: int, accepted: bool = True) -> list[float]:
+    schedule.reset(initial_temp)
+    temps = [initial_temp]
+    for i in range(steps):
+        temps.append(schedule.next_temp(temps[-1], i, accepted, False))
+    return temps
+
+
+def test_basic_schedules_decrease_temperature():
+    assert cool(GeometricCooling(0.5), 8.0, 3) == [8.0, 4.0, 2.0, 1.0]
+    assert cool(LinearCooling(3.0), 8.0, 3) == [8.0, 5.0, 2.0, 0.0]
+    assert cool(LundyMeesCooling(1.0), 1.0, 2) == [1.0, 0.5, 0.5 / 1.5]
+
+    log_temps = cool(LogarithmicCooling(alpha=1.0), 10.0, 3)
+    assert log_temps[1] == pytest.approx(10.0 / (1 + math.log(2)))
+    assert log_temps == sorted(log_temps, reverse=True)
+
+
+def test_adaptive_cooling_follows_acceptance_rate():
+    schedule = AdaptiveCooling(fast_rate=0.9, slow_rate=0.99, window=10)
+
+    cool(schedule, 10.0, 10, accepted=True)
+    assert schedule.cooling_rate == 0.9
+
+    cool(schedule, 10.0, 10, accepted=False)
+    assert schedule.cooling_rate == 0.99
+
+
+def test_invalid_parameters_are_rejected():
+    with pytest.raises(ValueError):
+        GeometricCooling(1.5)
+    with pytest.raises(ValueError):
+        StagnationReheating(GeometricCooling(0.9), patience=0)
+    with pytest.raises(ValueError):
+        StagnationReheating(GeometricCooling(0.9), patience=10, min_temp=0.0005)
+    with pytest.raises(TypeError):
+        CoolingSchedule()
+
+
+def test_reheating_spends_the_whole_iteration_budget():
+    random.seed(12)
+    # an odd cycle cannot be 2-colored, so only the budget can end the run
+    graph = CSRGraph.from_edges(9, [(i, (i + 1) % 9) for i in range(9)])
+    coloring = Coloring(graph, 2)
+    coloring.randomize()
+
+    schedule = StagnationReheating(GeometricCooling(0.9), patience=50)
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=2000, initial_temp=5.0, schedule=schedule)
+    sa.run()
+
+    assert sa.iteration == 2000
+    assert schedule.reheats > 0
+    assert sa.best_state.num_conflicts == 1
+
+
+def test_sa_requires_cooling_rate_or_schedule():
+    graph = CSRGraph.from_edges(2, [(0, 1)])
+
+    with pytest.raises(ValueError):
+        SimulatedAnnealing(graph, Coloring(graph, 2), max_iteration=10, initial_temp=1.0)
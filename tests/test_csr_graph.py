@@ -0,0 +1,85 @@
+import random
+from array import array
+
+import pytest
+
+from models import csr_graph
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+
+
+def create_triangle_graph() -> Graph:
+    g = Graph()
+    for _ in range(3):
+        g.add_vertex()
+
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(0, 2)
+    return g
+
+
+def test_from_graph_keeps_adjacency():
+    csr = CSRGraph.from_graph(create_triangle_graph())
+
+    assert csr.vertex_count == 3
+    assert csr.edge_count == 3
+    assert list(csr.neighbors(0)) == [1, 2]
+    assert list(csr.neighbors(2)) == [0, 1]
+    assert sorted(csr.edges()) == [(0, 1), (0, 2), (1, 2)]
+
+
+def test_from_edges_drops_loops_duplicates_and_unknown_vertices():
+    csr = CSRGraph.from_edges(4, [(0, 1), (1, 0), (2, 2), (1, 3), (3, 1), (0, 7)])
+
+    assert csr.edge_count == 2
+    assert list(csr.neighbors(0)) == [1]
+    assert list(csr.neighbors(1)) == [0, 3]
+    assert list(csr.neighbors(2)) == []
+    assert csr.degree(3) == 1
+
+
+def test_coloring_on_csr_matches_coloring_on_graph():
+    random.seed(2)
+
+    graph = Graph()
+    for _ in range(25):
+        graph.add_vertex()
+    for _ in range(80):
+        graph.add_edge(random.randint(0, 24), random.randint(0, 24))
+    csr = CSRGraph.from_graph(graph)
+
+    coloring = Coloring(graph, num_colors=3)
+    csr_coloring = Coloring(csr, num_colors=3)
+    coloring.randomize()
+    for v, color in enumerate(coloring.get_colors()):
+        csr_coloring.set_color(v, color)
+
+    assert csr_coloring.num_conflicts == coloring.num_conflicts
+
+    for _ in range(200):
+        vertex = random.randint(0, 24)
+        color = random.randint(0, 2)
+        assert csr_coloring.delta_if_recolored(vertex, color) == coloring.delta_if_recolored(vertex, color)
+        coloring.set_color(vertex, color)
+        csr_coloring.set_color(vertex, color)
+        assert csr_coloring.num_conflicts == coloring.num_conflicts
+
+
+def test_numpy_and_python_row_builders_agree():
+    pytest.importorskip("numpy")
+    rng = random.Random(4)
+    # plenty of duplicates (in both directions) and self loops
+    sources = array("i", (rng.randrange(50) for _ in range(2000)))
+    targets = array("i", (rng.randrange(50) for _ in range(2000)))
+
+    fast_offsets, fast_neighbors = csr_graph._build_rows_numpy(50, sources, targets)
+    slow_offsets, slow_neighbors = csr_graph._build_rows(50, sources, targets)
+
+    assert fast_offsets == slow_offsets
+    assert fast_neighbors == slow_neighbors
+    assert csr_graph._build_rows_numpy(0, array("i"), array("i")) == (array("q", [0]), array("i"))
+    for build in (csr_graph._build_rows_numpy, csr_graph._build_rows):
+        with pytest.raises(ValueError):
+            build(3, array("i", [0]), array("i", [3]))
@@ -0,0 +1,82 @@
+import pytest
+
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from utils.dimacs import read_coloring, read_dimacs, write_coloring, write_dimacs
+
+TRIANGLE_WITH_TAIL = """c triangle 1-2-3 plus edge 3-4
+c duplicate edges are stored once
+p edge 4 5
+e 1 2
+e 2 3
+e 1 3
+e 3 4
+e 2 1
+"""
+
+
+def test_read_dimacs(tmp_path):
+    path = tmp_path / "graph.col"
+    path.write_text(TRIANGLE_WITH_TAIL)
+
+    graph = read_dimacs(str(path))
+
+    assert graph.vertex_count == 4
+    assert sorted(graph.edges()) == [(0, 1), (0, 2), (1, 2), (2, 3)]
+
+
+@pytest.mark.parametrize("name", ["graph.col", "graph.col.gz"])
+def test_write_then_read_round_trip(tmp_path, name):
+    graph = CSRGraph.from_edges(50, [(i, (i * 7 + 3) % 50) for i in range(50)])
+    path = str(tmp_path / name)
+
+    write_dimacs(path, graph, comment="generated")
+    loaded = read_dimacs(path)
+
+    assert loaded.vertex_count == graph.vertex_count
+    assert list(loaded.edges()) == list(graph.edges())
+
+
+def test_read_dimacs_accepts_indented_lines(tmp_path):
+    path = tmp_path / "graph.col"
+    path.write_text("  c indented comment\n p edge 3 2\ne 1 2\n\t c another\n  e 2 3\n")
+
+    graph = read_dimacs(str(path))
+
+    assert graph.vertex_count == 3
+    assert sorted(graph.edges()) == [(0, 1), (1, 2)]
+
+
+def test_read_dimacs_rejects_bad_input(tmp_path):
+    missing_header = tmp_path / "missing.col"
+    missing_header.write_text("e 1 2\n")
+    out_of_range = tmp_path / "range.col"
+    out_of_range.write_text("p edge 2 1\ne 1 3\n")
+
+    with pytest.raises(ValueError):
+        read_dimacs(str(missing_header))
+    with pytest.raises(ValueError):
+        read_dimacs(str(out_of_range))
+
+
+def test_coloring_round_trip(tmp_path):
+    path = tmp_path / "graph.col"
+    path.write_text(TRIANGLE_WITH_TAIL)
+    graph = read_dimacs(str(path))
+    coloring = Coloring(graph, 3)
+    coloring.set_colors([0, 1, 2, 0])
+
+    solution_path = str(tmp_path / "graph.sol")
+    write_coloring(solution_path, coloring)
+    loaded = read_coloring(solution_path, graph, num_colors=3)
+
+    assert loaded.get_colors() == [0, 1, 2, 0]
+    assert loaded.num_conflicts == 0
+    assert "s col 3" in open(solution_path).read()
+
+    # the header counts color indices, not distinct colors
+    coloring = Coloring(graph, 4)
+    coloring.set_colors([0, 3, 3, 0])
+    write_coloring(solution_path, coloring)
+    assert "s col 4" in open(solution_path).read()
+    assert read_coloring(solution_path, graph).num_colors == 4
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from gui.frame_stepper import FrameStepper
+from models.coloring_state import Coloring
+from models.generators import gnp_graph
+
+
+def create_solver(max_iteration: int = 10 ** 9) -> SimulatedAnnealing:
+    random.seed(0)
+    graph = gnp_graph(100, 0.3, seed=1)
+    coloring = Coloring(graph, 3)
+    coloring.randomize()
+    return SimulatedAnnealing(graph, coloring, max_iteration=max_iteration, initial_temp=1.0,
+                              cooling_rate=1.0, record_history=False)
+
+
+class FakeClock:
+    # advances by `tick` seconds on every reading (binary fractions keep the
+    # sums exact)
+
+    def __init__(self, tick: float):
+        self.now = 0.0
+        self.tick = tick
+
+    def __call__(self) -> float:
+        self.now += self.tick
+        return self.now
+
+
+def test_advance_fills_the_frame_budget():
+    sa = create_solver()
+    # 1 s frames, 1/8 s per clock reading: the eighth check reaches the deadline
+    stepper = FrameStepper(sa, target_fps=1, clock=FakeClock(0.125))
+
+    assert not stepper.advance()
+
+    assert stepper.last_frame_steps == 8 * FrameStepper.CLOCK_CHECK_INTERVAL
+    assert sa.iteration == stepper.last_frame_steps
+
+
+def test_advance_respects_step_limit_and_render_time():
+    sa = create_solver()
+    stepper = FrameStepper(sa, target_fps=1, max_steps_per_frame=1, clock=FakeClock(0.125))
+    stepper.advance()
+    stepper.advance()
+    assert sa.iteration == 2
+
+    # the solver gets what the last render left of the frame, but at least 1/4 of it
+    stepper = FrameStepper(sa, target_fps=1, min_solver_share=0.25, clock=FakeClock(0.125))
+    stepper.advance()
+    assert stepper.last_frame_steps == 8 * FrameStepper.CLOCK_CHECK_INTERVAL
+    stepper.report_render_time(0.5)
+    stepper.advance()
+    assert stepper.last_frame_steps == 4 * FrameStepper.CLOCK_CHECK_INTERVAL
+    stepper.report_render_time(5.0)
+    stepper.advance()
+    assert stepper.last_frame_steps == 2 * FrameStepper.CLOCK_CHECK_INTERVAL
+
+
+def test_next_frame_delay_accounts_for_elapsed_time():
+    clock = FakeClock(0.0)
+    stepper = FrameStepper(create_solver(), target_fps=4, clock=clock)
+
+    clock.now = 0.125
+    assert stepper.next_frame_delay_ms(0.0) == 125
+    clock.now = 0.5
+    assert stepper.next_frame_delay_ms(0.0) == 1
+
+
+def test_advance_reports_finished_run():
+    stepper = FrameStepper(create_solver(max_iteration=100), target_fps=1)
+
+    assert stepper.advance()
+    assert stepper.last_frame_steps == 101
+    with pytest.raises(ValueError):
+        FrameStepper(create_solver(), target_fps=0)
@@ -0,0 +1,66 @@
+import pytest
+
+from models.coloring_state import Coloring
+from models.generators import (
+    barabasi_albert_graph,
+    gnm_graph,
+    gnp_graph,
+    planted_partition_graph,
+    random_geometric_graph,
+)
+
+
+def test_gnp_is_seeded_and_has_expected_density():
+    first = gnp_graph(2000, 0.01, seed=1)
+    second = gnp_graph(2000, 0.01, seed=1)
+
+    expected = 0.01 * 2000 * 1999 / 2
+    assert list(first.edges()) == list(second.edges())
+    assert abs(first.edge_count - expected) < 0.1 * expected
+
+
+def test_gnp_extremes():
+    assert gnp_graph(10, 0.0, seed=1).edge_count == 0
+    assert gnp_graph(10, 1.0, seed=1).edge_count == 45
+
+
+def test_gnm_has_exact_edge_count():
+    graph = gnm_graph(100, 300, seed=2)
+
+    assert graph.edge_count == 300
+    assert gnm_graph(5, 10, seed=2).edge_count == 10
+    with pytest.raises(ValueError):
+        gnm_graph(5, 11)
+
+
+def test_random_geometric_edges_respect_radius():
+    graph, points = random_geometric_graph(300, 0.1, seed=3)
+
+    for v, u in graph.edges():
+        assert (points[v][0] - points[u][0]) ** 2 + (points[v][1] - points[u][1]) ** 2 <= 0.01
+    assert graph.edge_count > 0
+
+
+def test_barabasi_albert_edge_count():
+    graph = barabasi_albert_graph(200, 3, seed=4)
+
+    assert graph.edge_count == 3 * (200 - 3)
+    assert min(graph.degree(v) for v in range(200)) >= 3
+
+
+def test_planted_partition_classes_are_a_proper_coloring():
+    graph, classes = planted_partition_graph(300, 4, 0.05, seed=5)
+
+    coloring = Coloring(graph, 4)
+    coloring.set_colors(classes)
+
+    assert graph.edge_count > 0
+    assert coloring.num_conflicts == 0
+
+
+def test_to_graph_keeps_adjacency():
+    csr = gnp_graph(50, 0.2, seed=6)
+    graph = csr.to_graph()
+
+    assert graph.vertex_count == 50
+    assert all(sorted(graph.neighbors(v)) == list(csr.neighbors(v)) for v in range(50))
@@ -0,0 +1,71 @@
+import os
+import pickle
+
+import pytest
+
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from utils.dimacs import write_dimacs
+from utils.graph_cache import MappedCSRGraph, load_csr, load_dimacs_cached, save_csr
+
+
+def create_graph() -> CSRGraph:
+    return CSRGraph.from_edges(30, [(i, (i * 5 + 1) % 30) for i in range(30)] + [(0, 29)])
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_then_load_round_trip(tmp_path, use_mmap):
+    graph = create_graph()
+    path = str(tmp_path / "graph.gcsr")
+
+    save_csr(path, graph)
+    loaded = load_csr(path, use_mmap=use_mmap)
+
+    assert isinstance(loaded, MappedCSRGraph) == use_mmap
+    assert loaded.vertex_count == graph.vertex_count
+    assert list(loaded.edges()) == list(graph.edges())
+    assert Coloring(loaded, 3).num_conflicts == Coloring(graph, 3).num_conflicts
+
+
+def test_mapped_graph_pickles_by_path(tmp_path):
+    path = str(tmp_path / "graph.gcsr")
+    save_csr(path, create_graph())
+    loaded = load_csr(path)
+
+    data = pickle.dumps(loaded)
+
+    assert len(data) < 200
+    assert list(pickle.loads(data).edges()) == list(loaded.edges())
+
+
+def test_load_csr_rejects_corrupt_files(tmp_path):
+    path = tmp_path / "graph.gcsr"
+    save_csr(str(path), create_graph())
+    path.write_bytes(path.read_bytes()[:-4])
+
+    with pytest.raises(ValueError):
+        load_csr(str(path))
+
+    path.write_bytes(b"not a graph")
+    with pytest.raises(ValueError):
+        load_csr(str(path))
+
+
+def test_dimacs_is_parsed_once_and_reparsed_on_change(tmp_path):
+    text_path = str(tmp_path / "graph.col")
+    cache_dir = str(tmp_path / "cache")
+    write_dimacs(text_path, create_graph())
+
+    first = load_dimacs_cached(text_path, cache_dir)
+    cache_files = os.listdir(cache_dir)
+    second = load_dimacs_cached(text_path, cache_dir)
+
+    assert len(cache_files) == 1
+    assert os.listdir(cache_dir) == cache_files
+    assert list(second.edges()) == list(first.edges())
+
+    write_dimacs(text_path, CSRGraph.from_edges(3, [(0, 1)]))
+    changed = load_dimacs_cached(text_path, cache_dir)
+
+    assert changed.vertex_count == 3
+    assert len(os.listdir(cache_dir)) == 2
@@ -0,0 +1,68 @@
+import pytest
+
+from utils.history import HistoryRecorder
+
+
+def record_all(recorder: HistoryRecorder, conflicts: list[int]) -> HistoryRecorder:
+    for i, value in enumerate(conflicts):
+        recorder.record(float(i), value)
+    return recorder
+
+
+def test_full_mode_keeps_every_sample_and_grows():
+    recorder = HistoryRecorder()
+    early_view = record_all(recorder, [5, 4, 3]).conflicts
+
+    record_all(recorder, list(range(3000)))
+
+    assert len(recorder) == 3003
+    assert recorder.conflicts[:3].tolist() == [5, 4, 3]
+    # views taken before the buffers grew stay valid
+    assert early_view.tolist() == [5, 4, 3]
+    assert early_view.readonly
+
+
+def test_ring_mode_keeps_last_samples():
+    recorder = record_all(HistoryRecorder("ring", capacity=4), list(range(11)))
+
+    assert recorder.conflicts.tolist() == [7, 8, 9, 10]
+    assert recorder.iterations.tolist() == [7, 8, 9, 10]
+    assert recorder.temperatures.tolist() == [7.0, 8.0, 9.0, 10.0]
+    assert recorder.samples_recorded == 11
+
+
+def test_every_nth_mode_doubles_stride_when_full():
+    recorder = record_all(HistoryRecorder("every_nth", capacity=4, stride=2), list(range(20)))
+
+    assert recorder.stride == 8
+    assert recorder.iterations.tolist() == [0, 8, 16]
+    assert len(recorder) <= 4
+
+
+def test_minmax_mode_keeps_bucket_extremes():
+    values = [3, 9, 1, 4, 4, 4, 0, 2]
+    recorder = record_all(HistoryRecorder("minmax", stride=4), values)
+
+    assert recorder.conflicts.tolist() == [9, 1, 4, 0]
+    assert recorder.iterations.tolist() == [1, 2, 4, 6]
+
+    # an open bucket is visible before it is complete
+    recorder.record(8.0, 7)
+    assert recorder.conflicts.tolist()[-2:] == [7, 7]
+
+
+def test_minmax_mode_merges_buckets_when_full():
+    values = [5, 1, 6, 2, 7, 0, 3, 3]
+    recorder = record_all(HistoryRecorder("minmax", capacity=4, stride=2), values)
+
+    assert recorder.stride == 8
+    assert recorder.conflicts.tolist() == [7, 0]
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        HistoryRecorder("ring")
+    with pytest.raises(ValueError):
+        HistoryRecorder("minmax", capacity=6)
+    with pytest.raises(ValueError):
+        HistoryRecorder("median")
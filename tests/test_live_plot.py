@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from gui.live_plot import LiveHistoryPlot
+from utils.history import HistoryRecorder
+
+
+def create_plot():
+    figure = Figure()
+    canvas = FigureCanvasAgg(figure)
+    ax_temp, ax_conf = figure.subplots(1, 2)
+    return LiveHistoryPlot(canvas, ax_temp, ax_conf), ax_temp, ax_conf
+
+
+def test_updates_blit_until_limits_must_grow():
+    plot, ax_temp, ax_conf = create_plot()
+    history = HistoryRecorder("every_nth", capacity=64)
+    history.record(10.0, 50)
+    plot.update(history.iterations, history.temperatures, history.conflicts)
+    redraws = plot.full_redraws
+
+    for i in range(1, 1000):
+        history.record(10.0 * 0.99 ** i, 50 - i // 100)
+        plot.update(history.iterations, history.temperatures, history.conflicts)
+
+    # x limits double, so 1000 iterations need only a handful of full redraws
+    assert plot.full_redraws - redraws <= 11
+    assert len(history) < 64
+    assert ax_temp.get_xlim()[1] >= 999
+    assert ax_conf.get_ylim()[1] >= 50
+
+
+def test_reset_clears_lines():
+    plot, ax_temp, ax_conf = create_plot()
+    plot.update([0, 1, 2], [3.0, 2.0, 1.0], [5, 4, 3])
+    plot.reset()
+
+    assert len(ax_temp.lines[0].get_xdata()) == 0
+    assert ax_conf.get_ylim() == (0, 1)
+    plot.update([], [], [])
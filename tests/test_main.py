@@ -0,0 +1,74 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from main import EXIT_ERROR, EXIT_SOLVED, EXIT_UNSOLVED, main
+from models.generators import planted_partition_graph
+from utils.dimacs import read_coloring, read_dimacs, write_dimacs
+
+
+def write_graph(tmp_path) -> str:
+    graph, _ = planted_partition_graph(120, 3, 0.05, seed=1)
+    path = str(tmp_path / "planted.col")
+    write_dimacs(path, graph)
+    return path
+
+
+def test_main_writes_solved_result_and_coloring(tmp_path):
+    graph_path = write_graph(tmp_path)
+    output_path = tmp_path / "result.json"
+    coloring_path = str(tmp_path / "result.sol")
+
+    code = main([graph_path, "-k", "3", "--seed", "5", "--output", str(output_path),
+                 "--coloring", coloring_path])
+    result = json.loads(output_path.read_text())
+
+    assert code == EXIT_SOLVED
+    assert result["solved"] and result["conflicts"] == 0
+    assert result["seed"] == 5
+    assert result["stats"]["iterations"] > 0
+    assert len(result["coloring"]) == result["vertices"] == 120
+    assert read_coloring(coloring_path, read_dimacs(graph_path)).num_conflicts == 0
+
+
+def test_main_exit_codes_for_unsolved_and_errors(tmp_path, capsys):
+    graph_path = write_graph(tmp_path)
+
+    assert main([graph_path, "-k", "1", "--seed", "0", "--max-iteration", "100"]) == EXIT_UNSOLVED
+    assert json.loads(capsys.readouterr().out)["solved"] is False
+    assert main([str(tmp_path / "missing.col"), "-k", "3"]) == EXIT_ERROR
+
+
+def test_main_resume_rejects_new_seed_and_other_colors(tmp_path, capsys):
+    graph_path = write_graph(tmp_path)
+    checkpoint = str(tmp_path / "run.ckpt")
+    assert main([graph_path, "-k", "1", "--seed", "0", "--max-iteration", "100",
+                 "--checkpoint", checkpoint]) == EXIT_UNSOLVED
+    capsys.readouterr()
+
+    for option in (["--seed", "1"], ["--max-iteration", "5000"], ["--initial-temp", "2"],
+                   ["--cooling-rate", "0.5"], ["--time-limit", "0.01"]):
+        with pytest.raises(SystemExit) as exit_info:
+            main([graph_path, "--checkpoint", checkpoint] + option)
+        assert exit_info.value.code == EXIT_ERROR
+        assert option[0] in capsys.readouterr().err
+    assert main([graph_path, "-k", "3", "--checkpoint", checkpoint]) == EXIT_ERROR
+    assert "does not match" in capsys.readouterr().err
+
+    # the same -k, or none at all, resumes the run
+    assert main([graph_path, "-k", "1", "--checkpoint", checkpoint]) == EXIT_UNSOLVED
+    assert main([graph_path, "--checkpoint", checkpoint]) == EXIT_UNSOLVED
+    assert json.loads(capsys.readouterr().out.splitlines()[-1])["num_colors"] == 1
+
+    with pytest.raises(SystemExit):
+        main([graph_path])
+
+
+def test_main_does_not_import_gui_code():
+    check = (
+        "import sys, main; "
+        "sys.exit(any(m.split('.')[0] in ('gui', 'tkinter', 'matplotlib') for m in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, "-c", check]).returncode == 0
@@ -0,0 +1,65 @@
+import threading
+
+from algorithms.multi_start import solve_many
+from algorithms.simulated_annealing import SimulatedAnnealing
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+
+
+def create_cycle_graph(n: int) -> CSRGraph:
+    return CSRGraph.from_edges(n, [(i, (i + 1) % n) for i in range(n)])
+
+
+def test_solve_many_is_reproducible_and_reports_runs():
+    graph = create_cycle_graph(12)
+
+    first = solve_many(graph, 3, num_runs=4, max_iteration=2000,
+                       initial_temp=5.0, cooling_rate=0.999, seed=11, max_workers=2)
+    second = solve_many(graph, 3, num_runs=4, max_iteration=2000,
+                        initial_temp=5.0, cooling_rate=0.999, seed=11, max_workers=2)
+
+    assert first.best_state.num_conflicts == 0
+
+    # runs may be cancelled early, but every run is reported with the same seed
+    first_seeds = {run.run_index: run.seed for run in first.runs}
+    second_seeds = {run.run_index: run.seed for run in second.runs}
+    assert first_seeds == second_seeds
+    assert sorted(first_seeds) == [0, 1, 2, 3]
+    assert len(set(first_seeds.values())) == len(first_seeds)
+    assert first.best_run in first_seeds
+
+
+def test_solve_many_reports_cancelled_runs():
+    graph = create_cycle_graph(12)
+
+    result = solve_many(graph, 3, num_runs=12, max_iteration=2000,
+                        initial_temp=5.0, cooling_rate=0.999, seed=5, max_workers=1)
+
+    assert [run.run_index for run in result.runs] == list(range(12))
+    never_started = [run for run in result.runs if run.num_conflicts is None]
+    assert never_started
+    assert all(run.cancelled and run.iterations == 0 for run in never_started)
+
+def test_solve_many_keeps_best_when_unsolvable():
+    # an odd cycle cannot be 2-colored, so every run finishes with >= 1 conflict
+    graph = create_cycle_graph(9)
+
+    result = solve_many(graph, 2, num_runs=3, max_iteration=300,
+                        initial_temp=2.0, cooling_rate=0.99, seed=3, max_workers=2)
+
+    assert len(result.runs) == 3
+    assert [run.run_index for run in result.runs] == [0, 1, 2]
+    assert result.best_state.num_conflicts == min(run.num_conflicts for run in result.runs)
+    assert not any(run.cancelled for run in result.runs)
+
+
+def test_sa_run_stops_when_event_is_set():
+    graph = create_cycle_graph(9)
+    coloring = Coloring(graph, 2)
+    stop_event = threading.Event()
+    stop_event.set()
+
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=100000, initial_temp=1000.0, cooling_rate=0.9999)
+    sa.run(stop_event=stop_event)
+
+    assert sa.iteration == SimulatedAnnealing.STOP_CHECK_INTERVAL
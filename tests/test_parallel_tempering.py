@@ -0,0 +1,34 @@
+from algorithms.parallel_tempering import ParallelTempering, geometric_ladder
+from models.csr_graph import CSRGraph
+
+
+def create_cycle_graph(n: int) -> CSRGraph:
+    return CSRGraph.from_edges(n, [(i, (i + 1) % n) for i in range(n)])
+
+
+def test_geometric_ladder_spans_range():
+    ladder = geometric_ladder(0.5, 8.0, 5)
+
+    assert len(ladder) == 5
+    assert ladder[0] == 0.5
+    assert abs(ladder[-1] - 8.0) < 1e-9
+    assert ladder == sorted(ladder)
+
+
+def test_parallel_tempering_colors_even_cycle():
+    graph = create_cycle_graph(20)
+
+    pt = ParallelTempering(
+        graph=graph,
+        num_colors=2,
+        temperatures=geometric_ladder(0.2, 2.0, 4),
+        max_rounds=50,
+        steps_per_round=500,
+        max_workers=2,
+        seed=1
+    )
+    best_state = pt.run()
+
+    assert best_state.num_conflicts == 0
+    assert pt.round <= 50
+    assert pt.swap_accepts <= pt.swap_attempts
@@ -2,6 +2,8 @@ import random
 from models.graph import Graph
 from models.coloring_state import Coloring
 from algorithms.simulated_annealing import SimulatedAnnealing
+from utils.history import HistoryRecorder
+from utils.instrumentation import SolverInstrumentation
 
 
 def create_triangle_graph() -> Graph:
@@ -41,4 +43,118 @@ def test_sa_reduces_conflicts_on_triangle():
     print("Initial conflicts:", initial_conflicts)
     print("Final conflicts:", final_conflicts)
 
-    assert 0 <= final_conflicts <= initial_conflicts
\ No newline at end of file
+    assert 0 <= final_conflicts <= initial_conflicts
+
+def test_sa_step_updates_current_state_in_place():
+    random.seed(3)
+
+    graph = create_triangle_graph()
+    initial_coloring = Coloring(graph, 2)
+    initial_coloring.randomize()
+
+    sa = SimulatedAnnealing(
+        graph=graph,
+        coloring_state=initial_coloring,
+        max_iteration=200,
+        initial_temp=10.0,
+        cooling_rate=0.99
+    )
+
+    while not sa.step():
+        assert sa.current_state is initial_coloring
+        assert sa.best_state is not sa.current_state
+
+    # a triangle always keeps one conflict with two colors
+    assert sa.best_state.num_conflicts == 1
+    assert sa.current_state.num_conflicts >= 1
+
+
+def test_sa_time_limit_stops_run_and_reports_stats():
+    random.seed(13)
+
+    # an odd cycle cannot be 2-colored, so only the deadline can end this run
+    graph = Graph()
+    for _ in range(9):
+        graph.add_vertex()
+    for i in range(9):
+        graph.add_edge(i, (i + 1) % 9)
+    coloring = Coloring(graph, 2)
+    coloring.randomize()
+
+    sa = SimulatedAnnealing(
+        graph=graph,
+        coloring_state=coloring,
+        max_iteration=10 ** 9,
+        initial_temp=1.0,
+        cooling_rate=1.0,
+        time_limit=0.05
+    )
+    sa.run()
+    stats = sa.stats()
+
+    assert stats.timed_out
+    assert stats.iterations % SimulatedAnnealing.CLOCK_CHECK_INTERVAL == 0
+    assert stats.accepted_moves + stats.rejected_moves == stats.iterations
+    assert stats.iterations_per_sec > 0
+    assert 0 <= stats.time_to_best <= stats.elapsed
+    assert stats.best_conflicts == 1
+
+
+def test_sa_history_can_be_downsampled_or_disabled():
+    random.seed(14)
+    graph = create_triangle_graph()
+
+    coloring = Coloring(graph, 2)
+    coloring.randomize()
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=100, initial_temp=10.0,
+                            cooling_rate=0.99, history=HistoryRecorder("ring", capacity=10))
+    sa.run()
+
+    assert len(sa.conflicts_history) == 10
+    assert sa.temperature_history.tolist() == sorted(sa.temperature_history.tolist(), reverse=True)
+
+    coloring = Coloring(graph, 2)
+    coloring.randomize()
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=100, initial_temp=10.0,
+                            cooling_rate=0.99, record_history=False)
+    sa.run()
+
+    assert sa.history is None
+    assert len(sa.conflicts_history) == 0
+
+
+def test_instrumentation_reports_phases_and_moves():
+    random.seed(3)
+    graph = create_triangle_graph()
+    coloring = Coloring(graph, 2)
+    coloring.randomize()
+
+    instrumentation = SolverInstrumentation(profile=True)
+    sa = SimulatedAnnealing(graph, coloring, max_iteration=500, initial_temp=1.0,
+                            cooling_rate=0.99, instrumentation=instrumentation)
+    sa.run()
+    report = sa.instrumentation_report()
+
+    assert report.steps == sa.iteration + 1
+    assert report.phase_calls["history"] == report.steps
+    assert report.phase_calls["propose"] == sa.iteration
+    moves = report.improving_moves + report.sideways_accepted + report.sideways_rejected \
+        + report.uphill_accepted + report.uphill_rejected
+    assert moves == sa.accepted_moves + sa.rejected_moves
+    assert report.improving_moves + report.sideways_accepted + report.uphill_accepted == sa.accepted_moves
+    assert report.profile and "step" in report.profile
+    assert "evaluate" in report.format()
+
+    # the wrappers are gone once the run has finished; the coloring was never wrapped
+    assert not {"step", "run", "_propose_move", "_apply_move"} & set(vars(sa))
+    assert sa._record == sa.history.record
+    assert "set_color" not in vars(coloring) and "delta_if_recolored" not in vars(coloring)
+    assert sa.instrumentation_report().steps == report.steps
+
+
+def test_solver_without_instrumentation_keeps_plain_methods():
+    graph = create_triangle_graph()
+    sa = SimulatedAnnealing(graph, Coloring(graph, 3), max_iteration=10, initial_temp=1.0, cooling_rate=0.9)
+
+    assert "step" not in vars(sa)
+    assert sa.instrumentation_report() is None
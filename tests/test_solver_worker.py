@@ -0,0 +1,59 @@
+import random
+
+from algorithms.simulated_annealing import SimulatedAnnealing
+from gui.solver_worker import BackgroundSolver, SolverFinished, SolverProgress
+from models.coloring_state import Coloring
+from models.generators import gnp_graph
+
+
+def create_solver(max_iteration: int) -> SimulatedAnnealing:
+    random.seed(0)
+    # too dense for 3 colors: the run never finds a solution on its own
+    graph = gnp_graph(100, 0.3, seed=1)
+    coloring = Coloring(graph, 3)
+    coloring.randomize()
+    return SimulatedAnnealing(graph, coloring, max_iteration=max_iteration, initial_temp=1.0,
+                              cooling_rate=1.0, record_history=False)
+
+
+def drain(solver: BackgroundSolver) -> list:
+    messages = []
+    while not messages or not isinstance(messages[-1], SolverFinished):
+        messages.append(solver.messages.get(timeout=10))
+    return messages
+
+
+def test_background_solver_reports_progress_and_result():
+    sa = create_solver(max_iteration=5000)
+    solver = BackgroundSolver(sa, progress_interval=0.0)
+    solver.start()
+
+    messages = drain(solver)
+    solver.join()
+
+    finished = messages[-1]
+    assert not finished.stopped and finished.error is None
+    assert finished.iteration == 5000
+    assert finished.best_state is sa.best_state
+    progress = [message for message in messages if isinstance(message, SolverProgress)]
+    assert progress
+    # snapshots are copies, not views of the coloring the worker keeps changing
+    assert len(progress[0].colors) == 100
+    assert progress[0].colors is not progress[-1].colors
+
+
+def test_background_solver_stops_on_request():
+    sa = create_solver(max_iteration=10 ** 9)
+    solver = BackgroundSolver(sa)
+    solver.start()
+    solver.stop()
+
+    finished = drain(solver)[-1]
+    solver.join(timeout=10)
+
+    assert finished.stopped
+    assert finished.iteration < 10 ** 9
+    assert not solver.is_running
+    # the solver's clock stopped with it
+    elapsed = sa.stats().elapsed
+    assert sa.stats().elapsed == elapsed
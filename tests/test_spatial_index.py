@@ -0,0 +1,42 @@
+import random
+
+from gui.spatial_index import GridIndex
+
+
+def brute_force_nearest(points, x, y, radius):
+    candidates = [
+        ((px - x) ** 2 + (py - y) ** 2, item)
+        for item, (px, py) in points.items()
+        if (px - x) ** 2 + (py - y) ** 2 <= radius ** 2
+    ]
+    return min(candidates)[1] if candidates else None
+
+
+def test_queries_match_brute_force():
+    rng = random.Random(0)
+    points = {i: (rng.uniform(-500, 500), rng.uniform(-500, 500)) for i in range(2000)}
+    index = GridIndex.from_points(points, cell_size=25)
+
+    for _ in range(200):
+        x, y = rng.uniform(-550, 550), rng.uniform(-550, 550)
+        assert index.nearest_within(x, y, 30) == brute_force_nearest(points, x, y, 30)
+
+    inside = index.query_rect(-100, -50, 120, 80)
+    assert sorted(inside) == sorted(
+        item for item, (px, py) in points.items() if -100 <= px <= 120 and -50 <= py <= 80
+    )
+    assert len(index.query_rect(-1e9, -1e9, 1e9, 1e9)) == 2000
+
+
+def test_insert_moves_and_remove_drops_points():
+    index = GridIndex(cell_size=10)
+    index.insert(1, 5, 5)
+    index.insert(2, 50, 50)
+    index.insert(1, 100, 100)
+
+    assert index.nearest_within(5, 5, 20) is None
+    assert index.nearest_within(98, 98, 5) == 1
+
+    index.remove(2)
+    assert len(index) == 1
+    assert index.query_rect(0, 0, 60, 60) == []
@@ -0,0 +1,34 @@
+import pytest
+
+from gui.viewport import Viewport, detail_level
+
+
+def test_zoom_keeps_the_point_under_the_cursor():
+    viewport = Viewport()
+    viewport.pan(30, -10)
+    before = viewport.to_world(200, 150)
+
+    viewport.zoom_at(2.0, 200, 150)
+
+    assert viewport.scale == 2.0
+    assert viewport.to_world(200, 150) == pytest.approx(before)
+    assert viewport.to_screen(*viewport.to_world(17, 23)) == pytest.approx((17, 23))
+
+
+def test_fit_shows_all_points():
+    viewport = Viewport()
+    points = [(0, 0), (4000, 1000), (2000, 3000)]
+    viewport.fit(points, 600, 400, padding=20)
+
+    x0, y0, x1, y1 = viewport.visible_rect(600, 400)
+    assert all(x0 <= x <= x1 and y0 <= y <= y1 for x, y in points)
+    assert viewport.scale < 1
+
+
+def test_detail_level_drops_labels_and_thins_edges_when_zoomed_out():
+    close = detail_level(1.0, visible_vertices=20, visible_edges=40)
+    far = detail_level(0.05, visible_vertices=5000, visible_edges=100000)
+
+    assert close.show_labels and close.edge_width == 2 and close.edge_stride == 1
+    assert not far.show_labels and far.edge_width == 1 and far.edge_stride == 5
+    assert far.vertex_radius == 2.0
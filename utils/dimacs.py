@@ -0,0 +1,158 @@
+import gzip
+import io
+import re
+from array import array
+from typing import BinaryIO
+
+from models.coloring_state import Coloring
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+
+# DIMACS .col format, vertices numbered from 1:
+#   c <comment>
+#   p edge <vertices> <edges>      ("p col" is accepted too)
+#   e <u> <v>
+#
+# colorings are written in the DIMACS solution format:
+#   s col <number of colors>       (highest color index + 1)
+#   l <vertex> <color>             (colors numbered from 1)
+
+CHUNK_SIZE = 1 << 22
+GZIP_MAGIC = b"\x1f\x8b"
+# start of any line that is neither an edge line nor blank (leading blanks allowed)
+_NON_EDGE_LINE = re.compile(rb"^[ \t]*[^e\s]", re.MULTILINE)
+
+
+def _open_binary(path: str, mode: str) -> BinaryIO:
+    if mode == "rb":
+        with open(path, "rb") as f:
+            is_gzip = f.read(2) == GZIP_MAGIC
+    else:
+        is_gzip = path.endswith(".gz")
+    if is_gzip:
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def _read_lines_in_chunks(f: BinaryIO):
+    # yields blocks of whole lines, so callers can split many lines at once
+    remainder = b""
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        chunk = remainder + chunk
+        cut = chunk.rfind(b"\n") + 1
+        if cut == 0:
+            remainder = chunk
+            continue
+        remainder = chunk[cut:]
+        yield chunk[:cut]
+    if remainder:
+        yield remainder
+
+
+def read_dimacs(path: str) -> CSRGraph:
+    vertex_count = None
+    sources = array("i")
+    targets = array("i")
+
+    with _open_binary(path, "rb") as f:
+        for block in _read_lines_in_chunks(f):
+            # runs of edge lines are parsed in bulk; only the lines in between
+            # (comments, the problem line, ...) are handled one at a time
+            position = 0
+            while position < len(block):
+                match = _NON_EDGE_LINE.search(block, position)
+                end = len(block) if match is None else match.start()
+                edge_lines = block[position:end]
+                if edge_lines.strip():
+                    if vertex_count is None:
+                        raise ValueError("Edge line found before the problem line.")
+                    _parse_edge_lines(edge_lines, sources, targets)
+                if match is None:
+                    break
+
+                line_end = block.find(b"\n", end)
+                if line_end == -1:
+                    line_end = len(block)
+                fields = block[end:line_end].split()
+                if fields[0] == b"p":
+                    if len(fields) < 3 or fields[1] not in (b"edge", b"col"):
+                        raise ValueError(f"Malformed problem line: {b' '.join(fields).decode(errors='replace')!r}")
+                    vertex_count = int(fields[2])
+                # other line types ("c", "n", "x", ...) carry nothing we use
+                position = line_end + 1
+
+    if vertex_count is None:
+        raise ValueError("Missing problem line ('p edge <vertices> <edges>').")
+    return CSRGraph.from_edge_arrays(vertex_count, sources, targets)
+
+
+def _parse_edge_lines(edge_lines: bytes, sources: array, targets: array) -> None:
+    tokens = edge_lines.split()
+    if len(tokens) % 3 == 0 and tokens[0::3].count(b"e") == len(tokens) // 3:
+        sources.extend([int(token) - 1 for token in tokens[1::3]])
+        targets.extend([int(token) - 1 for token in tokens[2::3]])
+        return
+
+    # some line has extra or missing fields: fall back to one line at a time
+    for line in edge_lines.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        if fields[0] != b"e" or len(fields) < 3:
+            raise ValueError(f"Malformed edge line: {line.decode(errors='replace')!r}")
+        sources.append(int(fields[1]) - 1)
+        targets.append(int(fields[2]) - 1)
+
+
+def write_dimacs(path: str, graph: Graph | CSRGraph, comment: str | None = None) -> None:
+    edges = _iter_edges(graph)
+    edge_count = graph.edge_count if isinstance(graph, CSRGraph) else \
+        sum(len(graph.neighbors(v)) for v in range(graph.vertex_count)) // 2
+
+    with _open_binary(path, "wb") as raw, io.TextIOWrapper(raw, encoding="ascii") as f:
+        if comment:
+            for line in comment.splitlines():
+                f.write(f"c {line}\n")
+        f.write(f"p edge {graph.vertex_count} {edge_count}\n")
+        f.writelines(f"e {u + 1} {v + 1}\n" for u, v in edges)
+
+
+def write_coloring(path: str, coloring: Coloring, comment: str | None = None) -> None:
+    colors = coloring.get_colors()
+    with _open_binary(path, "wb") as raw, io.TextIOWrapper(raw, encoding="ascii") as f:
+        if comment:
+            for line in comment.splitlines():
+                f.write(f"c {line}\n")
+        f.write(f"c conflicts {coloring.num_conflicts}\n")
+        f.write(f"s col {max(colors, default=-1) + 1}\n")
+        f.writelines(f"l {v + 1} {color + 1}\n" for v, color in enumerate(colors))
+
+
+def read_coloring(path: str, graph: Graph | CSRGraph, num_colors: int | None = None) -> Coloring:
+    colors = [0] * graph.vertex_count
+    with _open_binary(path, "rb") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) >= 3 and fields[0] == b"l":
+                vertex = int(fields[1]) - 1
+                if not (0 <= vertex < graph.vertex_count):
+                    raise ValueError(f"Vertex {vertex + 1} is not in the graph.")
+                colors[vertex] = int(fields[2]) - 1
+
+    coloring = Coloring(graph, num_colors or max(colors, default=0) + 1)
+    coloring.set_colors(colors)
+    return coloring
+
+
+def _iter_edges(graph: Graph | CSRGraph):
+    if isinstance(graph, CSRGraph):
+        return graph.edges()
+    return (
+        (v, n)
+        for v in range(graph.vertex_count)
+        for n in graph.neighbors(v)
+        if v < n
+    )
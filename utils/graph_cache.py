@@ -0,0 +1,146 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from models.csr_graph import CSRGraph
+from models.graph import Graph
+from utils.dimacs import read_dimacs
+
+# binary CSR file, little-endian:
+#   header   magic "GCSR", format version, vertex count, neighbor entry count,
+#            32-byte digest of the text file it was built from (zeros if none)
+#   offsets  int64 * (vertex count + 1)
+#   neighbors int32 * neighbor entry count
+MAGIC = b"GCSR"
+VERSION = 1
+HEADER = struct.Struct("<4sIQQ32s")
+CACHE_SUFFIX = ".gcsr"
+
+
+class MappedCSRGraph(CSRGraph):
+    # CSRGraph whose arrays live in a read-only memory-mapped file; pickling
+    # sends the path, so worker processes map the same file instead of copying
+
+    def __init__(self, offsets, neighbors, path: str) -> None:
+        super().__init__(offsets, neighbors)
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __reduce__(self):
+        return load_csr, (self._path,)
+
+
+def save_csr(path: str, graph: Graph | CSRGraph, source_digest: bytes = b"") -> None:
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph(graph)
+
+    offsets = graph.offsets.cast("B")
+    neighbors = graph.neighbor_array.cast("B")
+    if sys.byteorder != "little":
+        offsets = _swapped(graph.offsets, "q")
+        neighbors = _swapped(graph.neighbor_array, "i")
+
+    header = HEADER.pack(MAGIC, VERSION, graph.vertex_count, len(graph.neighbor_array),
+                         source_digest.ljust(32, b"\0")[:32])
+
+    # write to a temporary file and rename, so readers never see a partial file
+    temp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(header)
+            f.write(offsets)
+            f.write(neighbors)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def read_header(path: str) -> tuple[int, int, bytes]:
+    with open(path, "rb") as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is too short to be a graph cache file.")
+
+    magic, version, vertex_count, neighbor_count, source_digest = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a graph cache file.")
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported format version {version}.")
+    return vertex_count, neighbor_count, source_digest
+
+
+def load_csr(path: str, use_mmap: bool = True) -> CSRGraph:
+    vertex_count, neighbor_count, _ = read_header(path)
+    offsets_size = 8 * (vertex_count + 1)
+    expected_size = HEADER.size + offsets_size + 4 * neighbor_count
+    if os.path.getsize(path) != expected_size:
+        raise ValueError(f"{path} is truncated or corrupt.")
+
+    if not use_mmap or sys.byteorder != "little":
+        with open(path, "rb") as f:
+            f.seek(HEADER.size)
+            offsets = array("q")
+            offsets.frombytes(f.read(offsets_size))
+            neighbors = array("i")
+            neighbors.frombytes(f.read(4 * neighbor_count))
+        if sys.byteorder != "little":
+            offsets.byteswap()
+            neighbors.byteswap()
+        return CSRGraph(offsets, neighbors)
+
+    with open(path, "rb") as f:
+        # the mapping stays alive as long as the graph's views reference it
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    offsets = view[HEADER.size:HEADER.size + offsets_size].cast("q")
+    neighbors = view[HEADER.size + offsets_size:].cast("i")
+    return MappedCSRGraph(offsets, neighbors, path)
+
+
+def file_digest(path: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def load_dimacs_cached(path: str, cache_dir: str | None = None) -> CSRGraph:
+    # parses the DIMACS file only when no cache file matches its content digest
+    digest = file_digest(path)
+    cache_dir = cache_dir or os.path.dirname(os.path.abspath(path))
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_path = os.path.join(cache_dir, f"{os.path.basename(path)}.{digest.hex()[:16]}{CACHE_SUFFIX}")
+
+    if os.path.exists(cache_path):
+        try:
+            if read_header(cache_path)[2] == digest:
+                return load_csr(cache_path)
+        except ValueError:
+            pass  # unreadable cache file: rebuild it below
+
+    save_csr(cache_path, read_dimacs(path), source_digest=digest)
+    return load_csr(cache_path)
+
+
+def load_graph(path: str, use_cache: bool = False) -> CSRGraph:
+    # a cache file, or a DIMACS file that is parsed (or loaded from its cache)
+    if path.endswith(CACHE_SUFFIX):
+        return load_csr(path)
+    if use_cache:
+        return load_dimacs_cached(path)
+    return read_dimacs(path)
+
+
+def _swapped(view: memoryview, typecode: str) -> bytes:
+    values = array(typecode)
+    values.frombytes(view.cast("B"))
+    values.byteswap()
+    return values.tobytes()
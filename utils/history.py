@@ -0,0 +1,181 @@
+from array import array
+
+
+class HistoryRecorder:
+    # compact (temperature, conflicts) history backed by typed arrays.
+    #
+    # modes:
+    #   "full"      keep every sample
+    #   "ring"      keep only the last `capacity` samples
+    #   "every_nth" keep one sample every `stride`
+    #   "minmax"    keep the min- and max-conflict samples of every bucket of `stride`
+    #
+    # with a `capacity`, "every_nth" and "minmax" stay bounded by doubling their
+    # stride (and halving what they hold) whenever they fill up.
+    #
+    # the temperatures / conflicts / iterations views are read-only memoryviews
+    # over the internal buffers (no copy); they reflect the samples kept at the
+    # time they were taken and should be re-read after further recording.
+
+    MODES = ("full", "ring", "every_nth", "minmax")
+
+    def __init__(self, mode: str = "full", capacity: int | None = None, stride: int = 1):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown history mode: {mode}.")
+        if stride < 1:
+            raise ValueError("Stride must be >= 1.")
+        if mode == "ring" and (capacity is None or capacity < 1):
+            raise ValueError("Ring mode needs a capacity >= 1.")
+        if mode == "every_nth" and capacity is not None and capacity < 2:
+            raise ValueError("Every-nth capacity must be >= 2.")
+        if mode == "minmax" and capacity is not None and (capacity < 4 or capacity % 4):
+            raise ValueError("Min/max capacity must be a multiple of 4.")
+
+        self._mode = mode
+        self._capacity = capacity
+        self._stride = stride
+        self.clear()
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @property
+    def samples_recorded(self) -> int:
+        return self._count
+
+    @property
+    def temperatures(self) -> memoryview:
+        return memoryview(self._temperatures)[self._start:self._size + self._pending].toreadonly()
+
+    @property
+    def conflicts(self) -> memoryview:
+        return memoryview(self._conflicts)[self._start:self._size + self._pending].toreadonly()
+
+    @property
+    def iterations(self) -> memoryview:
+        return memoryview(self._iterations)[self._start:self._size + self._pending].toreadonly()
+
+    def __len__(self) -> int:
+        return self._size + self._pending - self._start
+
+    def clear(self) -> None:
+        self._count = 0
+        self._size = 0
+        self._start = 0
+        self._pending = 0
+        self._bucket_length = 0
+        self._bucket_min: tuple[int, float, int] | None = None
+        self._bucket_max: tuple[int, float, int] | None = None
+
+        if self._mode == "ring":
+            length = 2 * self._capacity
+        else:
+            length = self._capacity or 1024
+        self._temperatures = array("d", bytes(8 * length))
+        self._conflicts = array("q", bytes(8 * length))
+        self._iterations = array("q", bytes(8 * length))
+
+    def record(self, temperature: float, conflicts: int) -> None:
+        iteration = self._count
+        self._count += 1
+
+        mode = self._mode
+        if mode == "full":
+            self._append(iteration, temperature, conflicts)
+        elif mode == "ring":
+            self._record_ring(iteration, temperature, conflicts)
+        elif mode == "every_nth":
+            if iteration % self._stride == 0:
+                self._append(iteration, temperature, conflicts)
+                if self._capacity is not None and self._size >= self._capacity:
+                    self._decimate()
+        else:
+            self._record_minmax(iteration, temperature, conflicts)
+
+    def _append(self, iteration: int, temperature: float, conflicts: int) -> None:
+        if self._size + self._pending >= len(self._temperatures):
+            self._grow()
+        self._write(self._size, iteration, temperature, conflicts)
+        self._size += 1
+
+    def _write(self, index: int, iteration: int, temperature: float, conflicts: int) -> None:
+        self._iterations[index] = iteration
+        self._temperatures[index] = temperature
+        self._conflicts[index] = conflicts
+
+    def _grow(self) -> None:
+        # allocate new buffers instead of resizing in place, so views handed out
+        # earlier stay valid (they keep pointing at the old buffers)
+        used = self._size + self._pending
+        length = 2 * len(self._temperatures)
+        for name, typecode in (("_temperatures", "d"), ("_conflicts", "q"), ("_iterations", "q")):
+            old = getattr(self, name)
+            new = array(typecode, bytes(8 * length))
+            new[:used] = old[:used]
+            setattr(self, name, new)
+
+    def _record_ring(self, iteration: int, temperature: float, conflicts: int) -> None:
+        capacity = self._capacity
+        if self._size == len(self._temperatures):
+            # move the newest capacity - 1 samples to the front; amortized O(1)
+            keep = capacity - 1
+            first = self._size - keep
+            for buffer in (self._temperatures, self._conflicts, self._iterations):
+                buffer[:keep] = buffer[first:self._size]
+            self._size = keep
+        self._write(self._size, iteration, temperature, conflicts)
+        self._size += 1
+        self._start = max(0, self._size - capacity)
+
+    def _decimate(self) -> None:
+        kept = (self._size + 1) // 2
+        for buffer in (self._temperatures, self._conflicts, self._iterations):
+            buffer[:kept] = buffer[:self._size:2]
+        self._size = kept
+        self._stride *= 2
+
+    def _record_minmax(self, iteration: int, temperature: float, conflicts: int) -> None:
+        sample = (iteration, temperature, conflicts)
+        if self._bucket_min is None or conflicts < self._bucket_min[2]:
+            self._bucket_min = sample
+        if self._bucket_max is None or conflicts > self._bucket_max[2]:
+            self._bucket_max = sample
+        self._bucket_length += 1
+
+        # every bucket is stored as two points (min and max, in iteration order);
+        # the open bucket is kept as provisional points past the committed ones
+        if self._size + 2 > len(self._temperatures):
+            self._grow()
+        first, second = sorted((self._bucket_min, self._bucket_max))
+        self._write(self._size, *first)
+        self._write(self._size + 1, *second)
+        self._pending = 2
+
+        if self._bucket_length == self._stride:
+            self._size += 2
+            self._pending = 0
+            self._bucket_length = 0
+            self._bucket_min = None
+            self._bucket_max = None
+            if self._capacity is not None and self._size >= self._capacity:
+                self._merge_buckets()
+
+    def _merge_buckets(self) -> None:
+        iterations, temperatures, conflicts = self._iterations, self._temperatures, self._conflicts
+        merged = 0
+        for start in range(0, self._size, 4):
+            points = [(iterations[i], temperatures[i], conflicts[i]) for i in range(start, start + 4)]
+            low = min(points, key=lambda point: point[2])
+            high = max(points, key=lambda point: point[2])
+            first, second = sorted((low, high))
+            self._write(merged, *first)
+            self._write(merged + 1, *second)
+            merged += 2
+        self._size = merged
+        self._stride *= 2
+
@@ -0,0 +1,209 @@
+import cProfile
+import io
+import pstats
+import time
+from dataclasses import dataclass, field
+
+# phases of SimulatedAnnealing.step, in the order they happen
+PHASES = ("history", "propose", "evaluate", "accept", "apply", "best_copy", "cooling")
+
+
+@dataclass
+class InstrumentationReport:
+    steps: int
+    step_seconds: float
+    # per phase: total seconds and number of calls; "other" is the step time
+    # not spent in any phase (the loop itself, stop checks, bookkeeping)
+    phase_seconds: dict[str, float]
+    phase_calls: dict[str, int]
+    improving_moves: int
+    sideways_accepted: int
+    sideways_rejected: int
+    uphill_accepted: int
+    uphill_rejected: int
+    steps_without_move: int
+    # top functions by cumulative time, when profiling was enabled
+    profile: str | None = None
+    acceptance_rate: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        moves = self.improving_moves + self.sideways_accepted + self.sideways_rejected \
+            + self.uphill_accepted + self.uphill_rejected
+        accepted = self.improving_moves + self.sideways_accepted + self.uphill_accepted
+        self.acceptance_rate = accepted / moves if moves else 0.0
+
+    def format(self) -> str:
+        lines = [f"{self.steps} steps in {self.step_seconds:.3f}s "
+                 f"(acceptance rate {self.acceptance_rate:.1%})"]
+        for phase, seconds in sorted(self.phase_seconds.items(), key=lambda item: -item[1]):
+            share = seconds / self.step_seconds if self.step_seconds > 0 else 0.0
+            calls = self.phase_calls.get(phase)
+            calls_text = "" if calls is None else f" {calls:>10} calls"
+            lines.append(f"  {phase:10} {seconds:8.3f}s {share:6.1%}{calls_text}")
+        lines.append(
+            f"  moves: improving={self.improving_moves} "
+            f"sideways={self.sideways_accepted}/{self.sideways_accepted + self.sideways_rejected} "
+            f"uphill={self.uphill_accepted}/{self.uphill_accepted + self.uphill_rejected} "
+            f"no move={self.steps_without_move}"
+        )
+        if self.profile:
+            lines.append(self.profile)
+        return "\n".join(lines)
+
+
+class SolverInstrumentation:
+    # opt-in timing of SimulatedAnnealing: attach() shadows the solver's step
+    # and phase hooks (_propose_move, _evaluate_move, _apply_move, ...) on that
+    # one instance with timed wrappers, so solvers without instrumentation run
+    # the untouched code. detach() removes the wrappers again; the solver calls
+    # it when its run finishes. The coloring itself is never wrapped.
+    #
+    # with profile=True, run() additionally runs under cProfile.
+
+    def __init__(self, profile: bool = False, profile_limit: int = 20):
+        self._profile_enabled = profile
+        self._profile_limit = profile_limit
+        self._profiler: cProfile.Profile | None = None
+        self._solver = None
+        self._originals: dict[str, object] = {}
+        self.clear()
+
+    def clear(self) -> None:
+        self._seconds = dict.fromkeys(PHASES, 0.0)
+        self._calls = dict.fromkeys(PHASES, 0)
+        self._steps = 0
+        self._step_seconds = 0.0
+        self._sideways = [0, 0]  # rejected, accepted
+        self._uphill = [0, 0]
+        self._steps_without_move = 0
+        self._accepted_before = self._solver.accepted_moves if self._solver is not None else 0
+
+    def attach(self, sa) -> None:
+        self.detach()
+        self._solver = sa
+        self._accepted_before = sa.accepted_moves
+
+        wrappers = {
+            "_propose_move": self._timed_propose(sa._propose_move),
+            "_evaluate_move": self._timed("evaluate", sa._evaluate_move),
+            "_take_risk": self._timed_take_risk(sa._take_risk),
+            "_apply_move": self._timed("apply", sa._apply_move),
+            "_record_best": self._timed("best_copy", sa._record_best),
+            "_calculate_temp": self._timed("cooling", sa._calculate_temp),
+            "step": self._timed_step(sa.step),
+        }
+        if sa._record is not None:
+            wrappers["_record"] = self._timed("history", sa._record)
+        if self._profile_enabled:
+            wrappers["run"] = self._profiled_run(sa.run)
+
+        instance_attributes = vars(sa)
+        for name, wrapper in wrappers.items():
+            # _record is an instance attribute; the others are class methods,
+            # which are uncovered again by deleting the wrapper
+            self._originals[name] = instance_attributes.get(name)
+            setattr(sa, name, wrapper)
+
+    def detach(self) -> None:
+        # keeps the collected numbers, so report() still works afterwards
+        sa = self._solver
+        if sa is None or not self._originals:
+            return
+        for name, original in self._originals.items():
+            if original is None:
+                delattr(sa, name)
+            else:
+                setattr(sa, name, original)
+        self._originals = {}
+
+    def report(self) -> InstrumentationReport:
+        phase_seconds = dict(self._seconds)
+        phase_seconds["other"] = max(0.0, self._step_seconds - sum(self._seconds.values()))
+
+        uphill_accepted = self._uphill[1]
+        sideways_accepted = self._sideways[1]
+        improving = 0
+        if self._solver is not None:
+            accepted = self._solver.accepted_moves - self._accepted_before
+            improving = accepted - uphill_accepted - sideways_accepted
+
+        profile = None
+        if self._profiler is not None:
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(self._profile_limit)
+            profile = out.getvalue()
+
+        return InstrumentationReport(
+            steps=self._steps,
+            step_seconds=self._step_seconds,
+            phase_seconds=phase_seconds,
+            phase_calls=dict(self._calls),
+            improving_moves=improving,
+            sideways_accepted=sideways_accepted,
+            sideways_rejected=self._sideways[0],
+            uphill_accepted=uphill_accepted,
+            uphill_rejected=self._uphill[0],
+            steps_without_move=self._steps_without_move,
+            profile=profile
+        )
+
+    def _timed(self, phase: str, func):
+        seconds = self._seconds
+        calls = self._calls
+        clock = time.perf_counter
+
+        def timed(*args):
+            started = clock()
+            result = func(*args)
+            seconds[phase] += clock() - started
+            calls[phase] += 1
+            return result
+
+        return timed
+
+    def _timed_step(self, step):
+        clock = time.perf_counter
+
+        def timed_step():
+            started = clock()
+            done = step()
+            self._step_seconds += clock() - started
+            self._steps += 1
+            return done
+
+        return timed_step
+
+    def _timed_propose(self, propose_move):
+        timed = self._timed("propose", propose_move)
+
+        def timed_propose(coloring_state):
+            move = timed(coloring_state)
+            if move is None:
+                self._steps_without_move += 1
+            return move
+
+        return timed_propose
+
+    def _timed_take_risk(self, take_risk):
+        # only non-improving moves reach the acceptance test
+        timed = self._timed("accept", take_risk)
+
+        def timed_take_risk(conflict_delta, temp):
+            accepted = timed(conflict_delta, temp)
+            counts = self._sideways if conflict_delta == 0 else self._uphill
+            counts[accepted] += 1
+            return accepted
+
+        return timed_take_risk
+
+    def _profiled_run(self, run):
+        def profiled_run(*args, **kwargs):
+            if self._profiler is None:
+                self._profiler = cProfile.Profile()
+            self._profiler.enable()
+            try:
+                return run(*args, **kwargs)
+            finally:
+                self._profiler.disable()
+
+        return profiled_run